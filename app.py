@@ -3,16 +3,35 @@
 import os
 import sys
 import hashlib
+import json
 import streamlit as st
 from ui.state import init_state
 from ui.components.soil_editor import render_soil_editor, clear_soil_editor_keys
 from ui.components.foundation_form import render_foundation_form
 from ui.components.loads_form import render_loads_form
 from ui.components.coefficients_form import render_coefficients_form
-from ui.components.results_view import render_results
 from ui.utils import build_models, export_toml, import_toml
 from core.calculator import calculate
 
+# results_view (pandas и Plotly) импортируется лениво: до первого расчёта он не нужен.
+# Numba и ядра core.kernels подгружаются при первом построении кэша разреза.
+
+
+def export_toml_cached(state: dict) -> str:
+    """TOML для экспорта; пересобирается только при изменении state.
+
+    Сериализация выполняется на каждом rerun (любое действие с виджетом),
+    поэтому результат кэшируется в session_state по отпечатку state.
+    """
+    key = hashlib.blake2b(
+        json.dumps(state, sort_keys=True, default=str).encode(), digest_size=16
+    ).digest()
+    cached = st.session_state.get("_toml_cache")
+    if cached is None or cached[0] != key:
+        cached = (key, export_toml(state))
+        st.session_state._toml_cache = cached
+    return cached[1]
+
 
 def render_sidebar():
     """Боковая панель с настройками."""
@@ -26,7 +45,9 @@ def render_sidebar():
         format_func=lambda x: "Российская (СП)" if x == "russian" else "Западная (SNAME/ISO)",
         index=0 if st.session_state.method == "russian" else 1,
     )
-    st.session_state.method = method
+    # Записываем в session_state только изменившиеся значения
+    if st.session_state.method != method:
+        st.session_state.method = method
 
     st.divider()
 
@@ -40,14 +61,16 @@ def render_sidebar():
         index=0 if st.session_state.get("plot_theme", "dark") == "dark" else 1,
         help="Тёмная тема подходит для экрана, светлая — для печати и отчётов",
     )
-    st.session_state.plot_theme = plot_theme
+    if st.session_state.get("plot_theme") != plot_theme:
+        st.session_state.plot_theme = plot_theme
 
     st.divider()
 
     # Параметры расчёта
     st.subheader("Параметры расчёта")
 
-    calc_params = st.session_state.calc_params
+    # Локальная копия: сравнение со state имеет смысл, только если state не мутирован
+    calc_params = dict(st.session_state.calc_params)
     calc_params["d_max"] = st.number_input(
         "d_max, м",
         min_value=5.0,
@@ -63,7 +86,7 @@ def render_sidebar():
         step=0.05,
     )
 
-    if st.session_state.method == "russian":
+    if method == "russian":
         st.subheader("Распределение напряжений (σz)")
         calc_params["stress_distribution"] = st.radio(
             "Модель σz под подошвой",
@@ -73,7 +96,8 @@ def render_sidebar():
             help="Влияет на расчёт Hc и осадок (только российская методика).",
         )
 
-    st.session_state.calc_params = calc_params
+    if st.session_state.calc_params != calc_params:
+        st.session_state.calc_params = calc_params
 
     st.divider()
 
@@ -109,7 +133,7 @@ def render_sidebar():
                 st.error(f"❌ Ошибка загрузки TOML: {e}")
 
     # Экспорт
-    toml_content = export_toml({
+    toml_content = export_toml_cached({
         "method": st.session_state.method,
         "layers": st.session_state.layers,
         "foundation": st.session_state.foundation,
@@ -126,27 +150,42 @@ def render_sidebar():
     )
 
 
+@st.cache_data(show_spinner=False)
+def _cached_calculate(params_json: str):
+    """Расчёт по сериализованным входным данным.
+
+    Ключ кэша — JSON входных данных: повторное нажатие «Рассчитать» без
+    изменений (или rerun после него) возвращает готовый CalculationResult.
+    """
+    params = json.loads(params_json)
+    layers, foundation, coef = build_models(params)
+    return calculate(
+        layers=layers,
+        foundation=foundation,
+        coef=coef,
+        F_operation=params["loads"]["operation"],
+        F_preload=params["loads"]["preload"],
+        d_max=params["calc_params"]["d_max"],
+        d_step=params["calc_params"]["d_step"],
+        method=params["method"],
+        stress_distribution=params["calc_params"].get("stress_distribution", "alpha"),
+    )
+
+
 def run_calculation():
     """Запуск расчёта."""
 
     try:
-        layers, foundation, coef = build_models({
+        params_json = json.dumps({
             "layers": st.session_state.layers,
             "foundation": st.session_state.foundation,
             "coefficients": st.session_state.coefficients,
-        })
-
-        result = calculate(
-            layers=layers,
-            foundation=foundation,
-            coef=coef,
-            F_operation=st.session_state.loads["operation"],
-            F_preload=st.session_state.loads["preload"],
-            d_max=st.session_state.calc_params["d_max"],
-            d_step=st.session_state.calc_params["d_step"],
-            method=st.session_state.method,
-            stress_distribution=st.session_state.calc_params.get("stress_distribution", "alpha"),
-        )
+            "loads": st.session_state.loads,
+            "calc_params": st.session_state.calc_params,
+            "method": st.session_state.method,
+        }, sort_keys=True, default=str)
+
+        result = _cached_calculate(params_json)
 
         st.session_state.result = result
         st.success("Расчёт выполнен!")
@@ -187,6 +226,8 @@ def main():
         run_calculation()
 
     if st.session_state.get("result"):
+        from ui.components.results_view import render_results
+
         render_results()
 
 
@@ -3,6 +3,7 @@
 from typing import Literal
 
 from core import russian, western
+from core.helpers import build_profile_cache, depth_grid
 from core.models import CalculationResult, Coefficients, Foundation, SoilLayer
 
 
@@ -34,16 +35,22 @@ def calculate(
         CalculationResult с кривыми и глубинами равновесия.
     """
     punch_through_risk = False
-    
+    # Сетка глубин кривой — та же, что строит penetration_curve; берём её
+    # напрямую, а не перечитываем d из каждой точки кривой.
+    depths = depth_grid(d_max, d_step).tolist()
+    # Кэш разреза строится один раз и используется всеми проходами по глубине
+    cache = build_profile_cache(layers)
+
     if method == "russian":
         # Российская методика (СП 22/23/58)
-        curve = russian.penetration_curve(layers, foundation, coef, F_operation, d_max, d_step)
-        eq_operation = russian.find_equilibrium_depth(layers, foundation, coef, F_operation, d_max)
-        eq_preload = russian.find_equilibrium_depth(layers, foundation, coef, F_preload, d_max)
+        curve = russian.penetration_curve(layers, foundation, coef, F_operation, d_max, d_step, cache=cache)
+        # Обе глубины равновесия ищутся за один проход: Nu и R не зависят от нагрузки
+        eq_operation, eq_preload = russian.find_equilibrium_depths(
+            layers, foundation, coef, [F_operation, F_preload], d_max, cache=cache
+        )
 
         # Осадки s(d) — только для российской методики
         p = F_operation / foundation.area_prime
-        depths = [r.d for r in curve]
         settlements = [
             russian.settlement(
                 layers,
@@ -51,25 +58,34 @@ def calculate(
                 d,
                 p,
                 stress_distribution=stress_distribution,
+                cache=cache,
             )
             * 1000
             for d in depths
         ]
     else:
         # Западная методика (SNAME/ISO)
-        curve = western.penetration_curve(layers, foundation, coef, F_operation, d_max, d_step)
         # C.2.1: кривую обычно продолжают ниже ожидаемой пенетрации (часто ~1.5×)
         d_search = 1.5 * d_max
-        eq_operation = western.find_equilibrium_depth(layers, foundation, coef, F_operation, d_search, d_step)
-        eq_preload = western.find_equilibrium_depth(layers, foundation, coef, F_preload, d_search, d_step)
+        # Кривая до d_search для F_operation нужна и поиску равновесия, и проверке
+        # punch-through; выводимая кривая — её начало (та же сетка с тем же шагом)
+        search_curve = western.penetration_curve(
+            layers, foundation, coef, F_operation, d_search, d_step, cache=cache
+        )
+        curve = search_curve[: len(depths)]
+        eq_operation = western.find_equilibrium_depth(
+            layers, foundation, coef, F_operation, d_search, d_step, cache=cache, curve=search_curve
+        )
+        eq_preload = western.find_equilibrium_depth(
+            layers, foundation, coef, F_preload, d_search, d_step, cache=cache
+        )
 
         # Осадки не рассчитываются в западной методике
-        depths = [r.d for r in curve]
-        settlements = [0.0] * len(depths)
+        settlements = None
         
         # Проверка риска punch-through
         punch_through_risk = western.has_punch_through_risk(
-            layers, foundation, coef, F_operation, d_search, d_step
+            layers, foundation, coef, F_operation, d_search, d_step, cache=cache, curve=search_curve
         )
 
     return CalculationResult(
@@ -3,9 +3,12 @@
 Используются обеими методиками (российской и западной).
 """
 
+import math
+from functools import lru_cache
+
 import numpy as np
 
-from core.models import Foundation, SoilLayer, SoilProfileCache
+from core.models import Foundation, PointResult, SoilLayer, SoilProfileCache
 
 
 # =============================================================================
@@ -26,12 +29,51 @@ DUAL_DRAINAGE_SOIL_TYPES = frozenset({
     "silt", "sandy_silt", "silty_sand", "silty_clay",
 })
 
+# Тип грунта -> (drainage, требуется ли двойной расчёт): один поиск в словаре
+# вместо трёх проверок по множествам. Двойные грунты считаются undrained.
+_SOIL_TYPE_DRAINAGE: dict[str, tuple[str, bool]] = {
+    **{t: ("undrained", False) for t in UNDRAINED_SOIL_TYPES},
+    **{t: ("drained", False) for t in DRAINED_SOIL_TYPES},
+    **{t: ("undrained", True) for t in DUAL_DRAINAGE_SOIL_TYPES},
+}
+
+
+def depth_grid(d_max: float, d_step: float) -> np.ndarray:
+    """Сетка глубин кривой пенетрации: d_step, 2·d_step, … не глубже d_max.
+
+    Узлы — те же значения, что даёт np.arange(d_step, …, d_step): глубины на
+    границах слоёв (4.9 + 3.3 = 8.2) попадают в узел точно, а не 8.200…01,
+    и относятся к верхнему слою. Если d_max не кратна шагу, сетка обрывается
+    на последнем узле не глубже d_max; допуск 1e-9 оставляет узел d_max,
+    накопивший погрешность шага (20.000…004 при шаге 0.05).
+    """
+    depths = np.arange(d_step, d_max + d_step / 2, d_step)
+    return depths[depths <= d_max + 1e-9]
+
 
 def build_profile_cache(layers: list[SoilLayer]) -> SoilProfileCache:
     """Подготовить кэш разреза для ускорения расчётов."""
     return SoilProfileCache.from_layers(layers)
 
 
+_RESULT_FIELDS = ("d", "Nu", "R", "p", "eta1", "eta2")
+
+
+def results_to_arrays(results: list[PointResult]) -> dict[str, np.ndarray]:
+    """Кривая пенетрации по столбцам: массив NumPy на каждое поле PointResult.
+
+    Числовые поля собираются за один проход по точкам в матрицу float64,
+    имена слоёв — в массив dtype=object.
+    """
+    table = np.array(
+        [(r.d, r.Nu, r.R, r.p, r.eta1, r.eta2) for r in results], dtype=np.float64
+    ).reshape(-1, len(_RESULT_FIELDS))
+    arrays = {name: table[:, k] for k, name in enumerate(_RESULT_FIELDS)}
+    arrays["layer_name"] = np.array([r.layer_name for r in results], dtype=object)
+    return arrays
+
+
+@lru_cache(maxsize=64)
 def shape_factors(eta: float) -> tuple[float, float, float]:
     """Коэффициенты формы ξγ, ξq, ξc (СП 22.13330 п.5.7.7)."""
     eta = max(eta, 1.0)
@@ -39,15 +81,21 @@ def shape_factors(eta: float) -> tuple[float, float, float]:
 
 
 def reduced_dimensions(foundation: Foundation) -> tuple[float, float, float]:
-    """Приведённые размеры b', l' и η по СП 22 п.5.29."""
-    b_p = foundation.b_prime
-    l_p = foundation.l_prime
-    eta = max(1.0, l_p / b_p) if b_p > 0 else 1.0
-    return b_p, l_p, eta
+    """Приведённые размеры b', l' и η по СП 22 п.5.29.
 
+    Все три величины кэшируются на Foundation при первом обращении.
+    """
+    return foundation.b_prime, foundation.l_prime, foundation.eta
 
-def get_layer_at_depth(layers: list[SoilLayer], depth: float) -> SoilLayer | None:
-    """Найти слой на заданной глубине."""
+
+def get_layer_at_depth(
+    layers: list[SoilLayer],
+    depth: float,
+    cache: SoilProfileCache | None = None,
+) -> SoilLayer | None:
+    """Найти слой на заданной глубине (с кэшем — бинарным поиском по границам)."""
+    if cache is not None:
+        return cache.layer_at(depth)
     z = 0.0
     for layer in layers:
         if z <= depth <= z + layer.thickness:
@@ -72,121 +120,80 @@ def overburden_stress(
     
     sigma = 0.0
     remaining = depth
-    
+
     for layer in layers:
         if remaining <= 0:
             break
-        h = min(layer.thickness, remaining)
-        sigma += layer.gamma_prime * h
+        thickness = layer.thickness
+        gamma = layer.gamma_prime
+        h = thickness if thickness < remaining else remaining
+        sigma += gamma * h
         remaining -= h
-    
+
     # Экстраполяция за пределами скважины последним слоем
     if remaining > 0:
         sigma += layers[-1].gamma_prime * remaining
-    
+
     return sigma
 
 
 def average_props_below(
-    layers: list[SoilLayer], d: float, z_thickness: float
+    layers: list[SoilLayer],
+    d: float,
+    z_thickness: float,
+    cache: SoilProfileCache | None = None,
 ) -> tuple[float, float, float]:
     """Средневзвешенные свойства грунта ниже подошвы (II группа ПС).
     
     При выходе за пределы скважины — экстраполяция последним слоем.
     """
-    if not layers or z_thickness <= 0:
-        layer = layers[-1] if layers else None
-        if layer:
-            return (
-                layer.gamma_prime_II or layer.gamma_prime,
-                layer.phi_II or layer.phi,
-                layer.c_II or layer.c,
-            )
-        return 10.0, 20.0, 0.0
-    
-    z_start, z_end = d, d + z_thickness
-    total_h = sum_gamma = sum_phi = sum_c = 0.0
-    total_depth = sum(L.thickness for L in layers)
-
-    z = 0.0
-    for layer in layers:
-        z_top, z_bot = z, z + layer.thickness
-        z = z_bot
-
-        h = min(z_bot, z_end) - max(z_top, z_start)
-        if h <= 0:
-            continue
+    if cache is None:
+        cache = build_profile_cache(layers)
+    return cache.average_props_below(d, z_thickness)
 
-        total_h += h
-        sum_gamma += (layer.gamma_prime_II or layer.gamma_prime) * h
-        sum_phi += (layer.phi_II or layer.phi) * h
-        sum_c += (layer.c_II or layer.c) * h
 
-    # Экстраполяция за пределами скважины последним слоем
-    if z_end > total_depth:
-        last = layers[-1]
-        extra = z_end - max(total_depth, z_start)
-        if extra > 0:
-            total_h += extra
-            sum_gamma += (last.gamma_prime_II or last.gamma_prime) * extra
-            sum_phi += (last.phi_II or last.phi) * extra
-            sum_c += (last.c_II or last.c) * extra
-
-    if total_h <= 0:
-        layer = layers[-1]
-        return (
-            layer.gamma_prime_II or layer.gamma_prime,
-            layer.phi_II or layer.phi,
-            layer.c_II or layer.c,
-        )
+def average_props_below_batch(
+    layers: list[SoilLayer],
+    d: np.ndarray,
+    z_thickness: float,
+    cache: SoilProfileCache | None = None,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Векторный вариант average_props_below для массива глубин d.
 
-    return sum_gamma / total_h, sum_phi / total_h, sum_c / total_h
+    Returns:
+        (γ′II, φII, cII) — массивы той же длины, что и d.
+    """
+    if cache is None:
+        cache = build_profile_cache(layers)
+    return cache.average_props_below_batch(d, z_thickness)
 
 
 def average_gamma_below(
-    layers: list[SoilLayer], d: float, z_thickness: float
+    layers: list[SoilLayer],
+    d: float,
+    z_thickness: float,
+    cache: SoilProfileCache | None = None,
 ) -> float:
     """Средневзвешенное γ′ (I группа ПС) ниже подошвы на толщину z_thickness.
     
     При выходе за пределы скважины — экстраполяция последним слоем.
     """
-    if not layers or z_thickness <= 0:
-        return layers[-1].gamma_prime if layers else 0.0
-    
-    z_start, z_end = d, d + z_thickness
-    total_h = gamma_sum = 0.0
-    total_depth = sum(L.thickness for L in layers)
-
-    z = 0.0
-    for layer in layers:
-        z_top, z_bot = z, z + layer.thickness
-        z = z_bot
+    if cache is None:
+        cache = build_profile_cache(layers)
+    return cache.average_gamma_below(d, z_thickness)
 
-        h = min(z_bot, z_end) - max(z_top, z_start)
-        if h <= 0:
-            continue
 
-        total_h += h
-        gamma_sum += layer.gamma_prime * h
-
-    # Экстраполяция за пределами скважины последним слоем
-    if z_end > total_depth and layers:
-        extra = z_end - max(total_depth, z_start)
-        if extra > 0:
-            total_h += extra
-            gamma_sum += layers[-1].gamma_prime * extra
-
-    if total_h <= 0:
-        return layers[-1].gamma_prime if layers else 0.0
-
-    return gamma_sum / total_h
-
-
-def average_gamma_above(layers: list[SoilLayer], d: float) -> float:
+def average_gamma_above(
+    layers: list[SoilLayer],
+    d: float,
+    cache: SoilProfileCache | None = None,
+) -> float:
     """Средневзвешенное γ′II по толщине от поверхности до глубины d."""
+    if cache is not None:
+        return cache.average_gamma_above(d)
     if d <= 0:
         layer = layers[0] if layers else None
-        return layer.gamma_prime_II or layer.gamma_prime if layer else 0.0
+        return layer.gamma_prime_II_eff if layer else 0.0
 
     remaining = d
     covered = 0.0
@@ -196,18 +203,59 @@ def average_gamma_above(layers: list[SoilLayer], d: float) -> float:
         if remaining <= 0:
             break
         h = min(layer.thickness, remaining)
-        gamma_sum += (layer.gamma_prime_II or layer.gamma_prime) * h
+        gamma_sum += layer.gamma_prime_II_eff * h
         covered += h
         remaining -= h
 
     if remaining > 0 and layers:
         last = layers[-1]
-        gamma_sum += (last.gamma_prime_II or last.gamma_prime) * remaining
+        gamma_sum += last.gamma_prime_II_eff * remaining
         covered += remaining
 
     return gamma_sum / covered if covered > 0 else 0.0
 
 
+def average_gamma_above_batch(
+    layers: list[SoilLayer],
+    d: np.ndarray,
+    cache: SoilProfileCache | None = None,
+) -> np.ndarray:
+    """Векторный вариант average_gamma_above для массива глубин d.
+
+    Без кэша цикл идёт по слоям (их единицы), а не по глубинам; порядок
+    накопления совпадает со скалярной функцией.
+    """
+    if cache is not None:
+        return cache.average_gamma_above_batch(d)
+    d = np.asarray(d, dtype=np.float64)
+    if not layers:
+        return np.zeros_like(d)
+
+    remaining = d.copy()
+    covered = np.zeros_like(d)
+    gamma_sum = np.zeros_like(d)
+
+    for layer in layers:
+        active = remaining > 0
+        if not active.any():
+            break
+        gamma = layer.gamma_prime_II_eff
+        h = np.minimum(layer.thickness, remaining)
+        gamma_sum = np.where(active, gamma_sum + gamma * h, gamma_sum)
+        covered = np.where(active, covered + h, covered)
+        remaining = np.where(active, remaining - h, remaining)
+
+    last = layers[-1]
+    tail = remaining > 0
+    gamma_sum = np.where(tail, gamma_sum + last.gamma_prime_II_eff * remaining, gamma_sum)
+    covered = np.where(tail, covered + remaining, covered)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        result = np.where(covered > 0, gamma_sum / covered, 0.0)
+    first = layers[0]
+    return np.where(d <= 0, first.gamma_prime_II_eff, result)
+
+
 # =============================================================================
 # Функции для западной методики (SNAME/ISO)
 # =============================================================================
@@ -226,39 +274,9 @@ def average_cu_below(
         d: Глубина подошвы, м.
         z_thickness: Толщина зоны усреднения, м (обычно ~1.0·B).
     """
-    if cache is not None:
-        return cache.average_cu_below(d, z_thickness)
-    if not layers or z_thickness <= 0:
-        layer = layers[-1] if layers else None
-        return layer.cu or layer.c if layer else 0.0
-    
-    z_start, z_end = d, d + z_thickness
-    total_h = cu_sum = 0.0
-    total_depth = sum(L.thickness for L in layers)
-
-    z = 0.0
-    for layer in layers:
-        z_top, z_bot = z, z + layer.thickness
-        z = z_bot
-
-        h = min(z_bot, z_end) - max(z_top, z_start)
-        if h <= 0:
-            continue
-
-        total_h += h
-        cu = layer.cu if layer.cu is not None else layer.c
-        cu_sum += cu * h
-
-    # Экстраполяция за пределами скважины последним слоем
-    if z_end > total_depth and layers:
-        last = layers[-1]
-        extra = z_end - max(total_depth, z_start)
-        if extra > 0:
-            total_h += extra
-            cu = last.cu if last.cu is not None else last.c
-            cu_sum += cu * extra
-
-    return cu_sum / total_h if total_h > 0 else 0.0
+    if cache is None:
+        cache = build_profile_cache(layers)
+    return cache.average_cu_below(d, z_thickness)
 
 
 def cu_variability_ratio(
@@ -270,64 +288,33 @@ def cu_variability_ratio(
     """Относительная изменчивость cu на интервале (max-min)/max."""
     if z_thickness <= 0:
         return 0.0
-
-    if cache is not None:
-        if not cache.cu:
-            return 0.0
-        z_start, z_end = d, d + z_thickness
-        cu_min = None
-        cu_max = None
-
-        start_idx = cache._layer_index(z_start)
-        end_idx = cache._layer_index(min(z_end, cache.total_thickness))
-
-        for i in range(start_idx, end_idx + 1):
-            z_top = cache.boundaries[i]
-            z_bot = cache.boundaries[i + 1]
-            h = min(z_bot, z_end) - max(z_top, z_start)
-            if h <= 0:
-                continue
-            cu_val = cache.cu[i]
-            if cu_val <= 0:
-                continue
-            cu_min = cu_val if cu_min is None else min(cu_min, cu_val)
-            cu_max = cu_val if cu_max is None else max(cu_max, cu_val)
-
-        if z_end > cache.total_thickness:
-            cu_val = cache.cu[-1]
-            if cu_val > 0:
-                cu_min = cu_val if cu_min is None else min(cu_min, cu_val)
-                cu_max = cu_val if cu_max is None else max(cu_max, cu_val)
-
-        if cu_max is None or cu_max <= 0:
-            return 0.0
-        return (cu_max - cu_min) / cu_max
-
-    if not layers:
+    if cache is None:
+        cache = build_profile_cache(layers)
+    if not cache.cu:
         return 0.0
 
     z_start, z_end = d, d + z_thickness
     cu_min = None
     cu_max = None
-    total_depth = sum(L.thickness for L in layers)
 
-    z = 0.0
-    for layer in layers:
-        z_top, z_bot = z, z + layer.thickness
-        z = z_bot
+    start_idx = cache._layer_index(z_start)
+    end_idx = cache._layer_index(min(z_end, cache.total_thickness))
 
+    for i in range(start_idx, end_idx + 1):
+        z_top = cache.boundaries[i]
+        z_bot = cache.boundaries[i + 1]
         h = min(z_bot, z_end) - max(z_top, z_start)
         if h <= 0:
             continue
-
-        cu_val = layer.cu if layer.cu is not None else layer.c
+        cu_val = cache.cu[i]
         if cu_val <= 0:
             continue
         cu_min = cu_val if cu_min is None else min(cu_min, cu_val)
         cu_max = cu_val if cu_max is None else max(cu_max, cu_val)
 
-    if z_end > total_depth and layers:
-        cu_val = layers[-1].cu if layers[-1].cu is not None else layers[-1].c
+    # Экстраполяция за пределами скважины последним слоем
+    if z_end > cache.total_thickness:
+        cu_val = cache.cu[-1]
         if cu_val > 0:
             cu_min = cu_val if cu_min is None else min(cu_min, cu_val)
             cu_max = cu_val if cu_max is None else max(cu_max, cu_val)
@@ -353,45 +340,9 @@ def average_sand_props_below(
     Returns:
         (phi_avg, gamma_prime_avg)
     """
-    if cache is not None:
-        return cache.average_sand_props_below(d, z_thickness)
-    if not layers or z_thickness <= 0:
-        layer = layers[-1] if layers else None
-        if layer:
-            return layer.phi, layer.gamma_prime
-        return 30.0, 10.0
-    
-    z_start, z_end = d, d + z_thickness
-    total_h = phi_sum = gamma_sum = 0.0
-    total_depth = sum(L.thickness for L in layers)
-
-    z = 0.0
-    for layer in layers:
-        z_top, z_bot = z, z + layer.thickness
-        z = z_bot
-
-        h = min(z_bot, z_end) - max(z_top, z_start)
-        if h <= 0:
-            continue
-
-        total_h += h
-        phi_sum += layer.phi * h
-        gamma_sum += layer.gamma_prime * h
-
-    # Экстраполяция за пределами скважины последним слоем
-    if z_end > total_depth and layers:
-        last = layers[-1]
-        extra = z_end - max(total_depth, z_start)
-        if extra > 0:
-            total_h += extra
-            phi_sum += last.phi * extra
-            gamma_sum += last.gamma_prime * extra
-
-    if total_h <= 0:
-        layer = layers[-1]
-        return layer.phi, layer.gamma_prime
-
-    return phi_sum / total_h, gamma_sum / total_h
+    if cache is None:
+        cache = build_profile_cache(layers)
+    return cache.average_sand_props_below(d, z_thickness)
 
 
 def get_drainage(layer: SoilLayer) -> str:
@@ -399,27 +350,27 @@ def get_drainage(layer: SoilLayer) -> str:
     if layer.drainage:
         return layer.drainage
 
-    soil_type = (layer.soil_type or "").lower()
-    if soil_type in UNDRAINED_SOIL_TYPES:
-        return "undrained"
-    if soil_type in DRAINED_SOIL_TYPES:
-        return "drained"
-    if soil_type in DUAL_DRAINAGE_SOIL_TYPES:
-        return "undrained"
+    if layer.soil_type:
+        known = _SOIL_TYPE_DRAINAGE.get(layer.soil_type.lower())
+        if known is not None:
+            return known[0]
 
     return "undrained" if layer.cu and layer.cu > 0 else "drained"
 
 
 def is_dual_drainage(layer: SoilLayer) -> bool:
     """Проверить, требует ли грунт двойного расчёта (silt)."""
-    return (layer.soil_type or "").lower() in DUAL_DRAINAGE_SOIL_TYPES
+    if not layer.soil_type:
+        return False
+    known = _SOIL_TYPE_DRAINAGE.get(layer.soil_type.lower())
+    return known is not None and known[1]
 
 
 def spud_cone_volume(D_eff: float, beta_deg: float) -> float:
     """Эквивалентный объём конуса шипа (C.2.3): Vs = π/24·Deff³·tan(β/2)."""
     if D_eff <= 0 or beta_deg <= 0:
         return 0.0
-    return (np.pi / 24.0) * D_eff**3 * np.tan(np.radians(beta_deg / 2.0))
+    return (math.pi / 24.0) * D_eff**3 * math.tan(math.radians(beta_deg / 2.0))
 
 
 def cavity_depth_ratio(
@@ -443,7 +394,26 @@ def cavity_depth_ratio(
     pressure_factor = max(0.0, 1.0 - p / gamma_prime) if gamma_prime > 0 else 1.0
     
     S = (su_m / (gamma_prime * B)) * pressure_factor
-    return S**0.55 - 0.25 * S if S > 0 else 0.0
+    if S <= 0:
+        return 0.0
+    return math.pow(S, 0.55) - 0.25 * S
+
+
+def cavity_depth_ratio_batch(
+    su_m: float, gamma_prime: np.ndarray, B: float, p: float = 0.0
+) -> np.ndarray:
+    """Векторный вариант cavity_depth_ratio для массива γ' (например, по глубинам)."""
+    gamma_prime = np.asarray(gamma_prime, dtype=np.float64)
+    if B <= 0:
+        return np.zeros_like(gamma_prime)
+
+    valid = gamma_prime > 0
+    safe_gamma = np.where(valid, gamma_prime, 1.0)
+    pressure_factor = np.maximum(0.0, 1.0 - p / safe_gamma)
+    S = np.where(valid, (su_m / (safe_gamma * B)) * pressure_factor, 0.0)
+    positive = S > 0
+    S_pos = np.where(positive, S, 1.0)
+    return np.where(positive, np.power(S_pos, 0.55) - 0.25 * S_pos, 0.0)
 
 
 def cavity_depth(
@@ -502,21 +472,79 @@ def additional_stress_boussinesq(p: float, b: float, l: float, z: float) -> floa
     if z <= 0 or b <= 0 or l <= 0:
         return p  # На подошве σ_zp = p
 
+    # Итоговое напряжение
+    sigma_zp = (2 * p / math.pi) * boussinesq_influence(b, l, z)
+
+    return max(0.0, sigma_zp)
+
+
+def boussinesq_influence(b: float, l: float, z: float) -> float:
+    """Выражение в квадратных скобках формулы 6.14 (без множителя 2p/π).
+
+    Не зависит от давления p: одно значение годится для σzp и σzγ на той же глубине.
+    Предполагается z > 0, b > 0, l > 0.
+    """
     # Относительные параметры
     xi = z / b       # ξ = z/b
     eta = l / b      # η = l/b
 
     # Первое слагаемое
     numerator_1 = 2 * eta * xi * (eta**2 + 8*xi**2 + 1)
-    denominator_1 = (eta**2 + 4*xi**2) * (1 + 4*xi**2) * np.sqrt(eta**2 + 4*xi**2 + 1)
+    denominator_1 = (eta**2 + 4*xi**2) * (1 + 4*xi**2) * math.sqrt(eta**2 + 4*xi**2 + 1)
     term_1 = numerator_1 / denominator_1 if denominator_1 > 0 else 0.0
 
     # Второе слагаемое (арктангенс)
     numerator_2 = eta
-    denominator_2 = 2 * xi * np.sqrt(eta**2 + 4*xi**2 + 1)
-    term_2 = np.arctan(numerator_2 / denominator_2) if denominator_2 > 0 else 0.0
+    denominator_2 = 2 * xi * math.sqrt(eta**2 + 4*xi**2 + 1)
+    term_2 = math.atan(numerator_2 / denominator_2) if denominator_2 > 0 else 0.0
 
-    # Итоговое напряжение
-    sigma_zp = (2 * p / np.pi) * (term_1 + term_2)
+    return term_1 + term_2
 
-    return max(0.0, sigma_zp)
+
+def additional_stress_boussinesq_batch(
+    p: float, b: float, l: float, z: np.ndarray
+) -> np.ndarray:
+    """Векторный вариант additional_stress_boussinesq для массива глубин z.
+
+    Вычисляет всю эпюру σ_zp(z) одним выражением NumPy вместо поточечных
+    вызовов скалярной функции.
+
+    Args:
+        p: Среднее давление под подошвой фундамента, кПа
+        b: Ширина фундамента (меньшая сторона), м
+        l: Длина фундамента (большая сторона), м
+        z: Массив глубин расчётных точек от подошвы, м
+
+    Returns:
+        Массив σ_zp той же формы, что и z, кПа.
+    """
+    z = np.asarray(z, dtype=float)
+    if b <= 0 or l <= 0:
+        return np.full_like(z, p)
+
+    return boussinesq_stress_batch(p, z, boussinesq_influence_batch(b, l, z))
+
+
+def boussinesq_stress_batch(p: float, z: np.ndarray, influence: np.ndarray) -> np.ndarray:
+    """σ_zp по готовому множителю boussinesq_influence_batch(b, l, z).
+
+    Множитель не зависит от p: для нескольких давлений на одной сетке глубин
+    его достаточно посчитать один раз. В точках z ≤ 0 возвращается p.
+    """
+    sigma_zp = np.maximum(0.0, (2 * p / np.pi) * influence)
+    return np.where(z > 0, sigma_zp, p)
+
+
+def boussinesq_influence_batch(b: float, l: float, z: np.ndarray) -> np.ndarray:
+    """Векторный вариант boussinesq_influence; в точках z ≤ 0 значения не определены."""
+    xi = z / b
+    eta = l / b
+    root = np.sqrt(eta**2 + 4 * xi**2 + 1)
+
+    # При z = 0 знаменатели обращаются в ноль — вызывающий код заменяет эти точки
+    with np.errstate(divide="ignore", invalid="ignore"):
+        term_1 = 2 * eta * xi * (eta**2 + 8 * xi**2 + 1) / (
+            (eta**2 + 4 * xi**2) * (1 + 4 * xi**2) * root
+        )
+        term_2 = np.arctan(eta / (2 * xi * root))
+    return term_1 + term_2
@@ -0,0 +1,174 @@
+"""Вычислительные ядра для проходов по глубине.
+
+Ядра работают с плоскими массивами float64 (границы слоёв, свойства слоёв)
+и компилируются Numba, если она установлена. Без Numba те же функции
+выполняются как обычный Python — результат не меняется.
+
+Ядра объявлены с явной сигнатурой: Numba компилирует их при импорте модуля,
+а не при первом расчёте, и с cache=True сохраняет машинный код на диск —
+повторные запуски загружают его без JIT-прогрева.
+"""
+
+from bisect import bisect_right
+
+import numpy as np
+
+try:
+    from numba import njit
+    from numba.extending import overload, register_jitable
+
+    HAS_NUMBA = True
+except ImportError:  # Numba — необязательная зависимость
+    HAS_NUMBA = False
+
+    def njit(*args, **kwargs):
+        """Заглушка numba.njit: возвращает функцию без изменений."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+    def register_jitable(func):
+        """Заглушка numba.extending.register_jitable."""
+        return func
+
+else:
+
+    @overload(bisect_right)
+    def _bisect_right_numba(a, x):
+        """bisect_right внутри ядер Numba — через np.searchsorted по массиву."""
+        return lambda a, x: np.searchsorted(a, x, side="right")
+
+
+@register_jitable
+def _depth_integral_py(
+    boundaries: tuple[float, ...],
+    integral: tuple[float, ...],
+    values: tuple[float, ...],
+    z: float,
+) -> float:
+    """∫₀ᶻ value(ζ)·dζ по префиксным суммам integral (N + 1 значений).
+
+    Ниже скважины — экстраполяция последним слоем; z ≤ 0 даёт 0.
+    """
+    n = len(values)
+    total = boundaries[n]
+    if z >= total:
+        return integral[n] + values[n - 1] * (z - total)
+    if z <= 0.0:
+        return 0.0
+    i = bisect_right(boundaries, z) - 1
+    return integral[i] + values[i] * (z - boundaries[i])
+
+
+def avg_below_py(
+    boundaries: tuple[float, ...],
+    integral: tuple[float, ...],
+    values: tuple[float, ...],
+    d: float,
+    z_thickness: float,
+    fallback: float,
+) -> float:
+    """Средневзвешенное по толщине свойство на интервале [d, d + z_thickness].
+
+    Args:
+        boundaries: Границы слоёв от поверхности, м (N + 1 значений).
+        integral: Префиксные суммы Σ value·h по границам (N + 1 значений).
+        values: Значения свойства по слоям (N значений).
+        d: Верх интервала усреднения, м.
+        z_thickness: Толщина интервала, м.
+        fallback: Результат, если интервал не перекрывает ни одного слоя.
+
+    Интеграл по интервалу — разность двух префиксных сумм, O(log N).
+    При выходе за пределы скважины — экстраполяция последним слоем.
+
+    Без Numba вызывается на кортежах Python: индексация кортежа и bisect
+    в CPython заметно дешевле индексации массивов NumPy и np.searchsorted.
+    """
+    z_start = d if d > 0.0 else 0.0
+    z_end = d + z_thickness
+    total_h = z_end - z_start
+    if total_h <= 0:
+        return fallback
+    acc = _depth_integral_py(boundaries, integral, values, z_end) - _depth_integral_py(
+        boundaries, integral, values, z_start
+    )
+    return acc / total_h
+
+
+# Ядра Numba компилируются из тех же функций: на массивах float64
+# bisect_right заменяется np.searchsorted (см. _bisect_right_numba)
+depth_integral = njit("float64(float64[::1], float64[::1], float64[::1], float64)", cache=True)(
+    _depth_integral_py
+)
+
+# float64(границы, префиксные суммы, значения, d, z_thickness, fallback)
+_AVG_BELOW_SIGNATURE = (
+    "float64(float64[::1], float64[::1], float64[::1], float64, float64, float64)"
+)
+avg_below = njit(_AVG_BELOW_SIGNATURE, cache=True)(avg_below_py)
+
+
+# float64[:](глубины, границы, Σγ'h, γ', c, Rc, Nγ, Nq, Nc, A', b', ξγ, ξq, ξc)
+_NU_SWEEP_SIGNATURE = (
+    "float64[::1](float64[::1], float64[::1], float64[::1], float64[::1], float64[::1], "
+    "float64[::1], float64[::1], float64[::1], float64[::1], "
+    "float64, float64, float64, float64, float64)"
+)
+
+
+@njit(_NU_SWEEP_SIGNATURE, cache=True)
+def nu_sweep(
+    depths: np.ndarray,
+    boundaries: np.ndarray,
+    cum_gamma: np.ndarray,
+    gamma: np.ndarray,
+    c: np.ndarray,
+    rc: np.ndarray,
+    n_gamma: np.ndarray,
+    n_q: np.ndarray,
+    n_c: np.ndarray,
+    area: float,
+    b_p: float,
+    xi_gamma: float,
+    xi_q: float,
+    xi_c: float,
+) -> np.ndarray:
+    """Nu (СП 22, C.1.1) по сетке глубин за один проход без промежуточных массивов.
+
+    Повторяет bearing_capacity_Nu_batch: слой под подошвой — первый, чья
+    подошва ≥ d; бытовое давление — по накопленным Σγ'h; скальные слои — Rc·A'.
+    """
+    n = gamma.shape[0]
+    total = boundaries[n]
+    out = np.zeros(depths.shape[0])
+
+    for k in range(depths.shape[0]):
+        d = depths[k]
+        if d < 0.0 or n == 0:
+            continue
+
+        i = np.searchsorted(boundaries[1:], d)
+        if i > n - 1:
+            i = n - 1
+        if rc[i] > 0:
+            out[k] = rc[i] * 1000.0 * area
+            continue
+
+        if d <= 0.0:
+            sigma = 0.0
+        elif d >= total:
+            sigma = cum_gamma[n] + gamma[n - 1] * (d - total)
+        else:
+            j = np.searchsorted(boundaries, d) - 1
+            if j < 0:
+                j = 0
+            elif j > n - 1:
+                j = n - 1
+            sigma = cum_gamma[j] + gamma[j] * (d - boundaries[j])
+
+        out[k] = area * (
+            n_c[i] * xi_c * c[i]
+            + n_q[i] * xi_q * sigma
+            + n_gamma[i] * xi_gamma * b_p * gamma[i]
+        )
+    return out
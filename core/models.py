@@ -2,16 +2,52 @@
 
 import math
 from bisect import bisect_left
-from dataclasses import dataclass
-from typing import Literal
-from pydantic import BaseModel, Field, computed_field, model_validator
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import Callable, Literal
+
+import numpy as np
+from pydantic import BaseModel, ConfigDict, Field, computed_field
+
+
+# Предельный размер мемо SoilProfileCache: кэш разреза живёт столько же,
+# сколько SoilProfile, и без ограничения рос бы с каждой новой сеткой глубин
+_MEMO_MAXSIZE = 4096
+
+
+class _LRUMemo(OrderedDict):
+    """Словарь-мемо с вытеснением давно не использованных записей (LRU)."""
+
+    def __init__(self, maxsize: int = _MEMO_MAXSIZE):
+        super().__init__()
+        self.maxsize = maxsize
+
+    def get(self, key, default=None):
+        try:
+            self.move_to_end(key)
+        except KeyError:
+            return default
+        return self[key]
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.move_to_end(key)
+        if len(self) > self.maxsize:
+            self.popitem(last=False)
 
 
 # --- Грунт ---
 
 
 class SoilLayer(BaseModel):
-    """Слой грунта (ИГЭ/РГЭ)."""
+    """Слой грунта (ИГЭ/РГЭ).
+
+    Параметры II группы ПС хранятся как заданы (None — не заданы); расчётные
+    значения с подстановкой из I группы — свойства *_II_eff.
+    """
+
+    model_config = ConfigDict(frozen=True)
 
     name: str
     thickness: float = Field(gt=0, description="Мощность слоя, м")
@@ -33,29 +69,63 @@ class SoilLayer(BaseModel):
     cu: float | None = Field(default=None, ge=0, description="Недренированная прочность, кПа")
     drainage: Literal["drained", "undrained"] | None = Field(default=None, description="Условия дренирования")
 
-    @model_validator(mode="after")
-    def fill_group_II_defaults(self):
-        """Заполнить параметры II группы ПС значениями I группы, если не заданы."""
-        if self.phi_II is None:
-            self.phi_II = self.phi
-        if self.c_II is None:
-            self.c_II = self.c
-        if self.gamma_prime_II is None:
-            self.gamma_prime_II = self.gamma_prime
-        return self
+    # Значения II группы ПС вычисляются при первом обращении, а не при
+    # каждом создании модели. Незаданное (или нулевое) значение берётся из I группы.
+
+    @cached_property
+    def phi_II_eff(self) -> float:
+        """φ для II группы ПС, °."""
+        return self.phi_II or self.phi
+
+    @cached_property
+    def c_II_eff(self) -> float:
+        """c для II группы ПС, кПа."""
+        return self.c_II or self.c
+
+    @cached_property
+    def gamma_prime_II_eff(self) -> float:
+        """γ' для II группы ПС, кН/м³."""
+        return self.gamma_prime_II or self.gamma_prime
+
+    @cached_property
+    def cu_or_c_if_unset(self) -> float:
+        """Недренированная прочность для западной методики, кПа.
+
+        c подставляется только если cu не задана (None); явное cu = 0 сохраняется.
+        """
+        return self.cu if self.cu is not None else self.c
+
+    @cached_property
+    def cu_or_c(self) -> float:
+        """Недренированная прочность для механизмов слоистых толщ и su_m, кПа.
+
+        c подставляется и при cu = None, и при cu = 0.
+        """
+        return self.cu or self.c
 
 
 class SoilProfile(BaseModel):
-    """Геологический разрез."""
+    """Геологический разрез.
+
+    Модель неизменяемая: кэш разреза (границы, Σγ'h, столбцы свойств) строится
+    один раз при первом обращении и передаётся в расчёт как cache=profile.cache.
+    """
+
+    model_config = ConfigDict(frozen=True)
 
     layers: list[SoilLayer] = Field(default_factory=list)
     name: str = ""
     water_depth: float = Field(ge=0, default=0.0, description="Глубина воды, м")
 
+    @cached_property
+    def cache(self) -> "SoilProfileCache":
+        """Кэш разреза для передачи в функции расчёта."""
+        return SoilProfileCache.from_layers(self.layers)
+
     @computed_field
-    @property
+    @cached_property
     def total_thickness(self) -> float:
-        return sum(layer.thickness for layer in self.layers)
+        return self.cache.total_thickness
 
 
 @dataclass(frozen=True)
@@ -69,20 +139,32 @@ class SoilProfileCache:
     cu: list[float]
     total_thickness: float
     cum_gamma: list[float]
+    # Свойства слоёв в виде массивов float64 (SoA) для ядер усреднения
+    columns: dict[str, np.ndarray]
+    # Префиксные суммы Σ value·h по границам слоёв для каждого столбца свойств:
+    # среднее по интервалу — разность двух сумм, без прохода по слоям
+    integrals: dict[str, np.ndarray]
+    # Те же столбцы и суммы кортежами — для ядра на чистом Python (без Numba)
+    column_tuples: dict[str, tuple[float, ...]]
+    integral_tuples: dict[str, tuple[float, ...]]
+    # Ядро усреднения и его столбцы: avg_below (Numba) на массивах
+    # или avg_below_py на кортежах, если Numba не установлена
+    average_kernel: Callable[..., float]
+    kernel_columns: dict[str, np.ndarray | tuple[float, ...]]
+    kernel_integrals: dict[str, np.ndarray | tuple[float, ...]]
+    # Мемоизация усреднений: (столбец, d, z_thickness) -> значение.
+    # Повторные проходы по той же сетке глубин (кривая, поиск равновесия,
+    # punch-through) берут готовые значения; размер ограничен LRU.
+    _averages: _LRUMemo = field(
+        default_factory=_LRUMemo, init=False, repr=False, compare=False
+    )
+    # Бытовое давление по сетке глубин: depth -> σzg (заполняет overburden_stress_batch)
+    _overburden: _LRUMemo = field(
+        default_factory=_LRUMemo, init=False, repr=False, compare=False
+    )
 
     @classmethod
     def from_layers(cls, layers: list[SoilLayer]) -> "SoilProfileCache":
-        if not layers:
-            return cls(
-                layers=[],
-                boundaries=[0.0],
-                gamma_prime=[],
-                phi=[],
-                cu=[],
-                total_thickness=0.0,
-                cum_gamma=[0.0],
-            )
-
         boundaries = [0.0]
         gamma_prime = []
         phi = []
@@ -94,10 +176,39 @@ class SoilProfileCache:
             boundaries.append(boundaries[-1] + thickness)
             gamma_prime.append(layer.gamma_prime)
             phi.append(layer.phi)
-            cu_value = layer.cu if layer.cu is not None else layer.c
-            cu.append(cu_value)
+            cu.append(layer.cu_or_c_if_unset)
             cum_gamma.append(cum_gamma[-1] + layer.gamma_prime * thickness)
 
+        columns = {
+            "boundaries": boundaries,
+            "cum_gamma": cum_gamma,
+            "gamma_prime": gamma_prime,
+            "phi": phi,
+            "cu": cu,
+            "c": [layer.c for layer in layers],
+            "gamma_prime_II": [layer.gamma_prime_II_eff for layer in layers],
+            "phi_II": [layer.phi_II_eff for layer in layers],
+            "c_II": [layer.c_II_eff for layer in layers],
+        }
+
+        integrals = {}
+        for key, values in columns.items():
+            if key in ("boundaries", "cum_gamma"):
+                continue
+            acc = [0.0]
+            for layer, value in zip(layers, values):
+                acc.append(acc[-1] + value * layer.thickness)
+            integrals[key] = acc
+
+        # core.kernels (импорт Numba и компиляция ядер) подгружается при первом
+        # построении кэша, а не при импорте моделей из UI и TOML-хелперов
+        from core.kernels import HAS_NUMBA, avg_below, avg_below_py
+
+        column_arrays = {key: np.asarray(values, dtype=np.float64) for key, values in columns.items()}
+        integral_arrays = {key: np.asarray(values, dtype=np.float64) for key, values in integrals.items()}
+        column_tuples = {key: tuple(values) for key, values in columns.items()}
+        integral_tuples = {key: tuple(values) for key, values in integrals.items()}
+
         return cls(
             layers=layers,
             boundaries=boundaries,
@@ -106,20 +217,157 @@ class SoilProfileCache:
             cu=cu,
             total_thickness=boundaries[-1],
             cum_gamma=cum_gamma,
+            columns=column_arrays,
+            integrals=integral_arrays,
+            column_tuples=column_tuples,
+            integral_tuples=integral_tuples,
+            average_kernel=avg_below if HAS_NUMBA else avg_below_py,
+            kernel_columns=column_arrays if HAS_NUMBA else column_tuples,
+            kernel_integrals=integral_arrays if HAS_NUMBA else integral_tuples,
         )
 
+    @cached_property
+    def drainage(self) -> tuple[tuple[str, ...], tuple[bool, ...]]:
+        """Условия дренирования и признак двойного расчёта по слоям.
+
+        Классификация по строковым полям слоя выполняется один раз на разрез,
+        а не на каждой глубине кривой для каждого механизма разрушения.
+        """
+        # core.helpers импортирует core.models — импорт внутри метода
+        from core.helpers import get_drainage, is_dual_drainage
+
+        return (
+            tuple(get_drainage(layer) for layer in self.layers),
+            tuple(is_dual_drainage(layer) for layer in self.layers),
+        )
+
+    def _average_below(self, column: str, d: float, z_thickness: float, fallback: float) -> float:
+        """Средневзвешенное значение столбца column на интервале [d, d + z_thickness]."""
+        key = (column, d, z_thickness)
+        value = self._averages.get(key)
+        if value is None:
+            value = self.average_kernel(
+                self.kernel_columns["boundaries"],
+                self.kernel_integrals[column],
+                self.kernel_columns[column],
+                d,
+                z_thickness,
+                fallback,
+            )
+            self._averages[key] = value
+        return value
+
     def _layer_index(self, depth: float) -> int:
-        if not self.gamma_prime:
-            return 0
-        if depth <= 0.0:
+        """Индекс слоя на глубине depth (на границе — верхний), с обрезкой к [0, N-1].
+
+        Без ветвлений по глубине: поиск с lo=1 сразу даёт 0 для depth ≤ 0,
+        а выход за подошву скважины обрезается min().
+        """
+        n = len(self.gamma_prime)
+        if not n:
             return 0
-        if depth >= self.total_thickness:
-            return len(self.gamma_prime) - 1
+        return min(bisect_left(self.boundaries, depth, 1), n) - 1
+
+    def _layer_indices(self, depths: np.ndarray) -> np.ndarray:
+        """Векторный вариант _layer_index для массива глубин."""
+        depths = np.asarray(depths, dtype=np.float64)
+        n = len(self.gamma_prime)
+        if not n:
+            return np.zeros(depths.shape, dtype=np.intp)
+        idx = np.searchsorted(self.columns["boundaries"][1:], depths, side="left")
+        return np.minimum(idx, n - 1)
+
+    def average_below_batch(
+        self, column: str, d: np.ndarray, z_thickness: float, fallback: float
+    ) -> np.ndarray:
+        """Векторный вариант усреднения для массива глубин d.
+
+        Интегралы на концах интервалов [d, d + z_thickness] берутся из префиксных
+        сумм по всем глубинам сразу (searchsorted). Результаты заносятся в мемо,
+        так что последующие скалярные вызовы для тех же глубин — поиск в словаре.
+        """
+        d = np.asarray(d, dtype=np.float64)
+        z_start = np.maximum(d, 0.0)
+        z_end = d + z_thickness
+        acc = self._depth_integral_batch(column, z_end) - self._depth_integral_batch(column, z_start)
+        total_h = z_end - z_start
+        with np.errstate(divide="ignore", invalid="ignore"):
+            result = np.where(total_h > 0, acc / total_h, fallback)
+
+        for depth, value in zip(d.tolist(), result.tolist()):
+            self._averages[(column, depth, z_thickness)] = value
+        return result
+
+    def _depth_integral_batch(self, column: str, z: np.ndarray) -> np.ndarray:
+        """∫₀ᶻ столбца column для массива глубин (векторный depth_integral)."""
+        boundaries = self.columns["boundaries"]
+        integral = self.integrals[column]
+        values = self.columns[column]
+        n = len(values)
+        total = boundaries[n]
+
+        i = np.clip(np.searchsorted(boundaries, z, side="right") - 1, 0, n - 1)
+        inside = integral[i] + values[i] * (z - boundaries[i])
+        below = integral[n] + values[n - 1] * (z - total)
+        return np.where(z >= total, below, np.where(z <= 0.0, 0.0, inside))
+
+    def average_props_below_batch(
+        self, d: np.ndarray, z_thickness: float
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Векторный вариант average_props_below для массива глубин d."""
+        d = np.asarray(d, dtype=np.float64)
+        if not self.gamma_prime or z_thickness <= 0:
+            gamma, phi, c = self.average_props_below(0.0, z_thickness)
+            return np.full_like(d, gamma), np.full_like(d, phi), np.full_like(d, c)
+
+        keys = ("gamma_prime_II", "phi_II", "c_II")
+        return tuple(
+            self.average_below_batch(key, d, z_thickness, float(self.columns[key][-1]))
+            for key in keys
+        )
+
+    def layer_at(self, depth: float) -> SoilLayer | None:
+        """Слой на глубине depth (на границе — верхний); ниже скважины — последний."""
+        if not self.layers or depth < 0.0:
+            return None
+        idx = bisect_left(self.boundaries, depth, 1) - 1
+        return self.layers[min(idx, len(self.layers) - 1)]
+
+    def layer_index_batch(self, depths: np.ndarray) -> np.ndarray:
+        """Индексы слоёв для массива глубин (семантика layer_at; depth < 0 → -1)."""
+        depths = np.asarray(depths, dtype=np.float64)
+        if not self.layers:
+            return np.full(depths.shape, -1, dtype=np.intp)
+        return np.where(depths < 0.0, -1, self._layer_indices(depths))
+
+    def overburden_stress_batch(self, depths: np.ndarray) -> np.ndarray:
+        """Векторный вариант overburden_stress для массива глубин.
+
+        Результаты заносятся в мемо: скалярные вызовы для тех же глубин
+        (несколько механизмов разрушения на одной точке кривой) берут готовое σzg.
+        """
+        depths = np.asarray(depths, dtype=np.float64)
+        if not self.gamma_prime:
+            return np.zeros_like(depths)
+
+        boundaries = self.columns["boundaries"]
+        gamma = self.columns["gamma_prime"]
+        cum_gamma = self.columns["cum_gamma"]
+        n = len(self.gamma_prime)
+
+        idx = np.clip(np.searchsorted(boundaries, depths, side="left") - 1, 0, n - 1)
+        inside = cum_gamma[idx] + gamma[idx] * (depths - boundaries[idx])
+        below = cum_gamma[-1] + gamma[-1] * (depths - self.total_thickness)
+        sigma = np.where(depths >= self.total_thickness, below, inside)
+        sigma = np.where(depths <= 0, 0.0, sigma)
 
-        idx = bisect_left(self.boundaries, depth) - 1
-        return max(0, min(idx, len(self.gamma_prime) - 1))
+        self._overburden.update(zip(depths.ravel().tolist(), sigma.ravel().tolist()))
+        return sigma
 
     def overburden_stress(self, depth: float) -> float:
+        value = self._overburden.get(depth)
+        if value is not None:
+            return value
         if depth <= 0 or not self.gamma_prime:
             return 0.0
 
@@ -131,76 +379,73 @@ class SoilProfileCache:
         z_top = self.boundaries[idx]
         return self.cum_gamma[idx] + self.gamma_prime[idx] * (depth - z_top)
 
-    def average_cu_below(self, d: float, z_thickness: float) -> float:
-        if not self.cu or z_thickness <= 0:
-            return self.cu[-1] if self.cu else 0.0
-
-        z_start, z_end = d, d + z_thickness
-        total_h = 0.0
-        cu_sum = 0.0
-
-        start_idx = self._layer_index(z_start)
-        end_idx = self._layer_index(min(z_end, self.total_thickness))
+    def average_props_below(self, d: float, z_thickness: float) -> tuple[float, float, float]:
+        """Средневзвешенные γ′II, φII, cII ниже подошвы."""
+        if not self.gamma_prime:
+            return 10.0, 20.0, 0.0
+
+        keys = ("gamma_prime_II", "phi_II", "c_II")
+        last = tuple(float(self.columns[key][-1]) for key in keys)
+        if z_thickness <= 0:
+            return last
+        return tuple(
+            self._average_below(key, d, z_thickness, fallback)
+            for key, fallback in zip(keys, last)
+        )
 
-        for i in range(start_idx, end_idx + 1):
-            z_top = self.boundaries[i]
-            z_bot = self.boundaries[i + 1]
-            h = min(z_bot, z_end) - max(z_top, z_start)
-            if h <= 0:
-                continue
-            total_h += h
-            cu_sum += self.cu[i] * h
+    def average_gamma_below(self, d: float, z_thickness: float) -> float:
+        """Средневзвешенное γ′ (I группа ПС) ниже подошвы."""
+        if not self.gamma_prime:
+            return 0.0
+        if z_thickness <= 0:
+            return self.gamma_prime[-1]
+        return self._average_below("gamma_prime", d, z_thickness, self.gamma_prime[-1])
 
-        if z_end > self.total_thickness:
-            extra = z_end - max(self.total_thickness, z_start)
-            if extra > 0:
-                total_h += extra
-                cu_sum += self.cu[-1] * extra
+    def average_gamma_above(self, d: float) -> float:
+        """Средневзвешенное γ′II от поверхности до глубины d (по префиксным суммам)."""
+        if not self.gamma_prime:
+            return 0.0
+        first = self.column_tuples["gamma_prime_II"][0]
+        if d <= 0:
+            return first
+        return self._average_below("gamma_prime_II", 0.0, d, first)
+
+    def average_gamma_above_batch(self, d: np.ndarray) -> np.ndarray:
+        """Векторный вариант average_gamma_above для массива глубин d."""
+        d = np.asarray(d, dtype=np.float64)
+        if not self.gamma_prime:
+            return np.zeros_like(d)
+        acc = self._depth_integral_batch("gamma_prime_II", d)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(d > 0, acc / d, self.column_tuples["gamma_prime_II"][0])
 
-        return cu_sum / total_h if total_h > 0 else 0.0
+    def average_cu_below(self, d: float, z_thickness: float) -> float:
+        if not self.cu or z_thickness <= 0:
+            return self.cu[-1] if self.cu else 0.0
+        return self._average_below("cu", d, z_thickness, 0.0)
 
     def average_sand_props_below(self, d: float, z_thickness: float) -> tuple[float, float]:
-        if not self.phi or not self.gamma_prime or z_thickness <= 0:
-            if self.phi and self.gamma_prime:
-                return self.phi[-1], self.gamma_prime[-1]
+        if not self.phi or not self.gamma_prime:
             return 30.0, 10.0
-
-        z_start, z_end = d, d + z_thickness
-        total_h = 0.0
-        phi_sum = 0.0
-        gamma_sum = 0.0
-
-        start_idx = self._layer_index(z_start)
-        end_idx = self._layer_index(min(z_end, self.total_thickness))
-
-        for i in range(start_idx, end_idx + 1):
-            z_top = self.boundaries[i]
-            z_bot = self.boundaries[i + 1]
-            h = min(z_bot, z_end) - max(z_top, z_start)
-            if h <= 0:
-                continue
-            total_h += h
-            phi_sum += self.phi[i] * h
-            gamma_sum += self.gamma_prime[i] * h
-
-        if z_end > self.total_thickness:
-            extra = z_end - max(self.total_thickness, z_start)
-            if extra > 0:
-                total_h += extra
-                phi_sum += self.phi[-1] * extra
-                gamma_sum += self.gamma_prime[-1] * extra
-
-        if total_h <= 0:
+        if z_thickness <= 0:
             return self.phi[-1], self.gamma_prime[-1]
-
-        return phi_sum / total_h, gamma_sum / total_h
+        return (
+            self._average_below("phi", d, z_thickness, self.phi[-1]),
+            self._average_below("gamma_prime", d, z_thickness, self.gamma_prime[-1]),
+        )
 
 
 # --- Фундамент ---
 
 
 class Foundation(BaseModel):
-    """Фундамент (башмак СПБУ)."""
+    """Фундамент (башмак СПБУ).
+
+    Модель неизменяемая: производные размеры (b', l', A', η, B) вычисляются
+    один раз при первом обращении и далее берутся из кэша экземпляра.
+    """
+
+    model_config = ConfigDict(frozen=True)
 
     area: float = Field(gt=0, description="Площадь подошвы, м²")
     e_x: float = Field(ge=0, default=0.0, description="Эксцентриситет по X, м")
@@ -213,43 +458,43 @@ class Foundation(BaseModel):
     beta: float | None = Field(default=None, gt=0, le=180, description="Угол конуса шипа, °")
 
     @computed_field
-    @property
+    @cached_property
     def b(self) -> float:
         """Ширина (круг: √A)."""
         return self.area ** 0.5
 
     @computed_field
-    @property
+    @cached_property
     def l(self) -> float:
         """Длина (круг: √A)."""
         return self.area ** 0.5
 
     @computed_field
-    @property
+    @cached_property
     def b_prime(self) -> float:
         """Приведённая ширина b' = b - 2e_x (СП 22 п.5.29)."""
         return max(0.01, self.b - 2.0 * self.e_x)
 
     @computed_field
-    @property
+    @cached_property
     def l_prime(self) -> float:
         """Приведённая длина l' = l - 2e_y (СП 22 п.5.29)."""
         return max(0.01, self.l - 2.0 * self.e_y)
 
     @computed_field
-    @property
+    @cached_property
     def area_prime(self) -> float:
         """Приведённая площадь A' = b'·l'."""
         return self.b_prime * self.l_prime
 
     @computed_field
-    @property
+    @cached_property
     def eta(self) -> float:
         """η = l'/b' (≥1, для круглого = 1)."""
         return max(1.0, self.l_prime / self.b_prime)
 
     @computed_field
-    @property
+    @cached_property
     def B_eff(self) -> float:
         """Эффективный диаметр B для западной методики (C.2).
 
@@ -260,6 +505,20 @@ class Foundation(BaseModel):
         """
         return math.sqrt(4.0 * self.area_prime / math.pi)
 
+    @cached_property
+    def V_s(self) -> float:
+        """Эквивалентный объём конуса шипа (C.2.3), см. spud_cone_volume.
+
+        Не зависит от глубины, поэтому считается один раз на фундамент.
+        Без D_eff или β — 0.
+        """
+        # core.helpers импортирует core.models — импорт внутри метода
+        from core.helpers import spud_cone_volume
+
+        if self.D_eff is None or self.beta is None:
+            return 0.0
+        return spud_cone_volume(self.D_eff, self.beta)
+
 
 # --- Коэффициенты ---
 
@@ -281,7 +540,13 @@ class Coefficients(BaseModel):
 
 
 class PointResult(BaseModel):
-    """Результат расчёта для глубины d."""
+    """Результат расчёта для глубины d.
+
+    Модель неизменяемая, поэтому признаки is_safe* вычисляются один раз
+    при первом обращении и дальше читаются как обычные атрибуты.
+    """
+
+    model_config = ConfigDict(frozen=True)
 
     d: float = Field(ge=0, description="Глубина, м")
     Nu: float = Field(ge=0, description="Несущая способность, кН")
@@ -291,20 +556,52 @@ class PointResult(BaseModel):
     eta2: float = Field(description="η₂ = p / R")
     layer_name: str
 
+    @classmethod
+    def from_values(
+        cls,
+        d: float,
+        Nu: float,
+        R: float,
+        p: float,
+        eta1: float,
+        eta2: float,
+        layer_name: str,
+    ) -> "PointResult":
+        """Собрать результат из значений, посчитанных ядром расчёта.
+
+        Кривая пенетрации создаёт сотни точек за расчёт, поэтому полную схему
+        Pydantic не прогоняем: проверяем только ограничения ge=0 для d, Nu, R, p
+        и приводим числа NumPy к float. Если проверка не прошла (например,
+        Vl < 0 с обратной засыпкой или NaN), точка строится через конструктор —
+        он выбрасывает ValidationError, как и без быстрого пути.
+        """
+        d, Nu, R, p = float(d), float(Nu), float(R), float(p)
+        if not (d >= 0 and Nu >= 0 and R >= 0 and p >= 0):
+            return cls(d=d, Nu=Nu, R=R, p=p, eta1=eta1, eta2=eta2, layer_name=layer_name)
+        return cls.model_construct(
+            d=d,
+            Nu=Nu,
+            R=R,
+            p=p,
+            eta1=float(eta1),
+            eta2=float(eta2),
+            layer_name=layer_name,
+        )
+
     @computed_field
-    @property
+    @cached_property
     def is_safe_I(self) -> bool:
         """Выполнение условия I группы ПС."""
         return self.eta1 <= 1.0
 
     @computed_field
-    @property
+    @cached_property
     def is_safe_II(self) -> bool:
         """Выполнение условия II группы ПС."""
         return self.eta2 <= 1.0
 
     @computed_field
-    @property
+    @cached_property
     def is_safe(self) -> bool:
         """Выполнение обоих условий."""
         return self.is_safe_I and self.is_safe_II
@@ -319,7 +616,10 @@ class CalculationResult(BaseModel):
     eq_operation: PointResult | None = None
     eq_preload: PointResult | None = None
     depths: list[float]
-    settlements: list[float] = Field(description="Осадки, мм")
+    settlements: list[float] | None = Field(
+        default=None,
+        description="Осадки, мм (только для российской методики, иначе None)",
+    )
     punch_through_risk: bool = Field(
         default=False, 
         description="Флаг риска punch-through (только для западной методики)"
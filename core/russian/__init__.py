@@ -14,10 +14,16 @@
     )
 """
 
-from .bearing import bearing_capacity_Nu, design_resistance_R
+from .bearing import (
+    bearing_capacity_Nu,
+    bearing_capacity_Nu_batch,
+    design_resistance_R,
+    design_resistance_R_batch,
+)
 from .penetration import (
     calculate_point,
     find_equilibrium_depth,
+    find_equilibrium_depths,
     penetration_curve,
 )
 from .settlement import (
@@ -29,7 +35,9 @@ from .settlement import (
 __all__ = [
     # Несущая способность
     "bearing_capacity_Nu",
+    "bearing_capacity_Nu_batch",
     "design_resistance_R",
+    "design_resistance_R_batch",
     # Осадка
     "min_compressible_depth",
     "compressible_depth",
@@ -38,4 +46,5 @@ __all__ = [
     "calculate_point",
     "penetration_curve",
     "find_equilibrium_depth",
+    "find_equilibrium_depths",
 ]
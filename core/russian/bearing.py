@@ -1,15 +1,25 @@
 """Несущая способность по СП 22/23/58 (I и II группы ПС)."""
 
+import numpy as np
+
 from core.helpers import (
     average_gamma_above,
+    average_gamma_above_batch,
     average_props_below,
+    average_props_below_batch,
+    build_profile_cache,
     get_layer_at_depth,
     overburden_stress,
     reduced_dimensions,
     shape_factors,
 )
-from core.models import Coefficients, Foundation, SoilLayer
-from core.russian.tables import bearing_capacity_factors, resistance_factors
+from core.models import Coefficients, Foundation, SoilLayer, SoilProfileCache
+from core.russian.tables import (
+    bearing_capacity_factors,
+    bearing_capacity_factors_batch,
+    resistance_factors,
+    resistance_factors_batch,
+)
 
 
 def bearing_capacity_Nu(
@@ -17,6 +27,7 @@ def bearing_capacity_Nu(
     foundation: Foundation,
     d: float,
     layer: SoilLayer | None = None,
+    cache: SoilProfileCache | None = None,
 ) -> float:
     """Несущая способность Nu (C.1.1).
 
@@ -31,12 +42,13 @@ def bearing_capacity_Nu(
         foundation: Параметры фундамента.
         d: Глубина заглубления, м.
         layer: Слой грунта (опционально, иначе определяется по глубине).
+        cache: Кэш разреза (опционально).
 
     Returns:
         Nu, кН — несущая способность.
     """
     if layer is None:
-        layer = get_layer_at_depth(layers, d)
+        layer = get_layer_at_depth(layers, d, cache=cache)
     if layer is None:
         return 0.0
 
@@ -50,7 +62,7 @@ def bearing_capacity_Nu(
     b_p, _, eta = reduced_dimensions(foundation)
     area = foundation.area_prime
     xi_gamma, xi_q, xi_c = shape_factors(eta)
-    sigma_zg = overburden_stress(layers, d)
+    sigma_zg = overburden_stress(layers, d, cache=cache)
     N_gamma, N_q, N_c = bearing_capacity_factors(layer.phi)
 
     return area * (
@@ -60,11 +72,67 @@ def bearing_capacity_Nu(
     )
 
 
+def bearing_capacity_Nu_batch(
+    layers: list[SoilLayer],
+    foundation: Foundation,
+    depths: np.ndarray,
+    cache: SoilProfileCache | None = None,
+) -> np.ndarray:
+    """Векторный вариант bearing_capacity_Nu для массива глубин.
+
+    Коэффициенты Nγ, Nq, Nc зависят только от φ слоя, поэтому считаются
+    один раз на слой и разносятся по глубинам индексами слоёв. С Numba вся
+    сетка считается одним скомпилированным проходом (core.kernels.nu_sweep).
+    """
+    if cache is None:
+        cache = build_profile_cache(layers)
+    depths = np.asarray(depths, dtype=np.float64)
+    idx = cache.layer_index_batch(depths)
+    if not cache.layers:
+        return np.zeros_like(depths)
+
+    b_p, _, eta = reduced_dimensions(foundation)
+    area = foundation.area_prime
+    xi_gamma, xi_q, xi_c = shape_factors(eta)
+
+    N_gamma_l, N_q_l, N_c_l = bearing_capacity_factors_batch(cache.columns["phi"])
+    rc = np.array([layer.Rc if layer.Rc is not None else 0.0 for layer in cache.layers])
+
+    # Импорт Numba и ядер — при первом расчёте, а не при импорте пакета core
+    from core.kernels import HAS_NUMBA, nu_sweep
+
+    if HAS_NUMBA:
+        columns = cache.columns
+        return nu_sweep(
+            depths, columns["boundaries"], columns["cum_gamma"], columns["gamma_prime"],
+            columns["c"], rc, N_gamma_l, N_q_l, N_c_l,
+            area, b_p, xi_gamma, xi_q, xi_c,
+        )
+
+    layer_idx = np.maximum(idx, 0)
+    N_gamma, N_q, N_c = N_gamma_l[layer_idx], N_q_l[layer_idx], N_c_l[layer_idx]
+    c = cache.columns["c"][layer_idx]
+    gamma = cache.columns["gamma_prime"][layer_idx]
+    sigma_zg = cache.overburden_stress_batch(depths)
+
+    Nu = area * (N_c * xi_c * c + N_q * xi_q * sigma_zg + N_gamma * xi_gamma * b_p * gamma)
+    # Скальные грунты: Rc в МПа → кПа
+    Nu = np.where(rc[layer_idx] > 0, rc[layer_idx] * 1000.0 * area, Nu)
+    return np.where(idx < 0, 0.0, Nu)
+
+
+def resistance_averaging_depth(foundation: Foundation) -> float:
+    """Толщина слоя усреднения свойств под подошвой для R, м."""
+    b_p, _, _ = reduced_dimensions(foundation)
+    return b_p / 2.0 if b_p <= 10.0 else 4.0 + 0.1 * b_p
+
+
 def design_resistance_R(
     layers: list[SoilLayer],
     foundation: Foundation,
     d: float,
     coef: Coefficients,
+    cache: SoilProfileCache | None = None,
 ) -> float:
     """Расчётное сопротивление R (C.1.3).
 
@@ -75,18 +143,41 @@ def design_resistance_R(
         foundation: Параметры фундамента.
         d: Глубина заглубления, м.
         coef: Коэффициенты надёжности.
+        cache: Кэш разреза (опционально).
 
     Returns:
         R, кПа — расчётное сопротивление.
     """
     b_p, _, _ = reduced_dimensions(foundation)
     kz = 1.0 if b_p < 10.0 else 8.0 / b_p + 0.2
-    z_avg = b_p / 2.0 if b_p <= 10.0 else 4.0 + 0.1 * b_p
+    z_avg = resistance_averaging_depth(foundation)
 
-    gamma_II, phi_II, c_II = average_props_below(layers, d, z_avg)
-    gamma_II_above = average_gamma_above(layers, d)
+    gamma_II, phi_II, c_II = average_props_below(layers, d, z_avg, cache=cache)
+    gamma_II_above = average_gamma_above(layers, d, cache=cache)
     M_gamma, M_q, M_c = resistance_factors(phi_II)
 
     return (coef.gamma_c1 * coef.gamma_c2 / coef.k) * (
         M_gamma * kz * b_p * gamma_II + M_q * d * gamma_II_above + M_c * c_II
     )
+
+
+def design_resistance_R_batch(
+    layers: list[SoilLayer],
+    foundation: Foundation,
+    depths: np.ndarray,
+    coef: Coefficients,
+    cache: SoilProfileCache | None = None,
+) -> np.ndarray:
+    """Векторный вариант design_resistance_R для массива глубин."""
+    depths = np.asarray(depths, dtype=np.float64)
+    b_p, _, _ = reduced_dimensions(foundation)
+    kz = 1.0 if b_p < 10.0 else 8.0 / b_p + 0.2
+    z_avg = resistance_averaging_depth(foundation)
+
+    gamma_II, phi_II, c_II = average_props_below_batch(layers, depths, z_avg, cache=cache)
+    gamma_II_above = average_gamma_above_batch(layers, depths, cache=cache)
+    M_gamma, M_q, M_c = resistance_factors_batch(phi_II)
+
+    return (coef.gamma_c1 * coef.gamma_c2 / coef.k) * (
+        M_gamma * kz * b_p * gamma_II + M_q * depths * gamma_II_above + M_c * c_II
+    )
@@ -2,10 +2,19 @@
 
 import numpy as np
 
-from core.helpers import get_layer_at_depth, additional_stress_boussinesq
-from core.models import Coefficients, Foundation, PointResult, SoilLayer
+from core.helpers import (
+    build_profile_cache,
+    depth_grid,
+    get_layer_at_depth,
+)
+from core.models import Coefficients, Foundation, PointResult, SoilLayer, SoilProfileCache
 
-from .bearing import bearing_capacity_Nu, design_resistance_R
+from .bearing import (
+    bearing_capacity_Nu,
+    bearing_capacity_Nu_batch,
+    design_resistance_R,
+    design_resistance_R_batch,
+)
 
 
 def calculate_point(
@@ -14,6 +23,7 @@ def calculate_point(
     coef: Coefficients,
     F: float,
     d: float,
+    cache: SoilProfileCache | None = None,
 ) -> PointResult:
     """Расчёт для одной глубины d с учётом распределения давления по Буссинеску.
 
@@ -23,25 +33,77 @@ def calculate_point(
         coef: Коэффициенты надёжности.
         F: Вертикальная нагрузка, кН.
         d: Глубина заглубления, м.
+        cache: Кэш разреза (опционально).
 
     Returns:
         PointResult с результатами расчёта.
     """
-    layer = get_layer_at_depth(layers, d)
+    layer, Nu, R = _capacity_at(layers, foundation, coef, d, cache)
+    return _point_result(foundation, coef, F, d, layer, Nu, R)
+
+
+def _capacity_at(
+    layers: list[SoilLayer],
+    foundation: Foundation,
+    coef: Coefficients,
+    d: float,
+    cache: SoilProfileCache | None = None,
+) -> tuple[SoilLayer | None, float, float]:
+    """Слой на глубине d, Nu и R — величины, не зависящие от нагрузки F."""
+    layer = get_layer_at_depth(layers, d, cache=cache)
     if layer is None:
-        return PointResult(d=d, Nu=0.0, R=0.0, p=0.0, eta1=999.0, eta2=999.0, layer_name="Unknown")
+        return None, 0.0, 0.0
+
+    Nu = bearing_capacity_Nu(layers, foundation, d, layer, cache=cache)
+    R = design_resistance_R(layers, foundation, d, coef, cache=cache)
+    return layer, Nu, R
+
+
+def _capacity_batch(
+    layers: list[SoilLayer],
+    foundation: Foundation,
+    coef: Coefficients,
+    depths: np.ndarray,
+    cache: SoilProfileCache,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Индексы слоёв, Nu и R по всей сетке глубин (векторный вариант _capacity_at)."""
+    idx = cache.layer_index_batch(depths)
+    Nu = bearing_capacity_Nu_batch(layers, foundation, depths, cache=cache)
+    R = design_resistance_R_batch(layers, foundation, depths, coef, cache=cache)
+    return idx, np.where(idx < 0, 0.0, Nu), np.where(idx < 0, 0.0, R)
 
-    Nu = bearing_capacity_Nu(layers, foundation, d, layer)
-    R = design_resistance_R(layers, foundation, d, coef)
+
+def _eta_batch(
+    foundation: Foundation,
+    coef: Coefficients,
+    F: float,
+    Nu: np.ndarray,
+    R: np.ndarray,
+) -> tuple[float, np.ndarray, np.ndarray]:
+    """Давление p и коэффициенты η₁, η₂ по массивам Nu и R (как в _point_result)."""
+    p = F / foundation.area_prime
+    with np.errstate(divide="ignore"):
+        eta1 = np.where(Nu > 0, (coef.gamma_lc * F * coef.gamma_n) / Nu, np.inf)
+        eta2 = np.where(R > 0, p / R, np.inf)
+    return p, eta1, eta2
+
+
+def _point_result(
+    foundation: Foundation,
+    coef: Coefficients,
+    F: float,
+    d: float,
+    layer: SoilLayer | None,
+    Nu: float,
+    R: float,
+) -> PointResult:
+    """Коэффициенты использования η₁, η₂ для нагрузки F по готовым Nu и R."""
+    if layer is None:
+        return PointResult.from_values(d=d, Nu=0.0, R=0.0, p=0.0, eta1=999.0, eta2=999.0, layer_name="Unknown")
 
     # Среднее давление под подошвой
     p_avg = F / foundation.area_prime
 
-    # Дополнительное вертикальное напряжение по Буссинеску на глубине d
-    # Для расчёта используем приведённые размеры фундамента
-    b_prime = foundation.b_prime
-    l_prime = foundation.l_prime
-
     # На подошве фундамента (z=0) σ_zp = p, с глубиной затухает
     # Здесь z = 0, так как мы считаем давление непосредственно под подошвой на глубине d
     # Для корректного расчёта нужно учитывать глубину от подошвы, но в данном случае
@@ -51,7 +113,7 @@ def calculate_point(
     eta1 = (coef.gamma_lc * F * coef.gamma_n) / Nu if Nu > 0 else np.inf
     eta2 = p / R if R > 0 else np.inf
 
-    return PointResult(d=d, Nu=Nu, R=R, p=p, eta1=eta1, eta2=eta2, layer_name=layer.name)
+    return PointResult.from_values(d=d, Nu=Nu, R=R, p=p, eta1=eta1, eta2=eta2, layer_name=layer.name)
 
 
 def penetration_curve(
@@ -61,6 +123,7 @@ def penetration_curve(
     F: float,
     d_max: float = 20.0,
     d_step: float = 0.1,
+    cache: SoilProfileCache | None = None,
 ) -> list[PointResult]:
     """Кривая пенетрации Nu(d) и R(d).
 
@@ -71,12 +134,26 @@ def penetration_curve(
         F: Вертикальная нагрузка, кН.
         d_max: Максимальная глубина расчёта, м.
         d_step: Шаг по глубине, м.
+        cache: Кэш разреза (если не задан — строится по layers).
 
     Returns:
         Список PointResult для каждой глубины.
     """
-    depths = np.arange(d_step, d_max + d_step / 2, d_step)
-    return [calculate_point(layers, foundation, coef, F, d) for d in depths]
+    if cache is None:
+        cache = build_profile_cache(layers)
+    depths = depth_grid(d_max, d_step)
+    idx, Nu, R = _capacity_batch(layers, foundation, coef, depths, cache)
+    p, eta1, eta2 = _eta_batch(foundation, coef, F, Nu, R)
+
+    curve = []
+    for d, i, nu, r, eta1_i, eta2_i in zip(depths, idx.tolist(), Nu.tolist(), R.tolist(), eta1.tolist(), eta2.tolist()):
+        if i < 0:
+            curve.append(_point_result(foundation, coef, F, d, None, 0.0, 0.0))
+            continue
+        curve.append(
+            PointResult.from_values(d=d, Nu=nu, R=r, p=p, eta1=eta1_i, eta2=eta2_i, layer_name=cache.layers[i].name)
+        )
+    return curve
 
 
 def find_equilibrium_depth(
@@ -86,6 +163,7 @@ def find_equilibrium_depth(
     F: float,
     d_max: float = 30.0,
     d_step: float = 0.05,
+    cache: SoilProfileCache | None = None,
 ) -> PointResult | None:
     """Найти глубину равновесия (η₁ ≤ 1 и η₂ ≤ 1).
 
@@ -96,12 +174,49 @@ def find_equilibrium_depth(
         F: Вертикальная нагрузка, кН.
         d_max: Максимальная глубина поиска, м.
         d_step: Шаг поиска, м.
+        cache: Кэш разреза (если не задан — строится по layers).
 
     Returns:
         PointResult при выполнении условий, или None если не найдено.
     """
-    for d in np.arange(d_step, d_max + d_step / 2, d_step):
-        res = calculate_point(layers, foundation, coef, F, d)
-        if res.eta1 <= 1.0 and res.eta2 <= 1.0:
-            return res
-    return None
+    return find_equilibrium_depths(layers, foundation, coef, [F], d_max, d_step, cache=cache)[0]
+
+
+def find_equilibrium_depths(
+    layers: list[SoilLayer],
+    foundation: Foundation,
+    coef: Coefficients,
+    loads: list[float],
+    d_max: float = 30.0,
+    d_step: float = 0.05,
+    cache: SoilProfileCache | None = None,
+) -> list[PointResult | None]:
+    """Глубины равновесия сразу для нескольких нагрузок за один проход по глубине.
+
+    Nu и R от нагрузки не зависят, поэтому считаются один раз на всю сетку,
+    а η₁, η₂ — для каждой нагрузки.
+
+    Поиск — полный просмотр сетки, а не бисекция: при слабом слое под прочным
+    η(d) немонотонна, и бисекция может пропустить первую устойчивую глубину.
+    Векторный проход по сетке дешевле серии скалярных расчётов точки.
+
+    Returns:
+        Список PointResult (или None) в порядке loads.
+    """
+    if cache is None:
+        cache = build_profile_cache(layers)
+
+    depths = depth_grid(d_max, d_step)
+    idx, Nu, R = _capacity_batch(layers, foundation, coef, depths, cache)
+
+    found: list[PointResult | None] = []
+    for F in loads:
+        _, eta1, eta2 = _eta_batch(foundation, coef, F, Nu, R)
+        ok = (eta1 <= 1.0) & (eta2 <= 1.0) & (idx >= 0)
+        if not ok.any():
+            found.append(None)
+            continue
+        i = int(np.argmax(ok))
+        layer = cache.layers[idx[i]]
+        found.append(_point_result(foundation, coef, F, depths[i], layer, float(Nu[i]), float(R[i])))
+    return found
@@ -1,13 +1,20 @@
 """Расчёт осадки по СП 22/23 (II группа ПС)."""
 
+import math
+
+import numpy as np
+
 from core.helpers import (
-    get_layer_at_depth,
+    build_profile_cache,
     additional_stress_boussinesq,
+    additional_stress_boussinesq_batch,
+    boussinesq_influence,
+    boussinesq_influence_batch,
     overburden_stress,
     reduced_dimensions,
 )
-from core.models import Foundation, SoilLayer
-from core.russian.tables import stress_coefficient_alpha
+from core.models import Foundation, SoilLayer, SoilProfileCache
+from core.russian.tables import stress_coefficient_alpha, stress_coefficient_alpha_batch
 
 DEFAULT_E = 10.0  # МПа
 
@@ -40,6 +47,79 @@ def vertical_stress(
     return max(0.0, alpha * p_surface)
 
 
+def vertical_stress_batch(
+    p_surface: float,
+    foundation: Foundation,
+    z: np.ndarray,
+    stress_distribution: StressDistribution = "alpha",
+) -> np.ndarray:
+    """Векторный вариант vertical_stress для массива глубин z от подошвы."""
+    b_p, l_p, _ = reduced_dimensions(foundation)
+    z = np.asarray(z, dtype=float)
+
+    if stress_distribution == "boussinesq":
+        sigma = additional_stress_boussinesq_batch(p_surface, b_p, l_p, z)
+    else:
+        sigma = np.maximum(0.0, stress_coefficient_alpha_batch(z, b_p) * p_surface)
+    return np.where(z > 0, sigma, max(0.0, p_surface))
+
+
+def vertical_stress_pair(
+    p_1: float,
+    p_2: float,
+    foundation: Foundation,
+    z: float,
+    stress_distribution: StressDistribution = "alpha",
+) -> tuple[float, float]:
+    """vertical_stress для двух давлений на одной глубине z.
+
+    Коэффициент затухания (α или множитель формулы 6.14) зависит только от z
+    и размеров подошвы, поэтому считается один раз для σzp и σzγ.
+    """
+    b_p, l_p, _ = reduced_dimensions(foundation)
+    if z <= 0:
+        return max(0.0, p_1), max(0.0, p_2)
+
+    if stress_distribution == "boussinesq":
+        if b_p <= 0 or l_p <= 0:
+            return p_1, p_2
+        k = boussinesq_influence(b_p, l_p, z)
+        return max(0.0, (2 * p_1 / math.pi) * k), max(0.0, (2 * p_2 / math.pi) * k)
+
+    alpha = stress_coefficient_alpha(z, b_p)
+    return max(0.0, alpha * p_1), max(0.0, alpha * p_2)
+
+
+def vertical_stress_pair_batch(
+    p_1: float,
+    p_2: float,
+    foundation: Foundation,
+    z: np.ndarray,
+    stress_distribution: StressDistribution = "alpha",
+) -> tuple[np.ndarray, np.ndarray]:
+    """Векторный вариант vertical_stress_pair для массива глубин z от подошвы."""
+    b_p, l_p, _ = reduced_dimensions(foundation)
+    z = np.asarray(z, dtype=float)
+
+    if stress_distribution == "boussinesq":
+        if b_p <= 0 or l_p <= 0:
+            sigma_1, sigma_2 = np.full_like(z, p_1), np.full_like(z, p_2)
+        else:
+            k = boussinesq_influence_batch(b_p, l_p, z)
+            sigma_1 = np.maximum(0.0, (2 * p_1 / np.pi) * k)
+            sigma_2 = np.maximum(0.0, (2 * p_2 / np.pi) * k)
+    else:
+        alpha = stress_coefficient_alpha_batch(z, b_p)
+        sigma_1 = np.maximum(0.0, alpha * p_1)
+        sigma_2 = np.maximum(0.0, alpha * p_2)
+
+    on_base = z <= 0
+    return (
+        np.where(on_base, max(0.0, p_1), sigma_1),
+        np.where(on_base, max(0.0, p_2), sigma_2),
+    )
+
+
 def min_compressible_depth(b: float) -> float:
     """Минимальная глубина сжимаемой толщи Hmin (СП 22.13330 п.5.6.41).
 
@@ -63,6 +143,7 @@ def compressible_depth(
     p: float,
     max_depth: float = 50.0,
     stress_distribution: StressDistribution = "alpha",
+    cache: SoilProfileCache | None = None,
 ) -> float:
     """Глубина сжимаемой толщи Hc.
 
@@ -75,26 +156,38 @@ def compressible_depth(
         p: Среднее давление под подошвой, кПа.
         max_depth: Максимальная глубина поиска, м.
         stress_distribution: "alpha" или "boussinesq".
+        cache: Кэш разреза (опционально).
 
     Returns:
         Hc, м — глубина сжимаемой толщи.
     """
+    if cache is None:
+        cache = build_profile_cache(layers)
     b_p, _, _ = reduced_dimensions(foundation)
     H_min = min_compressible_depth(b_p)
-    sigma_zg_0 = overburden_stress(layers, d)
+    sigma_zg_0 = overburden_stress(layers, d, cache=cache)
 
-    z = 0.1
-    while z <= max_depth:
-        sigma_zp = vertical_stress(p, foundation, z, stress_distribution=stress_distribution)
-        sigma_zg = vertical_stress(sigma_zg_0, foundation, z, stress_distribution=stress_distribution)
+    # Сетка z = 0.1, 0.2, ... накапливается последовательным сложением (cumsum),
+    # как и в исходном пошаговом цикле, — чтобы сравнение z ≥ Hmin не смещалось.
+    z_step = 0.1
+    z_grid = np.cumsum(np.full(int(max_depth / z_step) + 1, z_step))
+    z_grid = z_grid[z_grid <= max_depth]
 
-        layer = get_layer_at_depth(layers, d + z)
-        E = layer.E if layer and layer.E is not None else DEFAULT_E
-        ratio = 0.2 if E <= 7.0 else 0.5
+    # Эпюры σzp и σzg по всей сетке — одним векторным вызовом с общим коэффициентом затухания
+    sigma_zp, sigma_zg = vertical_stress_pair_batch(
+        p, sigma_zg_0, foundation, z_grid, stress_distribution=stress_distribution
+    )
 
-        if sigma_zp <= ratio * sigma_zg and z >= H_min:
-            return z
-        z += 0.1
+    # Модуль деформации E под каждой точкой сетки и порог σzp ≤ k·σzg
+    E_layers = np.array(
+        [layer.E if layer.E is not None else DEFAULT_E for layer in cache.layers] + [DEFAULT_E]
+    )
+    E = E_layers[cache.layer_index_batch(d + z_grid)]  # индекс -1 → DEFAULT_E
+    ratio = np.where(E <= 7.0, 0.2, 0.5)
+
+    reached = (sigma_zp <= ratio * sigma_zg) & (z_grid >= H_min)
+    if reached.any():
+        return float(z_grid[np.argmax(reached)])
 
     return max(H_min, max_depth)
 
@@ -106,6 +199,7 @@ def settlement(
     p: float,
     beta: float = 0.8,
     stress_distribution: StressDistribution = "alpha",
+    cache: SoilProfileCache | None = None,
 ) -> float:
     """Осадка методом послойного суммирования (C.1.4).
 
@@ -118,10 +212,13 @@ def settlement(
         p: Среднее давление под подошвой, кПа.
         beta: Безразмерный коэффициент (по умолчанию 0.8).
         stress_distribution: "alpha" или "boussinesq".
+        cache: Кэш разреза (опционально).
 
     Returns:
         s, м — осадка.
     """
+    if cache is None:
+        cache = build_profile_cache(layers)
     b_p, _, _ = reduced_dimensions(foundation)
     Hc = compressible_depth(
         layers,
@@ -129,39 +226,41 @@ def settlement(
         d,
         p,
         stress_distribution=stress_distribution,
+        cache=cache,
     )
-    sigma_zg_0 = overburden_stress(layers, d)
+    sigma_zg_0 = overburden_stress(layers, d, cache=cache)
 
     h_max = 0.2 * b_p
-    s = 0.0
-    z_cursor = 0.0
-
-    while z_cursor < Hc - 1e-6:
-        # Определяем текущий слой и доступную толщину до его низа
-        depth_abs = d + z_cursor
-        z_top = 0.0
-        current_layer = None
-        for layer in layers:
-            z_bot = z_top + layer.thickness
-            if z_top <= depth_abs < z_bot:
-                current_layer = layer
-                break
-            z_top = z_bot
-
-        if current_layer is None:
-            break
-
-        available = (z_top + current_layer.thickness) - depth_abs
-        h_seg = min(h_max, Hc - z_cursor, available)
-        z_mid = z_cursor + h_seg / 2.0
-
-        sigma_zp = vertical_stress(p, foundation, z_mid, stress_distribution=stress_distribution)
-        sigma_zg = vertical_stress(sigma_zg_0, foundation, z_mid, stress_distribution=stress_distribution)
-        delta_sigma = max(0.0, sigma_zp - sigma_zg)
-
-        E = (current_layer.E if current_layer.E else DEFAULT_E) * 1000  # МПа → кПа
-        s += delta_sigma * h_seg / E
-
-        z_cursor += h_seg
-
-    return beta * s
+    if d < 0 or h_max <= 0 or Hc <= 1e-6:
+        return 0.0
+
+    # Элементарные слои: внутри каждого слоя грунта, попавшего в [d, d + Hc],
+    # отрезки по h_max от кровли слоя (или от подошвы фундамента); последний
+    # отрезок слоя обрезается по его подошве или по Hc. Ниже скважины не считаем.
+    boundaries = cache.columns["boundaries"]
+    tops = np.maximum(boundaries[:-1] - d, 0.0)
+    bots = np.minimum(boundaries[1:] - d, Hc)
+    in_zone = bots > tops
+    if not in_zone.any():
+        return 0.0
+    tops, bots = tops[in_zone], bots[in_zone]
+
+    counts = np.maximum(np.ceil((bots - tops) / h_max - 1e-9), 1).astype(np.intp)
+    layer_of_seg = np.repeat(np.arange(len(tops)), counts)
+    # Номер отрезка внутри своего слоя: 0, 1, …, counts - 1
+    k = np.arange(layer_of_seg.size) - np.repeat(np.cumsum(counts) - counts, counts)
+    z_top = tops[layer_of_seg] + k * h_max
+    z_bot = np.minimum(z_top + h_max, bots[layer_of_seg])
+    h_seg = z_bot - z_top
+    z_mid = z_top + h_seg / 2.0
+
+    # Модуль деформации по слоям, кПа (МПа → кПа)
+    E_kpa = np.array([(layer.E if layer.E else DEFAULT_E) * 1000 for layer in cache.layers])
+    E_seg = E_kpa[in_zone][layer_of_seg]
+
+    sigma_zp, sigma_zg = vertical_stress_pair_batch(
+        p, sigma_zg_0, foundation, z_mid, stress_distribution=stress_distribution
+    )
+    delta_sigma = np.maximum(0.0, sigma_zp - sigma_zg)
+
+    return beta * float(np.sum(delta_sigma * h_seg / E_seg))
@@ -20,26 +20,47 @@ def bearing_capacity_factors(phi_deg: float) -> tuple[float, float, float]:
     if phi_deg < 0:
         raise ValueError(f"Угол трения не может быть отрицательным: {phi_deg}")
 
-    if phi_deg > 45.0:
+    n_gamma, n_q, n_c = bearing_capacity_factors_batch(np.array([phi_deg], dtype=float), stacklevel=3)
+    return float(n_gamma[0]), float(n_q[0]), float(n_c[0])
+
+
+def bearing_capacity_factors_batch(
+    phi_deg: np.ndarray, stacklevel: int = 2
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Векторный вариант bearing_capacity_factors для массива углов φ.
+
+    Формулы те же (точные, без табличной интерполяции); скалярная функция
+    вычисляется через этот вариант, так что результаты совпадают побитово.
+    stacklevel — уровень стека для предупреждения о φ > 45° (обёртки передают 3).
+    """
+    phi_deg = np.asarray(phi_deg, dtype=float)
+    if np.any(phi_deg < 0):
+        raise ValueError(f"Угол трения не может быть отрицательным: {phi_deg.min()}")
+
+    if np.any(phi_deg > 45.0):
         warnings.warn(
-            f"φ = {phi_deg}° > 45°: значение обрезано до 45° (выход за пределы табл. 5.12)",
+            f"φ = {phi_deg.max()}° > 45°: значение обрезано до 45° (выход за пределы табл. 5.12)",
             UserWarning,
-            stacklevel=2,
+            stacklevel=stacklevel,
         )
     phi = np.clip(phi_deg, 0.0, 45.0)
     phi_rad = np.radians(phi)
-
-    if phi < 0.1:
-        return 0.0, 1.0, 5.14
+    small = phi < 0.1
 
     sin_phi = np.sin(phi_rad)
     tan_phi = np.tan(phi_rad)
 
-    n_q = ((1.0 + sin_phi) / (1.0 - sin_phi)) * np.exp(np.pi * tan_phi)
-    n_c = (n_q - 1.0) / tan_phi
-    n_gamma = (n_q - 1.0) * np.tan(1.4 * phi_rad)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        n_q = ((1.0 + sin_phi) / (1.0 - sin_phi)) * np.exp(np.pi * tan_phi)
+        n_c = (n_q - 1.0) / tan_phi
+        n_gamma = (n_q - 1.0) * np.tan(1.4 * phi_rad)
 
-    return float(n_gamma), float(n_q), float(n_c)
+    # При φ → 0: Nγ = 0, Nq = 1, Nc = 5.14
+    return (
+        np.where(small, 0.0, n_gamma),
+        np.where(small, 1.0, n_q),
+        np.where(small, 5.14, n_c),
+    )
 
 
 # --- Табл. 5.5 — Коэффициенты Mγ, Mq, Mc ---
@@ -93,6 +114,25 @@ def resistance_factors(phi_deg: float) -> tuple[float, float, float]:
     )
 
 
+def resistance_factors_batch(phi_deg: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Векторный вариант resistance_factors для массива углов φ."""
+    phi_deg = np.asarray(phi_deg, dtype=float)
+    if np.any(phi_deg < 0):
+        raise ValueError(f"Угол трения не может быть отрицательным: {phi_deg.min()}")
+    if np.any(phi_deg > 45.0):
+        warnings.warn(
+            f"φ = {phi_deg.max()}° > 45°: значение обрезано до 45° (выход за пределы табл. 5.5)",
+            UserWarning,
+            stacklevel=2,
+        )
+    phi = np.clip(phi_deg, 0.0, 45.0)
+    return (
+        np.interp(phi, _PHI_M, _M_GAMMA),
+        np.interp(phi, _PHI_M, _M_Q),
+        np.interp(phi, _PHI_M, _M_C),
+    )
+
+
 # --- Табл. 5.8 — Коэффициент α распределения напряжений ---
 
 _XI = np.array([
@@ -113,3 +153,12 @@ def stress_coefficient_alpha(z: float, b: float) -> float:
     if b <= 0 or z <= 0:
         return 1.0
     return float(np.interp(2.0 * z / b, _XI, _ALPHA))
+
+
+def stress_coefficient_alpha_batch(z: np.ndarray, b: float) -> np.ndarray:
+    """Векторный вариант stress_coefficient_alpha для массива глубин z."""
+    z = np.asarray(z, dtype=float)
+    if b <= 0:
+        return np.ones_like(z)
+    # np.interp ограничивает аргумент узлами таблицы: при z ≤ 0 даёт α = 1
+    return np.interp(2.0 * z / b, _XI, _ALPHA)
@@ -20,14 +20,17 @@ from .bearing import (
     bearing_capacity_punch_through_clay,
     bearing_capacity_punch_through_sand_clay,
     bearing_capacity_Qv,
+    bearing_capacity_Qv_batch,
     bearing_capacity_sand,
     bearing_capacity_squeezing,
     bearing_capacity_Vl,
+    bearing_capacity_Vl_batch,
 )
 from core.helpers import (
     buoyancy_force,
     cavity_depth,
     cavity_depth_ratio,
+    cavity_depth_ratio_batch,
     get_drainage,
     is_dual_drainage,
     min_backfill_weight,
@@ -47,6 +50,7 @@ __all__ = [
     "is_dual_drainage",
     "spud_cone_volume",
     "cavity_depth_ratio",
+    "cavity_depth_ratio_batch",
     "cavity_depth",
     "min_backfill_weight",
     "buoyancy_force",
@@ -57,7 +61,9 @@ __all__ = [
     "bearing_capacity_punch_through_clay",
     "bearing_capacity_punch_through_sand_clay",
     "bearing_capacity_Qv",
+    "bearing_capacity_Qv_batch",
     "bearing_capacity_Vl",
+    "bearing_capacity_Vl_batch",
     # Penetration
     "calculate_point",
     "penetration_curve",
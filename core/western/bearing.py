@@ -6,6 +6,8 @@
 - Итоговые Qv и Vl
 """
 
+import math
+from bisect import bisect_left, bisect_right
 from dataclasses import dataclass
 
 import numpy as np
@@ -13,38 +15,36 @@ import numpy as np
 from core.helpers import (
     average_cu_below,
     average_sand_props_below,
+    build_profile_cache,
     buoyancy_force,
     cavity_depth,
+    cavity_depth_ratio_batch,
     cu_variability_ratio,
-    get_drainage,
     get_layer_at_depth,
-    is_dual_drainage,
     min_backfill_weight,
     overburden_stress,
-    spud_cone_volume,
 )
 from core.western.tables import (
     NC_CLAY,
     bearing_factors_sand,
+    bearing_factors_sand_batch,
     clay_factor_iso_table_23_1,
+    clay_factor_iso_table_23_1_batch,
     depth_factors_sand,
+    depth_factors_sand_batch,
     punch_through_coefficient_Ks,
     shape_factor_clay,
     shape_factors_sand,
+    shape_factors_sand_batch,
 )
 from core.models import Foundation, SoilLayer, SoilProfileCache
 
 
-def _min_positive(values: list[float]) -> float:
-    valid = [v for v in values if v > 0]
-    return min(valid) if valid else 0.0
-
-
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LayerWindow:
-    layer: SoilLayer
+    """Слой в зоне влияния под подошвой: границы обрезаны по [d, d + 1.5·B]."""
+
     z_top: float
-    z_bot: float
     H: float
     drainage: str
     is_dual: bool
@@ -56,6 +56,9 @@ class LayerWindow:
 # =============================================================================
 # Несущая способность однородной толщи
 # =============================================================================
+#
+# Каждый механизм задан парой: скалярная функция на float (для отдельной точки)
+# и векторный вариант _batch для сетки глубин кривой пенетрации.
 
 
 def bearing_capacity_clay(
@@ -67,10 +70,10 @@ def bearing_capacity_clay(
     """Несущая способность для глин (недренированные условия) (C.2.7).
 
     Fv = (cu·Nc·sc·dc + p0')·A
-    
+
     Согласно C.2.7: cu — усреднённая в пределах характерной глубины (~1.0·B).
     """
-    layer = get_layer_at_depth(layers, d)
+    layer = get_layer_at_depth(layers, d, cache=cache)
     if layer is None:
         return 0.0
 
@@ -86,7 +89,7 @@ def bearing_capacity_clay(
     cu = average_cu_below(layers, d, influence_depth, cache=cache)
     if cu <= 0:
         # Fallback на точечное значение
-        cu = layer.cu if layer.cu is not None else layer.c
+        cu = layer.cu_or_c_if_unset
     if cu <= 0:
         return 0.0
 
@@ -98,6 +101,52 @@ def bearing_capacity_clay(
     return (cu * ncsdc + p0_prime) * A
 
 
+def _cu_variability_batch(cache: SoilProfileCache, depths: np.ndarray, z_thickness: float) -> np.ndarray:
+    """Векторный вариант cu_variability_ratio: цикл по слоям, а не по глубинам."""
+    boundaries = cache.boundaries
+    z_end = depths + z_thickness
+    cu_min = np.full_like(depths, np.inf)
+    cu_max = np.full_like(depths, -np.inf)
+
+    for i, cu_val in enumerate(cache.cu):
+        if cu_val <= 0:
+            continue
+        h = np.minimum(boundaries[i + 1], z_end) - np.maximum(boundaries[i], depths)
+        cu_min = np.where(h > 0, np.minimum(cu_min, cu_val), cu_min)
+        cu_max = np.where(h > 0, np.maximum(cu_max, cu_val), cu_max)
+
+    # Экстраполяция за пределами скважины последним слоем
+    cu_val = cache.cu[-1]
+    if cu_val > 0:
+        below = z_end > cache.total_thickness
+        cu_min = np.where(below, np.minimum(cu_min, cu_val), cu_min)
+        cu_max = np.where(below, np.maximum(cu_max, cu_val), cu_max)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(cu_max > 0, (cu_max - cu_min) / cu_max, 0.0)
+
+
+def _clay_batch(
+    cache: SoilProfileCache, foundation: Foundation, depths: np.ndarray, idx: np.ndarray
+) -> np.ndarray:
+    """bearing_capacity_clay для массива глубин (idx — слой на глубине, для fallback по cu)."""
+    B = foundation.B_eff
+
+    # C.2.3.1: при сильной изменчивости cu (>50% на глубину B) усредняем на B, иначе на B/2
+    variable = _cu_variability_batch(cache, depths, B) > 0.5
+    cu = cache.average_below_batch("cu", depths, 0.5 * B, 0.0)
+    if variable.any():
+        cu = np.where(variable, cache.average_below_batch("cu", depths, B, 0.0), cu)
+    # Fallback на точечное значение
+    cu = np.where(cu <= 0, cache.columns["cu"][idx], cu)
+    p0_prime = cache.overburden_stress_batch(depths)
+
+    # Табл. 2.3-1 (ISO/ГОСТ): используем табличный множитель Nc·s·dc
+    # (в текущей реализации принят как основной способ для глин).
+    ncsdc = clay_factor_iso_table_23_1_batch(depths / B)
+    return np.where(cu > 0, (cu * ncsdc + p0_prime) * foundation.area_prime, 0.0)
+
+
 def bearing_capacity_sand(
     layers: list[SoilLayer],
     foundation: Foundation,
@@ -107,10 +156,10 @@ def bearing_capacity_sand(
     """Несущая способность для песков (дренированные условия) (C.2.9).
 
     Fv = (0.5·γ'·B·Nγ·sγ·dγ + p0'·Nq·sq·dq)·A
-    
+
     Свойства усредняются в зоне деформации (~1.0·B).
     """
-    layer = get_layer_at_depth(layers, d)
+    layer = get_layer_at_depth(layers, d, cache=cache)
     if layer is None:
         return 0.0
 
@@ -121,7 +170,7 @@ def bearing_capacity_sand(
     # Усреднённые свойства в зоне деформации ~1.0·B
     influence_depth = B
     phi, gamma_prime = average_sand_props_below(layers, d, influence_depth, cache=cache)
-    
+
     if phi <= 0:
         # Fallback на точечное значение
         phi = layer.phi
@@ -139,6 +188,40 @@ def bearing_capacity_sand(
     ) * A
 
 
+def _sand_batch(
+    cache: SoilProfileCache, foundation: Foundation, depths: np.ndarray, idx: np.ndarray
+) -> np.ndarray:
+    """bearing_capacity_sand для массива глубин (формулы C.2.9 массивами NumPy)."""
+    B = foundation.B_eff
+    L = B  # круглый башмак в западной методике
+
+    # Усреднённые свойства в зоне деформации ~1.0·B; fallback φ — точечное значение
+    phi = cache.average_below_batch("phi", depths, B, cache.phi[-1])
+    gamma_prime = cache.average_below_batch("gamma_prime", depths, B, cache.gamma_prime[-1])
+    phi = np.where(phi <= 0, cache.columns["phi"][idx], phi)
+
+    N_gamma, N_q = bearing_factors_sand_batch(phi)
+    s_gamma, s_q = shape_factors_sand_batch(B, L, phi)
+    d_gamma, d_q = depth_factors_sand_batch(depths, B, phi)
+    p0_prime = cache.overburden_stress_batch(depths)
+
+    Fv = (
+        0.5 * gamma_prime * B * N_gamma * s_gamma * d_gamma
+        + p0_prime * N_q * s_q * d_q
+    ) * foundation.area_prime
+    return np.where(phi > 0, Fv, 0.0)
+
+
+def _general_shear_batch(
+    cache: SoilProfileCache, foundation: Foundation, depths: np.ndarray, drainage: str
+) -> np.ndarray:
+    """Общий сдвиг: глина при undrained, иначе песок."""
+    idx = cache._layer_indices(depths)
+    if drainage == "undrained":
+        return _clay_batch(cache, foundation, depths, idx)
+    return _sand_batch(cache, foundation, depths, idx)
+
+
 # =============================================================================
 # Несущая способность слоистых толщ
 # =============================================================================
@@ -172,11 +255,10 @@ def bearing_capacity_squeezing(
     sc = shape_factor_clay(B, B)  # круглый башмак
     dc = 1.0 + 0.2 * (d / B)
 
-    p0_prime = overburden_stress(layers, d, cache=cache)
     squeeze_factor = a + b * (B / T) + 1.2 * (d / B)
 
     # C.2.12 / C.2.13: без/с back-flow (в методике p0' отсутствует для full back-flow)
-    add_overburden = 0.0 if use_backflow else p0_prime
+    add_overburden = 0.0 if use_backflow else overburden_stress(layers, d, cache=cache)
 
     Fv_squeeze = A * (squeeze_factor * cu_weak + add_overburden)
     Fv_limit = A * (NC_CLAY * sc * dc * cu_weak + add_overburden)
@@ -184,6 +266,41 @@ def bearing_capacity_squeezing(
     return min(Fv_squeeze, Fv_limit)
 
 
+def _squeezing_batch(
+    cache: SoilProfileCache,
+    foundation: Foundation,
+    depths: np.ndarray,
+    T: np.ndarray,
+    cu_weak: float,
+    use_backflow: bool,
+) -> np.ndarray:
+    """Векторный вариант bearing_capacity_squeezing (толщина T — по глубинам)."""
+    B = foundation.B_eff
+    A = foundation.area_prime
+    if cu_weak <= 0 or B <= 0 or A <= 0:
+        return np.zeros_like(depths)
+
+    # Условия применимости squeezing (C.2.3.4.1):
+    # SNAME: B ≥ 3.45·T·(1 + 1.1·D/B)
+    # ISO 19905-1/ГОСТ: B ≥ 3.45·T·(1 + 1.025·D/B) при D/B ≤ 2.5
+    ratio = depths / B
+    k_iso = np.where(ratio <= 2.5, 1.025, 1.1)
+    applicable = (T > 0) & (B >= 3.45 * T * (1.0 + k_iso * ratio))
+
+    a, b = 5.0, 0.33  # Meyerhof & Chaplin (рекомендовано)
+    sc = shape_factor_clay(B, B)  # круглый башмак
+    dc = 1.0 + 0.2 * (depths / B)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        squeeze_factor = a + b * (B / T) + 1.2 * (depths / B)
+
+    # C.2.12 / C.2.13: без/с back-flow (в методике p0' отсутствует для full back-flow)
+    add_overburden = 0.0 if use_backflow else cache.overburden_stress_batch(depths)
+
+    Fv_squeeze = A * (squeeze_factor * cu_weak + add_overburden)
+    Fv_limit = A * (NC_CLAY * sc * dc * cu_weak + add_overburden)
+    return np.where(applicable, np.minimum(Fv_squeeze, Fv_limit), 0.0)
+
+
 def bearing_capacity_punch_through_clay(
     layers: list[SoilLayer],
     foundation: Foundation,
@@ -202,7 +319,6 @@ def bearing_capacity_punch_through_clay(
         return 0.0
 
     sc = shape_factor_clay(B, B)  # круглый башмак
-    p0_prime = overburden_stress(layers, d, cache=cache)
 
     # C.2.14 (Brown & Meyerhof, 1969) — как базовый консервативный вариант
     Fv_c214_punch = A * (3.0 * (H / B) * cu_top + NC_CLAY * sc * cu_bottom)
@@ -210,8 +326,9 @@ def bearing_capacity_punch_through_clay(
     Fv_c214 = min(Fv_c214_punch, Fv_c214_upper)
 
     # C.2.15 / C.2.16 (SNAME): для глубокого заложения, с/без back-flow
-    dc_bottom = 1.0 + 0.2 * ((d + H) / B) if B > 0 else 1.0
-    add_overburden = 0.0 if use_backflow else p0_prime
+    dc_bottom = 1.0 + 0.2 * ((d + H) / B)
+    # p0' нужен только без back-flow
+    add_overburden = 0.0 if use_backflow else overburden_stress(layers, d, cache=cache)
 
     left = 3.0 * (H / B) * cu_top + NC_CLAY * sc * dc_bottom * cu_bottom + add_overburden
     Fv_left = A * left
@@ -225,6 +342,42 @@ def bearing_capacity_punch_through_clay(
     return min(Fv_c214, Fv_c215_216)
 
 
+def _punch_through_clay_batch(
+    cache: SoilProfileCache,
+    foundation: Foundation,
+    depths: np.ndarray,
+    H: np.ndarray,
+    cu_top: float,
+    cu_bottom: float,
+    use_backflow: bool,
+) -> np.ndarray:
+    """Векторный вариант bearing_capacity_punch_through_clay."""
+    B = foundation.B_eff
+    A = foundation.area_prime
+    if cu_top <= 0 or B <= 0 or A <= 0:
+        return np.zeros_like(depths)
+
+    sc = shape_factor_clay(B, B)  # круглый башмак
+
+    # C.2.14 (Brown & Meyerhof, 1969) — как базовый консервативный вариант
+    Fv_c214_punch = A * (3.0 * (H / B) * cu_top + NC_CLAY * sc * cu_bottom)
+    Fv_c214_upper = A * (NC_CLAY * sc * cu_top)
+    Fv_c214 = np.minimum(Fv_c214_punch, Fv_c214_upper)
+
+    # C.2.15 / C.2.16 (SNAME): для глубокого заложения, с/без back-flow
+    dc_bottom = 1.0 + 0.2 * ((depths + H) / B)
+    # p0' нужен только без back-flow
+    add_overburden = 0.0 if use_backflow else cache.overburden_stress_batch(depths)
+
+    left = 3.0 * (H / B) * cu_top + NC_CLAY * sc * dc_bottom * cu_bottom + add_overburden
+    Fv_left = A * left
+
+    # Правая часть (однородная глина верхнего слоя): Nc·sc·dc берём из табл. 2.3-1
+    Fv_right = A * (cu_top * clay_factor_iso_table_23_1_batch(depths / B) + add_overburden)
+
+    return np.minimum(Fv_c214, np.minimum(Fv_left, Fv_right))
+
+
 def _punch_through_load_spread(
     layers: list[SoilLayer],
     foundation: Foundation,
@@ -243,11 +396,13 @@ def _punch_through_load_spread(
     if H_sand <= 0 or cu_clay <= 0:
         return 0.0
 
-    B_star = B + 2.0 * H_sand / n
-    A_star = (1.0 + 2.0 * H_sand / (n * B)) ** 2 * A
+    # Уширение основания на кровле глины: по H/n с каждой стороны
+    spread = 2.0 * H_sand / n
+    B_star = B + spread
+    A_star = (1.0 + spread / B) ** 2 * A
 
     Nc = NC_CLAY
-    sc = shape_factor_clay(B_star, L + 2.0 * H_sand / n)
+    sc = shape_factor_clay(B_star, L + spread)
 
     p0_prime = overburden_stress(layers, d + H_sand, cache=cache)
     Fv_b = (cu_clay * Nc * sc + p0_prime) * A_star
@@ -256,6 +411,37 @@ def _punch_through_load_spread(
     return max(0.0, Fv_b - W)
 
 
+def _punch_through_load_spread_batch(
+    cache: SoilProfileCache,
+    foundation: Foundation,
+    depths: np.ndarray,
+    H_sand: np.ndarray,
+    gamma_sand: float,
+    cu_clay: float,
+    n: float,
+) -> np.ndarray:
+    """Векторный вариант _punch_through_load_spread."""
+    B = foundation.B_eff
+    L = B
+    A = foundation.area_prime
+    if cu_clay <= 0:
+        return np.zeros_like(depths)
+
+    # Уширение основания на кровле глины: по H/n с каждой стороны
+    spread = 2.0 * H_sand / n
+    B_star = B + spread
+    A_star = (1.0 + spread / B) ** 2 * A
+
+    # sc = shape_factor_clay(B*, L + spread) для массива уширений
+    sc = 1.0 + (1.0 / NC_CLAY) * (B_star / (L + spread))
+
+    p0_prime = cache.overburden_stress_batch(depths + H_sand)
+    Fv_b = (cu_clay * NC_CLAY * sc + p0_prime) * A_star
+    W = A_star * H_sand * gamma_sand
+
+    return np.where(H_sand > 0, np.maximum(0.0, Fv_b - W), 0.0)
+
+
 def _punch_through_ks_shear(
     layers: list[SoilLayer],
     foundation: Foundation,
@@ -268,8 +454,6 @@ def _punch_through_ks_shear(
 ) -> float:
     """Метод сдвига Ks (Punching Shear, C.2.19)."""
     B = foundation.B_eff
-    L = B
-    A = foundation.area_prime
 
     if H_sand <= 0 or cu_clay <= 0 or phi_sand <= 0:
         return 0.0
@@ -282,15 +466,42 @@ def _punch_through_ks_shear(
     )
 
     Ks = punch_through_coefficient_Ks(cu_clay, gamma_sand, B, phi_sand)
-    tan_phi = np.tan(np.radians(phi_sand))
+    tan_phi = math.tan(math.radians(phi_sand))
     sigma_v_avg = gamma_sand * H_sand / 2.0
-    perimeter = np.pi * B
+    perimeter = math.pi * B
     As = perimeter * H_sand
     T_side = Ks * tan_phi * sigma_v_avg * As
 
     return max(0.0, Qv_clay + T_side)
 
 
+def _punch_through_ks_shear_batch(
+    cache: SoilProfileCache,
+    foundation: Foundation,
+    depths: np.ndarray,
+    H_sand: np.ndarray,
+    phi_sand: float,
+    gamma_sand: float,
+    cu_clay: float,
+) -> np.ndarray:
+    """Векторный вариант _punch_through_ks_shear."""
+    B = foundation.B_eff
+    if cu_clay <= 0 or phi_sand <= 0:
+        return np.zeros_like(depths)
+
+    z_clay = depths + H_sand
+    Qv_clay = _clay_batch(cache, foundation, z_clay, cache._layer_indices(z_clay))
+
+    Ks = punch_through_coefficient_Ks(cu_clay, gamma_sand, B, phi_sand)
+    tan_phi = math.tan(math.radians(phi_sand))
+    sigma_v_avg = gamma_sand * H_sand / 2.0
+    perimeter = math.pi * B
+    As = perimeter * H_sand
+    T_side = Ks * tan_phi * sigma_v_avg * As
+
+    return np.where(H_sand > 0, np.maximum(0.0, Qv_clay + T_side), 0.0)
+
+
 def _punch_through_backflow_method(
     layers: list[SoilLayer],
     foundation: Foundation,
@@ -317,7 +528,6 @@ def _punch_through_backflow_method(
       - Fv,b: несущая способность фиктивного основания на кровле глины (без засыпки)
     """
     B = foundation.B_eff
-    L = B
     A = foundation.area_prime
 
     if B <= 0 or A <= 0 or H_sand <= 0 or gamma_sand <= 0 or phi_sand <= 0 or cu_clay <= 0:
@@ -330,8 +540,8 @@ def _punch_through_backflow_method(
     z_clay = d + H_sand
     cu_b = average_cu_below(layers, z_clay, 0.5 * B, cache=cache)
     if cu_b <= 0:
-        layer_clay = get_layer_at_depth(layers, z_clay)
-        cu_b = (layer_clay.cu if layer_clay and layer_clay.cu is not None else (layer_clay.c if layer_clay else 0.0))
+        layer_clay = get_layer_at_depth(layers, z_clay, cache=cache)
+        cu_b = layer_clay.cu_or_c_if_unset if layer_clay else 0.0
     p0_prime_clay = overburden_stress(layers, z_clay, cache=cache)
     Fv_b = (cu_b * clay_factor_iso_table_23_1(0.0) + p0_prime_clay) * A
 
@@ -345,6 +555,42 @@ def _punch_through_backflow_method(
     return max(0.0, Fv_b - W_plug - W_backflow + term)
 
 
+def _punch_through_backflow_batch(
+    cache: SoilProfileCache,
+    foundation: Foundation,
+    depths: np.ndarray,
+    H_sand: np.ndarray,
+    phi_sand: float,
+    gamma_sand: float,
+    cu_clay: float,
+    backflow_height: np.ndarray,
+) -> np.ndarray:
+    """Векторный вариант _punch_through_backflow_method."""
+    B = foundation.B_eff
+    A = foundation.area_prime
+    if B <= 0 or A <= 0 or gamma_sand <= 0 or phi_sand <= 0 or cu_clay <= 0:
+        return np.zeros_like(depths)
+
+    # p0' на глубине подошвы (в формуле используется для среднего напряжения вдоль поверхности сдвига)
+    p0_prime = cache.overburden_stress_batch(depths)
+
+    # Fv,b: на кровле глины (C.2.3.1), при D/B=0 (по табл. 2.3-1) и без обратной засыпки в подошве.
+    z_clay = depths + H_sand
+    cu_b = cache.average_below_batch("cu", z_clay, 0.5 * B, 0.0)
+    cu_b = np.where(cu_b <= 0, cache.columns["cu"][cache._layer_indices(z_clay)], cu_b)
+    p0_prime_clay = cache.overburden_stress_batch(z_clay)
+    Fv_b = (cu_b * clay_factor_iso_table_23_1(0.0) + p0_prime_clay) * A
+
+    # Ks·tanφ ≈ 3·cu / (B·γ') (C.2.19)
+    Ks_tan_phi = 3.0 * cu_clay / (B * gamma_sand)
+
+    term = 2.0 * (H_sand / B) * (H_sand * gamma_sand + 2.0 * p0_prime) * Ks_tan_phi * A
+    W_plug = A * H_sand * gamma_sand
+    W_backflow = A * np.maximum(0.0, backflow_height) * gamma_sand
+
+    return np.where(H_sand > 0, np.maximum(0.0, Fv_b - W_plug - W_backflow + term), 0.0)
+
+
 def bearing_capacity_punch_through_sand_clay(
     layers: list[SoilLayer],
     foundation: Foundation,
@@ -363,7 +609,7 @@ def bearing_capacity_punch_through_sand_clay(
     - Load Spread с n=3
     - Load Spread с n=5
     - Ks Shear (punching shear)
-    
+
     По документу: расчёт для n=3 и n=5 с выбором минимума.
     """
     if H_sand <= 0 or cu_clay <= 0:
@@ -396,7 +642,7 @@ def bearing_capacity_punch_through_sand_clay(
         layers, foundation, d, H_sand, gamma_sand, cu_clay, n=5.0, cache=cache
     )
     Fv_load_spread = min(Fv_load_spread_n3, Fv_load_spread_n5)
-    
+
     # Ks Shear метод
     Fv_ks_shear = _punch_through_ks_shear(
         layers,
@@ -409,9 +655,46 @@ def bearing_capacity_punch_through_sand_clay(
         cache=cache,
     )
 
-    candidates = [Fv_c217_218, Fv_load_spread, Fv_ks_shear]
-    valid = [v for v in candidates if v > 0]
-    return min(valid) if valid else 0.0
+    candidates = (Fv_c217_218, Fv_load_spread, Fv_ks_shear)
+    return min((v for v in candidates if v > 0), default=0.0)
+
+
+def _punch_through_sand_clay_batch(
+    cache: SoilProfileCache,
+    foundation: Foundation,
+    depths: np.ndarray,
+    H_sand: np.ndarray,
+    phi_sand: float,
+    gamma_sand: float,
+    cu_clay: float,
+    use_backflow: bool,
+) -> np.ndarray:
+    """Векторный вариант bearing_capacity_punch_through_sand_clay."""
+    if cu_clay <= 0:
+        return np.zeros_like(depths)
+
+    # C.2.17 / C.2.18: в рамках C.2.18 принимаем full back-flow — высота I = D
+    backflow_height = np.maximum(0.0, depths) if use_backflow else np.zeros_like(depths)
+    Fv_c217_218 = _punch_through_backflow_batch(
+        cache, foundation, depths, H_sand, phi_sand, gamma_sand, cu_clay, backflow_height
+    )
+
+    # Load Spread для n=3 и n=5, берём минимум (по документу C.2.20)
+    Fv_load_spread = np.minimum(
+        _punch_through_load_spread_batch(cache, foundation, depths, H_sand, gamma_sand, cu_clay, 3.0),
+        _punch_through_load_spread_batch(cache, foundation, depths, H_sand, gamma_sand, cu_clay, 5.0),
+    )
+
+    # Ks Shear метод
+    Fv_ks_shear = _punch_through_ks_shear_batch(
+        cache, foundation, depths, H_sand, phi_sand, gamma_sand, cu_clay
+    )
+
+    best = np.full_like(depths, math.inf)
+    for values in (Fv_c217_218, Fv_load_spread, Fv_ks_shear):
+        best = _min_positive_update(best, values)
+    return np.where((H_sand > 0) & (best < math.inf), best, 0.0)
+
 
 # =============================================================================
 # Трёхслойный анализ (C.2.3.4.4)
@@ -419,45 +702,163 @@ def bearing_capacity_punch_through_sand_clay(
 
 
 def _collect_layer_params(
-    layers: list[SoilLayer], d: float, influence_depth: float, max_layers: int = 3
+    layers: list[SoilLayer],
+    d: float,
+    influence_depth: float,
+    max_layers: int = 3,
+    cache: SoilProfileCache | None = None,
 ) -> list[LayerWindow]:
     """Собрать параметры слоёв в зоне влияния."""
-    z = 0.0
+    if cache is None:
+        cache = build_profile_cache(layers)
+
+    boundaries = cache.boundaries
+    drainage, is_dual = cache.drainage
+    z_end = d + influence_depth
+
+    # Слои зоны влияния — непрерывный диапазон индексов: от первого слоя с подошвой
+    # ниже d до последнего с кровлей выше d + influence_depth (не более max_layers)
+    lo = bisect_right(boundaries, d, 1) - 1
+    hi = min(bisect_left(boundaries, z_end, 0, len(cache.layers)), lo + max_layers)
+
     layer_params: list[LayerWindow] = []
-    
-    for lyr in layers:
-        z_top = z
-        z_bot = z + lyr.thickness
-        z = z_bot
-        
-        if z_bot <= d:
-            continue
-        if z_top >= d + influence_depth:
-            break
-            
-        z_top_clip = max(z_top, d)
-        z_bot_clip = min(z_bot, d + influence_depth)
+    for i in range(lo, hi):
+        lyr = cache.layers[i]
+        z_top_clip = max(boundaries[i], d)
+        z_bot_clip = min(boundaries[i + 1], z_end)
         layer_params.append(
             LayerWindow(
-                layer=lyr,
                 z_top=z_top_clip,
-                z_bot=z_bot_clip,
                 H=z_bot_clip - z_top_clip,
-                drainage=get_drainage(lyr),
-                is_dual=is_dual_drainage(lyr),
-                cu=lyr.cu if lyr.cu else lyr.c,
+                drainage=drainage[i],
+                is_dual=is_dual[i],
+                cu=lyr.cu_or_c,
                 phi=lyr.phi,
                 gamma=lyr.gamma_prime,
             )
         )
-        
-        if len(layer_params) >= max_layers:
-            break
-    
+
     return layer_params
 
 
-def _two_layer_results(
+def _min_positive_update(best: np.ndarray, values: np.ndarray) -> np.ndarray:
+    """Поэлементно заменить best на values там, где 0 < values < best."""
+    return np.where((values > 0) & (values < best), values, best)
+
+
+def _sand_over_clay(
+    layers: list[SoilLayer],
+    foundation: Foundation,
+    d: float,
+    top: LayerWindow,
+    bottom: LayerWindow,
+    use_backfill: bool,
+    cache: SoilProfileCache | None,
+) -> float:
+    """Песок над глиной: протыкание (C.2.17–C.2.20)."""
+    return bearing_capacity_punch_through_sand_clay(
+        layers,
+        foundation,
+        d,
+        top.H,
+        top.phi,
+        top.gamma,
+        bottom.cu,
+        use_backflow=use_backfill,
+        cache=cache,
+    )
+
+
+def _clay_over_clay(
+    layers: list[SoilLayer],
+    foundation: Foundation,
+    d: float,
+    top: LayerWindow,
+    bottom: LayerWindow,
+    use_backfill: bool,
+    cache: SoilProfileCache | None,
+) -> float:
+    """Глина над глиной: протыкание в слабый слой или выдавливание слабого слоя."""
+    if top.cu > bottom.cu:
+        return bearing_capacity_punch_through_clay(
+            layers,
+            foundation,
+            d,
+            top.H,
+            top.cu,
+            bottom.cu,
+            use_backflow=use_backfill,
+            cache=cache,
+        )
+    if bottom.cu > top.cu:
+        return bearing_capacity_squeezing(
+            layers,
+            foundation,
+            d,
+            top.H,
+            top.cu,
+            use_backflow=use_backfill,
+            cache=cache,
+        )
+    return 0.0
+
+
+# Механизмы двухслойной схемы по условиям дренирования (верхний, нижний слой)
+_TWO_LAYER_MECHANISMS = {
+    ("drained", "undrained"): _sand_over_clay,
+    ("undrained", "undrained"): _clay_over_clay,
+}
+
+
+def _sand_over_clay_batch(
+    cache: SoilProfileCache,
+    foundation: Foundation,
+    depths: np.ndarray,
+    H_top: np.ndarray,
+    top: SoilLayer,
+    bottom: SoilLayer,
+    use_backfill: bool,
+) -> np.ndarray:
+    """Песок над глиной: протыкание (C.2.17–C.2.20)."""
+    return _punch_through_sand_clay_batch(
+        cache,
+        foundation,
+        depths,
+        H_top,
+        top.phi,
+        top.gamma_prime,
+        bottom.cu_or_c,
+        use_backfill,
+    )
+
+
+def _clay_over_clay_batch(
+    cache: SoilProfileCache,
+    foundation: Foundation,
+    depths: np.ndarray,
+    H_top: np.ndarray,
+    top: SoilLayer,
+    bottom: SoilLayer,
+    use_backfill: bool,
+) -> np.ndarray:
+    """Глина над глиной: протыкание в слабый слой или выдавливание слабого слоя."""
+    cu_top = top.cu_or_c
+    cu_bottom = bottom.cu_or_c
+    if cu_top > cu_bottom:
+        return _punch_through_clay_batch(cache, foundation, depths, H_top, cu_top, cu_bottom, use_backfill)
+    if cu_bottom > cu_top:
+        return _squeezing_batch(cache, foundation, depths, H_top, cu_top, use_backfill)
+    return np.zeros_like(depths)
+
+
+# Векторные варианты тех же механизмов
+_TWO_LAYER_MECHANISMS_BATCH = {
+    ("drained", "undrained"): _sand_over_clay_batch,
+    ("undrained", "undrained"): _clay_over_clay_batch,
+}
+
+
+def _two_layer_min(
     layers: list[SoilLayer],
     foundation: Foundation,
     d: float,
@@ -467,62 +868,67 @@ def _two_layer_results(
     cache: SoilProfileCache | None,
     include_general_shear: bool,
     allow_dual: bool,
-) -> list[float]:
-    """Сформировать список кандидатов для двухслойной схемы."""
-    results: list[float] = []
-    drainages_top = ["drained", "undrained"] if allow_dual and top.is_dual else [top.drainage]
-    drainages_bot = ["drained", "undrained"] if allow_dual and bottom.is_dual else [bottom.drainage]
+) -> float:
+    """Минимальная положительная оценка по механизмам двухслойной схемы.
+
+    Возвращает math.inf, если ни один механизм не дал положительного значения.
+    """
+    best = math.inf
+    drainages_top = ("drained", "undrained") if allow_dual and top.is_dual else (top.drainage,)
+    drainages_bot = ("drained", "undrained") if allow_dual and bottom.is_dual else (bottom.drainage,)
 
     for d_top in drainages_top:
         if include_general_shear:
-            if d_top == "undrained":
-                results.append(bearing_capacity_clay(layers, foundation, d, cache=cache))
-            else:
-                results.append(bearing_capacity_sand(layers, foundation, d, cache=cache))
+            general_shear = bearing_capacity_clay if d_top == "undrained" else bearing_capacity_sand
+            v = general_shear(layers, foundation, d, cache=cache)
+            if 0 < v < best:
+                best = v
 
         for d_bot in drainages_bot:
-            if d_top == "drained" and d_bot == "undrained":
-                results.append(
-                    bearing_capacity_punch_through_sand_clay(
-                        layers,
-                        foundation,
-                        d,
-                        top.H,
-                        top.phi,
-                        top.gamma,
-                        bottom.cu,
-                        use_backflow=use_backfill,
-                        cache=cache,
-                    )
-                )
-            if d_top == "undrained" and d_bot == "undrained":
-                if top.cu > bottom.cu:
-                    results.append(
-                        bearing_capacity_punch_through_clay(
-                            layers,
-                            foundation,
-                            d,
-                            top.H,
-                            top.cu,
-                            bottom.cu,
-                            use_backflow=use_backfill,
-                            cache=cache,
-                        )
-                    )
-                elif bottom.cu > top.cu:
-                    results.append(
-                        bearing_capacity_squeezing(
-                            layers,
-                            foundation,
-                            d,
-                            top.H,
-                            top.cu,
-                            use_backflow=use_backfill,
-                            cache=cache,
-                        )
-                    )
-
-    return results
+            mechanism = _TWO_LAYER_MECHANISMS.get((d_top, d_bot))
+            if mechanism is None:
+                continue
+            v = mechanism(layers, foundation, d, top, bottom, use_backfill, cache)
+            if 0 < v < best:
+                best = v
+
+    return best
+
+
+def _two_layer_min_batch(
+    cache: SoilProfileCache,
+    foundation: Foundation,
+    depths: np.ndarray,
+    H_top: np.ndarray,
+    top: int,
+    bottom: int,
+    use_backfill: bool,
+    include_general_shear: bool,
+    allow_dual: bool,
+) -> np.ndarray:
+    """Векторный вариант _two_layer_min для глубин с одной парой слоёв top/bottom.
+
+    top и bottom — индексы слоёв разреза; H_top — толщина верхнего слоя в зоне
+    влияния для каждой глубины. Механизмы выбираются по паре слоёв один раз.
+    """
+    drainage, is_dual = cache.drainage
+    top_layer, bottom_layer = cache.layers[top], cache.layers[bottom]
+    drainages_top = ("drained", "undrained") if allow_dual and is_dual[top] else (drainage[top],)
+    drainages_bot = ("drained", "undrained") if allow_dual and is_dual[bottom] else (drainage[bottom],)
+
+    best = np.full_like(depths, math.inf)
+    for d_top in drainages_top:
+        if include_general_shear:
+            best = _min_positive_update(best, _general_shear_batch(cache, foundation, depths, d_top))
+
+        for d_bot in drainages_bot:
+            mechanism = _TWO_LAYER_MECHANISMS_BATCH.get((d_top, d_bot))
+            if mechanism is None:
+                continue
+            values = mechanism(cache, foundation, depths, H_top, top_layer, bottom_layer, use_backfill)
+            best = _min_positive_update(best, values)
+
+    return best
 
 
 def bearing_capacity_three_layer(
@@ -544,21 +950,18 @@ def bearing_capacity_three_layer(
         return 0.0
     
     lp1, lp2, lp3 = layer_params[0], layer_params[1], layer_params[2]
-    results = []
     
     # === Сценарий 1: Двухслойная система (слои 1-2) ===
-    results.extend(
-        _two_layer_results(
-            layers,
-            foundation,
-            d,
-            lp1,
-            lp2,
-            use_backfill,
-            cache,
-            include_general_shear=False,
-            allow_dual=False,
-        )
+    best = _two_layer_min(
+        layers,
+        foundation,
+        d,
+        lp1,
+        lp2,
+        use_backfill,
+        cache,
+        include_general_shear=False,
+        allow_dual=False,
     )
     
     # === Сценарий 2: Двухслойная система (слои 2-3) ===
@@ -566,8 +969,9 @@ def bearing_capacity_three_layer(
     d_equiv = lp2.z_top
     
     # === Сценарий 2: Двухслойная система (слои 2-3) ===
-    results.extend(
-        _two_layer_results(
+    best = min(
+        best,
+        _two_layer_min(
             layers,
             foundation,
             d_equiv,
@@ -577,7 +981,7 @@ def bearing_capacity_three_layer(
             cache,
             include_general_shear=False,
             allow_dual=False,
-        )
+        ),
     )
     
     # === Сценарий 3: Общий сдвиг в однородной толще ===
@@ -585,10 +989,11 @@ def bearing_capacity_three_layer(
         Qv_gs = bearing_capacity_clay(layers, foundation, d, cache=cache)
     else:
         Qv_gs = bearing_capacity_sand(layers, foundation, d, cache=cache)
-    results.append(Qv_gs)
+    if 0 < Qv_gs < best:
+        best = Qv_gs
     
     # Возвращаем минимум (наиболее консервативная оценка)
-    return _min_positive(results)
+    return best if best < math.inf else 0.0
 
 
 # =============================================================================
@@ -608,19 +1013,22 @@ def bearing_capacity_Qv(
     Для пылеватых грунтов выполняется ДВОЙНОЙ расчёт и берётся МИНИМУМ.
     Для слоистых толщ (2-3 слоя) анализируются все возможные механизмы разрушения.
     """
-    layer = get_layer_at_depth(layers, d)
+    if cache is None:
+        cache = build_profile_cache(layers)
+    layer = get_layer_at_depth(layers, d, cache=cache)
     if layer is None:
         return 0.0
 
-    drainage = get_drainage(layer)
+    layer_idx = cache._layer_index(d)
+    drainage = cache.drainage[0][layer_idx]
     
     # Собираем параметры слоёв в зоне влияния (1.5·B)
     influence_depth = 1.5 * foundation.B_eff
-    layer_params = _collect_layer_params(layers, d, influence_depth, max_layers=3)
+    layer_params = _collect_layer_params(layers, d, influence_depth, max_layers=3, cache=cache)
     
     # === Однородная толща ===
     if len(layer_params) <= 1:
-        if is_dual_drainage(layer):
+        if cache.drainage[1][layer_idx]:
             Qv_clay = bearing_capacity_clay(layers, foundation, d, cache=cache)
             Qv_sand = bearing_capacity_sand(layers, foundation, d, cache=cache)
             if Qv_clay > 0 and Qv_sand > 0:
@@ -644,7 +1052,7 @@ def bearing_capacity_Qv(
 
     # === Двухслойная система ===
     lp1, lp2 = layer_params[0], layer_params[1]
-    results = _two_layer_results(
+    best = _two_layer_min(
         layers,
         foundation,
         d,
@@ -657,7 +1065,7 @@ def bearing_capacity_Qv(
     )
 
     # Возвращаем минимум (консервативная оценка)
-    return _min_positive(results)
+    return best if best < math.inf else 0.0
 
 
 def bearing_capacity_Vl(
@@ -679,7 +1087,10 @@ def bearing_capacity_Vl(
         d: Глубина заглубления, м.
         F: Вертикальная нагрузка, кН (для расчёта H_cav по C.2.5).
         use_backfill: Учитывать обратную засыпку.
+        cache: Кэш разреза (если не задан — строится один раз на вызов).
     """
+    if cache is None:
+        cache = build_profile_cache(layers)
     Qv = bearing_capacity_Qv(
         layers,
         foundation,
@@ -688,7 +1099,7 @@ def bearing_capacity_Vl(
         cache=cache,
     )
 
-    layer = get_layer_at_depth(layers, d)
+    layer = get_layer_at_depth(layers, d, cache=cache)
     gamma = layer.gamma_prime if layer else 10.0
 
     # Объём вытесненного грунта (C.2.3)
@@ -699,9 +1110,8 @@ def bearing_capacity_Vl(
         # Базовый объём = A·d
         V_displaced = foundation.area_prime * d
         # Добавляем объём конуса шипа, если задан (C.2.3)
-        if foundation.D_eff and foundation.beta:
-            V_s = spud_cone_volume(foundation.D_eff, foundation.beta)
-            V_displaced += V_s
+        # Vs кэшируется на фундаменте — одна величина на всю кривую
+        V_displaced += foundation.V_s
 
     Bs = buoyancy_force(gamma, V_displaced)
 
@@ -710,10 +1120,8 @@ def bearing_capacity_Vl(
 
     # С учётом засыпки
     # По C.2.5: su,m — прочность на сдвиг у поверхности морского дна (d=0)
-    seabed_layer = get_layer_at_depth(layers, 0.0)
-    su_m = seabed_layer.cu if seabed_layer and seabed_layer.cu else (
-        seabed_layer.c if seabed_layer else 0.0
-    )
+    seabed_layer = get_layer_at_depth(layers, 0.0, cache=cache)
+    su_m = seabed_layer.cu_or_c if seabed_layer else 0.0
     
     # Расчёт H_cav по полной формуле (C.2.5)
     p = F / foundation.area_prime if foundation.area_prime > 0 and F > 0 else 0.0
@@ -725,3 +1133,148 @@ def bearing_capacity_Vl(
     )
 
     return Qv - Wbf + Bs
+
+
+# =============================================================================
+# Векторные варианты Qv и Vl по сетке глубин
+# =============================================================================
+
+
+def _window_layers(
+    cache: SoilProfileCache, depths: np.ndarray, influence_depth: float
+) -> tuple[np.ndarray, np.ndarray]:
+    """Индекс первого слоя и число слоёв зоны влияния (как у _collect_layer_params)."""
+    boundaries = cache.columns["boundaries"]
+    n = len(cache.layers)
+    lo = np.searchsorted(boundaries[1:], depths, side="right")
+    hi = np.minimum(np.searchsorted(boundaries[:n], depths + influence_depth, side="left"), lo + 3)
+    return lo, np.maximum(hi - lo, 0)
+
+
+def bearing_capacity_Qv_batch(
+    layers: list[SoilLayer],
+    foundation: Foundation,
+    depths: np.ndarray,
+    use_backfill: bool = False,
+    cache: SoilProfileCache | None = None,
+) -> np.ndarray:
+    """Векторный вариант bearing_capacity_Qv для массива глубин.
+
+    Глубины с однородной зоной влияния (один слой в пределах 1.5·B) считаются
+    формулами общего сдвига (C.2.7, C.2.9) над массивами сразу для всей сетки.
+    Слоистые зоны группируются по первому слою и числу слоёв: внутри группы
+    набор механизмов (squeezing, punch-through, трёхслойная схема) одинаков
+    и считается массивами по всем её глубинам.
+    """
+    if cache is None:
+        cache = build_profile_cache(layers)
+    depths = np.asarray(depths, dtype=np.float64)
+    B = foundation.B_eff
+    if not cache.layers or B <= 0:
+        return np.array([bearing_capacity_Qv(layers, foundation, float(d), use_backfill, cache) for d in depths])
+
+    influence_depth = 1.5 * B
+    idx = cache.layer_index_batch(depths)
+    layer_idx = np.maximum(idx, 0)
+    drainage, is_dual = cache.drainage
+    undrained = np.array([tag == "undrained" for tag in drainage])[layer_idx]
+    dual = np.array(is_dual)[layer_idx]
+
+    first, count = _window_layers(cache, depths, influence_depth)
+    homogeneous = (count <= 1) & (idx >= 0)
+    Qv = np.zeros_like(depths)
+
+    h = np.flatnonzero(homogeneous)
+    if h.size:
+        d_h, i_h = depths[h], layer_idx[h]
+        clay = np.zeros(h.size)
+        sand = np.zeros(h.size)
+        need_clay = undrained[h] | dual[h]
+        need_sand = ~undrained[h] | dual[h]
+        if need_clay.any():
+            clay[need_clay] = _clay_batch(cache, foundation, d_h[need_clay], i_h[need_clay])
+        if need_sand.any():
+            sand[need_sand] = _sand_batch(cache, foundation, d_h[need_sand], i_h[need_sand])
+
+        # Пылеватые грунты: минимум из двух расчётов (если оба положительны)
+        dual_value = np.where(
+            (clay > 0) & (sand > 0), np.minimum(clay, sand), np.where(clay > 0, clay, sand)
+        )
+        Qv[h] = np.where(dual[h], dual_value, np.where(undrained[h], clay, sand))
+
+    layered = ~homogeneous & (idx >= 0)
+    boundaries = cache.boundaries
+    for lo, n_layers in sorted(set(zip(first[layered].tolist(), count[layered].tolist()))):
+        k = np.flatnonzero(layered & (first == lo) & (count == n_layers))
+        d = depths[k]
+        z_end = d + influence_depth
+        z_top = [np.maximum(boundaries[lo + j], d) for j in range(n_layers)]
+        H = [np.minimum(boundaries[lo + j + 1], z_end) - z_top[j] for j in range(n_layers)]
+
+        if n_layers == 2:
+            best = _two_layer_min_batch(
+                cache, foundation, d, H[0], lo, lo + 1, use_backfill,
+                include_general_shear=True, allow_dual=True,
+            )
+        else:
+            # Трёхслойная схема (C.2.3.4.4): слои 1-2, слои 2-3 от кровли слоя 2, общий сдвиг
+            best = np.minimum(
+                _two_layer_min_batch(
+                    cache, foundation, d, H[0], lo, lo + 1, use_backfill,
+                    include_general_shear=False, allow_dual=False,
+                ),
+                _two_layer_min_batch(
+                    cache, foundation, z_top[1], H[1], lo + 1, lo + 2, use_backfill,
+                    include_general_shear=False, allow_dual=False,
+                ),
+            )
+            best = _min_positive_update(best, _general_shear_batch(cache, foundation, d, drainage[lo]))
+        Qv[k] = np.where(best < math.inf, best, 0.0)
+    return Qv
+
+
+def bearing_capacity_Vl_batch(
+    layers: list[SoilLayer],
+    foundation: Foundation,
+    depths: np.ndarray,
+    F: float = 0.0,
+    use_backfill: bool = False,
+    cache: SoilProfileCache | None = None,
+) -> np.ndarray:
+    """Векторный вариант bearing_capacity_Vl для массива глубин."""
+    if cache is None:
+        cache = build_profile_cache(layers)
+    depths = np.asarray(depths, dtype=np.float64)
+    Qv = bearing_capacity_Qv_batch(layers, foundation, depths, use_backfill, cache)
+
+    idx = cache.layer_index_batch(depths)
+    if cache.layers:
+        gamma = np.where(idx >= 0, cache.columns["gamma_prime"][np.maximum(idx, 0)], 10.0)
+    else:
+        gamma = np.full_like(depths, 10.0)
+
+    if foundation.V_D is not None:
+        V_displaced = np.full_like(depths, foundation.V_D)
+    else:
+        V_displaced = foundation.area_prime * depths + foundation.V_s
+
+    Bs = gamma * np.maximum(0.0, V_displaced)
+    if not use_backfill:
+        return Qv + Bs
+
+    # Засыпка (C.2.4–C.2.5): Hcav зависит от γ' слоя — считаем по слоям
+    seabed_layer = get_layer_at_depth(layers, 0.0, cache=cache)
+    su_m = seabed_layer.cu_or_c if seabed_layer else 0.0
+    A = foundation.area_prime
+    p = F / A if A > 0 and F > 0 else 0.0
+    if su_m > 0:
+        # Различных γ' — по числу слоёв: Hcav считаем по ним и раздаём по глубинам
+        gamma_values, inverse = np.unique(gamma, return_inverse=True)
+        B = foundation.B_eff
+        H_cav = np.maximum(0.0, cavity_depth_ratio_batch(su_m, gamma_values, B, p) * B)[inverse]
+    else:
+        H_cav = np.zeros_like(depths)
+
+    volume = A * np.maximum(0.0, depths - H_cav) - ((foundation.V_spud or 0.0) - (foundation.V_D or 0.0))
+    Wbf = np.where(gamma > 0, np.maximum(0.0, gamma * volume), 0.0)
+    return Qv - Wbf + Bs
@@ -2,10 +2,10 @@
 
 import numpy as np
 
-from core.helpers import build_profile_cache, get_layer_at_depth
+from core.helpers import build_profile_cache, depth_grid, get_layer_at_depth
 from core.models import Coefficients, Foundation, PointResult, SoilLayer, SoilProfileCache
 
-from .bearing import bearing_capacity_Vl
+from .bearing import bearing_capacity_Vl, bearing_capacity_Vl_batch
 
 
 def calculate_point(
@@ -24,13 +24,16 @@ def calculate_point(
         coef: Коэффициенты.
         F: Вертикальная нагрузка, кН.
         d: Глубина заглубления, м.
+        cache: Кэш разреза (если не задан — строится по layers).
 
     Returns:
         PointResult с Vl вместо Nu.
     """
-    layer = get_layer_at_depth(layers, d)
+    if cache is None:
+        cache = build_profile_cache(layers)
+    layer = get_layer_at_depth(layers, d, cache=cache)
     if layer is None:
-        return PointResult(d=d, Nu=0.0, R=0.0, p=0.0, eta1=999.0, eta2=999.0, layer_name="Unknown")
+        return PointResult.from_values(d=d, Nu=0.0, R=0.0, p=0.0, eta1=999.0, eta2=999.0, layer_name="Unknown")
 
     # Передаём F для расчёта H_cav по полной формуле C.2.5
     Vl = bearing_capacity_Vl(
@@ -47,7 +50,7 @@ def calculate_point(
     eta1 = F / Vl if Vl > 0 else np.inf
     eta2 = p / R if R > 0 else np.inf
 
-    return PointResult(d=d, Nu=Vl, R=R, p=p, eta1=eta1, eta2=eta2, layer_name=layer.name)
+    return PointResult.from_values(d=d, Nu=Vl, R=R, p=p, eta1=eta1, eta2=eta2, layer_name=layer.name)
 
 
 def penetration_curve(
@@ -57,6 +60,7 @@ def penetration_curve(
     F: float,
     d_max: float = 20.0,
     d_step: float = 0.1,
+    cache: SoilProfileCache | None = None,
 ) -> list[PointResult]:
     """Построение кривой пенетрации Vl(d).
 
@@ -67,13 +71,36 @@ def penetration_curve(
         F: Вертикальная нагрузка, кН.
         d_max: Максимальная глубина расчёта, м.
         d_step: Шаг по глубине, м.
+        cache: Кэш разреза (если не задан — строится по layers).
 
     Returns:
         Список PointResult для каждой глубины.
     """
-    cache = build_profile_cache(layers)
-    depths = np.arange(d_step, d_max + d_step / 2, d_step)
-    return [calculate_point(layers, foundation, coef, F, d, cache=cache) for d in depths]
+    if cache is None:
+        cache = build_profile_cache(layers)
+    depths = depth_grid(d_max, d_step)
+    # σzg на подошве нужен каждому механизму разрушения — считаем сразу для всей сетки
+    cache.overburden_stress_batch(depths)
+
+    idx = cache.layer_index_batch(depths)
+    Vl = bearing_capacity_Vl_batch(layers, foundation, depths, F, coef.use_backfill, cache=cache)
+    p = F / foundation.area_prime
+    with np.errstate(divide="ignore", invalid="ignore"):
+        R = Vl / foundation.area_prime if foundation.area_prime > 0 else np.zeros_like(Vl)
+        eta1 = np.where(Vl > 0, F / Vl, np.inf)
+        eta2 = np.where(R > 0, p / R, np.inf)
+
+    curve = []
+    for d, i, vl, r, eta1_i, eta2_i in zip(depths, idx.tolist(), Vl.tolist(), R.tolist(), eta1.tolist(), eta2.tolist()):
+        if i < 0:
+            curve.append(
+                PointResult.from_values(d=d, Nu=0.0, R=0.0, p=0.0, eta1=999.0, eta2=999.0, layer_name="Unknown")
+            )
+            continue
+        curve.append(
+            PointResult.from_values(d=d, Nu=vl, R=r, p=p, eta1=eta1_i, eta2=eta2_i, layer_name=cache.layers[i].name)
+        )
+    return curve
 
 
 def find_equilibrium_depth(
@@ -83,6 +110,8 @@ def find_equilibrium_depth(
     F: float,
     d_max: float = 30.0,
     d_step: float = 0.1,
+    cache: SoilProfileCache | None = None,
+    curve: list[PointResult] | None = None,
 ) -> PointResult | None:
     """Найти безопасную глубину равновесия где F ≤ Vl(d).
 
@@ -96,36 +125,29 @@ def find_equilibrium_depth(
         F: Вертикальная нагрузка, кН.
         d_max: Максимальная глубина поиска, м.
         d_step: Шаг поиска, м.
+        cache: Кэш разреза (опционально).
+        curve: Готовая кривая penetration_curve для тех же F, d_max, d_step
+            (если не задана — строится).
 
     Returns:
         PointResult при η₁ ≤ 1 в безопасной зоне, или None если не найдено.
     """
-    curve = penetration_curve(layers, foundation, coef, F, d_max, d_step)
+    if curve is None:
+        curve = penetration_curve(layers, foundation, coef, F, d_max, d_step, cache=cache)
 
     if not curve:
         return None
 
-    safe_indices = [i for i, res in enumerate(curve) if res.eta1 <= 1.0]
-
-    if not safe_indices:
-        return None
-
-    unsafe_indices = [i for i, res in enumerate(curve) if res.eta1 > 1.0]
-
-    # Если провалов нет — возвращаем первую безопасную точку.
-    if not unsafe_indices:
-        return curve[safe_indices[0]]
-
-    # Безопасная зона начинается сразу после последнего провала.
-    idx = max(unsafe_indices) + 1
-    if idx >= len(curve):
+    eta1 = np.array([res.eta1 for res in curve])
+    safe = eta1 <= 1.0
+    if not safe.any():
         return None
 
-    for j in range(idx, len(curve)):
-        if curve[j].eta1 <= 1.0:
-            return curve[j]
-
-    return None
+    # Безопасная зона начинается сразу после последнего провала (без провалов — с начала).
+    unsafe = np.flatnonzero(eta1 > 1.0)
+    start = int(unsafe[-1]) + 1 if unsafe.size else 0
+    after = np.flatnonzero(safe[start:])
+    return curve[start + int(after[0])] if after.size else None
 
 
 def find_all_equilibrium_depths(
@@ -135,26 +157,25 @@ def find_all_equilibrium_depths(
     F: float,
     d_max: float = 30.0,
     d_step: float = 0.1,
+    cache: SoilProfileCache | None = None,
+    curve: list[PointResult] | None = None,
 ) -> list[PointResult]:
     """Найти ВСЕ глубины равновесия и зоны неустойчивости.
 
     Возвращает список точек, где происходит переход:
     - от η₁ > 1 к η₁ ≤ 1 (вход в стабильную зону)
     - от η₁ ≤ 1 к η₁ > 1 (выход из стабильной зоны — ОПАСНО!)
+
+    Готовую кривую для тех же F, d_max, d_step можно передать в curve.
     """
-    curve = penetration_curve(layers, foundation, coef, F, d_max, d_step)
+    if curve is None:
+        curve = penetration_curve(layers, foundation, coef, F, d_max, d_step, cache=cache)
 
     if len(curve) < 2:
         return []
 
-    transitions = []
-    for i in range(1, len(curve)):
-        prev_safe = curve[i - 1].eta1 <= 1.0
-        curr_safe = curve[i].eta1 <= 1.0
-        if prev_safe != curr_safe:
-            transitions.append(curve[i])
-
-    return transitions
+    safe = np.array([res.eta1 for res in curve]) <= 1.0
+    return [curve[i] for i in (np.flatnonzero(safe[1:] != safe[:-1]) + 1).tolist()]
 
 
 def has_punch_through_risk(
@@ -164,11 +185,16 @@ def has_punch_through_risk(
     F: float,
     d_max: float = 30.0,
     d_step: float = 0.1,
+    cache: SoilProfileCache | None = None,
+    curve: list[PointResult] | None = None,
 ) -> bool:
     """Проверить наличие риска punch-through.
 
     Риск существует, если кривая Vl(d) имеет локальный максимум
     с последующим падением ниже нагрузки F.
+    Готовую кривую для тех же F, d_max, d_step можно передать в curve.
     """
-    transitions = find_all_equilibrium_depths(layers, foundation, coef, F, d_max, d_step)
+    transitions = find_all_equilibrium_depths(
+        layers, foundation, coef, F, d_max, d_step, cache=cache, curve=curve
+    )
     return len(transitions) >= 2
@@ -6,6 +6,8 @@
 - InSafeJIP
 """
 
+import math
+from bisect import bisect_left
 from functools import lru_cache
 
 import numpy as np
@@ -22,6 +24,11 @@ _ISO_CLAY_FACTOR_TABLE_23_1 = (
     (1.0, 7.7),
     (2.5, 9.0),
 )
+# Узлы табл. 2.3-1 раздельно: кортежи для bisect, массивы для векторного варианта
+_ISO_CLAY_NODES_X = tuple(row[0] for row in _ISO_CLAY_FACTOR_TABLE_23_1)
+_ISO_CLAY_NODES_Y = tuple(row[1] for row in _ISO_CLAY_FACTOR_TABLE_23_1)
+_ISO_CLAY_NODES_X_ARRAY = np.array(_ISO_CLAY_NODES_X)
+_ISO_CLAY_NODES_Y_ARRAY = np.array(_ISO_CLAY_NODES_Y)
 
 
 @lru_cache(maxsize=512)
@@ -33,7 +40,7 @@ def clay_factor_iso_table_23_1(D_over_B: float) -> float:
 
     Интерполяция: кусочно-линейная по узлам таблицы.
     """
-    if not np.isfinite(D_over_B):
+    if not math.isfinite(D_over_B):
         return float(_ISO_CLAY_FACTOR_TABLE_23_1[0][1])
 
     x = float(D_over_B)
@@ -42,14 +49,34 @@ def clay_factor_iso_table_23_1(D_over_B: float) -> float:
     if x >= _ISO_CLAY_FACTOR_TABLE_23_1[-1][0]:
         return float(_ISO_CLAY_FACTOR_TABLE_23_1[-1][1])
 
-    for (x0, y0), (x1, y1) in zip(_ISO_CLAY_FACTOR_TABLE_23_1, _ISO_CLAY_FACTOR_TABLE_23_1[1:]):
-        if x0 <= x <= x1:
-            if x1 == x0:
-                return float(y0)
-            t = (x - x0) / (x1 - x0)
-            return float(y0 + t * (y1 - y0))
+    # Отрезок таблицы, содержащий x (на узле — левый)
+    i = bisect_left(_ISO_CLAY_NODES_X, x) - 1
+    x0, x1 = _ISO_CLAY_NODES_X[i], _ISO_CLAY_NODES_X[i + 1]
+    y0, y1 = _ISO_CLAY_NODES_Y[i], _ISO_CLAY_NODES_Y[i + 1]
+    t = (x - x0) / (x1 - x0)
+    return float(y0 + t * (y1 - y0))
 
-    return float(_ISO_CLAY_FACTOR_TABLE_23_1[-1][1])
+
+def clay_factor_iso_table_23_1_batch(D_over_B: np.ndarray) -> np.ndarray:
+    """Векторный вариант clay_factor_iso_table_23_1 для массива D/B.
+
+    Интерполяция по тем же формулам, что и в скалярной функции (на узле
+    таблицы берётся левый отрезок), поэтому результаты совпадают побитово.
+    """
+    x = np.asarray(D_over_B, dtype=float)
+    nodes_x = _ISO_CLAY_NODES_X_ARRAY
+    nodes_y = _ISO_CLAY_NODES_Y_ARRAY
+
+    seg = np.clip(np.searchsorted(nodes_x, x, side="left") - 1, 0, len(nodes_x) - 2)
+    x0, x1 = nodes_x[seg], nodes_x[seg + 1]
+    y0, y1 = nodes_y[seg], nodes_y[seg + 1]
+    with np.errstate(invalid="ignore"):
+        t = (x - x0) / (x1 - x0)
+        result = y0 + t * (y1 - y0)
+
+    result = np.where(x <= nodes_x[0], nodes_y[0], result)
+    result = np.where(x >= nodes_x[-1], nodes_y[-1], result)
+    return np.where(np.isfinite(x), result, nodes_y[0])
 
 
 # --- Коэффициенты несущей способности для песков (C.2.9) ---
@@ -73,11 +100,11 @@ def bearing_factors_sand(phi_deg: float) -> tuple[float, float]:
     if phi_deg <= 0:
         return 0.0, 1.0
 
-    phi_rad = np.radians(phi_deg)
-    tan_phi = np.tan(phi_rad)
+    phi_rad = math.radians(phi_deg)
+    tan_phi = math.tan(phi_rad)
 
     # Nq = e^(π·tanφ) · tan²(45° + φ/2)
-    n_q = np.exp(np.pi * tan_phi) * (np.tan(np.radians(45.0) + phi_rad / 2.0)) ** 2
+    n_q = math.exp(math.pi * tan_phi) * (math.tan(math.radians(45.0) + phi_rad / 2.0)) ** 2
 
     # Nγ = 2·(Nq + 1)·tanφ
     n_gamma = 2.0 * (n_q + 1.0) * tan_phi
@@ -85,6 +112,19 @@ def bearing_factors_sand(phi_deg: float) -> tuple[float, float]:
     return float(n_gamma), float(n_q)
 
 
+def bearing_factors_sand_batch(phi_deg: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Векторный вариант bearing_factors_sand для массива углов φ."""
+    phi_deg = np.asarray(phi_deg, dtype=float)
+    phi_rad = np.radians(phi_deg)
+    tan_phi = np.tan(phi_rad)
+
+    n_q = np.exp(np.pi * tan_phi) * (np.tan(np.radians(45.0) + phi_rad / 2.0)) ** 2
+    n_gamma = 2.0 * (n_q + 1.0) * tan_phi
+
+    positive = phi_deg > 0
+    return np.where(positive, n_gamma, 0.0), np.where(positive, n_q, 1.0)
+
+
 # --- Коэффициенты формы (shape factors) ---
 
 
@@ -107,6 +147,7 @@ def shape_factor_clay(B: float, L: float) -> float:
     return 1.0 + (1.0 / NC_CLAY) * (B / L)
 
 
+@lru_cache(maxsize=256)
 def shape_factors_sand(B: float, L: float, phi_deg: float) -> tuple[float, float]:
     """Коэффициенты формы sγ, sq для песков (SNAME/ISO).
 
@@ -127,11 +168,19 @@ def shape_factors_sand(B: float, L: float, phi_deg: float) -> tuple[float, float
         ratio = B / L
 
     s_gamma = max(0.6, 1.0 - 0.4 * ratio)
-    s_q = 1.0 + ratio * np.tan(np.radians(phi_deg))
+    s_q = 1.0 + ratio * math.tan(math.radians(phi_deg))
 
     return float(s_gamma), float(s_q)
 
 
+def shape_factors_sand_batch(B: float, L: float, phi_deg: np.ndarray) -> tuple[float, np.ndarray]:
+    """Векторный вариант shape_factors_sand: sγ не зависит от φ и возвращается числом."""
+    ratio = 1.0 if L <= 0 else B / L
+    s_gamma = max(0.6, 1.0 - 0.4 * ratio)
+    s_q = 1.0 + ratio * np.tan(np.radians(np.asarray(phi_deg, dtype=float)))
+    return float(s_gamma), s_q
+
+
 # --- Коэффициенты глубины (depth factors) ---
 
 
@@ -156,7 +205,14 @@ def depth_factor_clay(D: float, B: float) -> float:
     if ratio <= 1.0:
         return 1.0 + 0.4 * ratio
     else:
-        return 1.0 + 0.4 * np.arctan(ratio)
+        return 1.0 + 0.4 * math.atan(ratio)
+
+
+@lru_cache(maxsize=256)
+def _depth_factor_sand_coef(phi_deg: float) -> float:
+    """Множитель 2·tanφ·(1 - sinφ)² формулы dq: зависит только от φ."""
+    phi_rad = math.radians(phi_deg)
+    return 2.0 * math.tan(phi_rad) * (1.0 - math.sin(phi_rad)) ** 2
 
 
 def depth_factors_sand(D: float, B: float, phi_deg: float) -> tuple[float, float]:
@@ -179,23 +235,38 @@ def depth_factors_sand(D: float, B: float, phi_deg: float) -> tuple[float, float
     if B <= 0 or phi_deg <= 0:
         return d_gamma, 1.0
 
-    phi_rad = np.radians(phi_deg)
-    tan_phi = np.tan(phi_rad)
-    sin_phi = np.sin(phi_rad)
-    factor = 2.0 * tan_phi * (1.0 - sin_phi) ** 2
+    factor = _depth_factor_sand_coef(phi_deg)
 
     ratio = D / B
     if ratio <= 1.0:
         d_q = 1.0 + factor * ratio
     else:
-        d_q = 1.0 + factor * np.arctan(ratio)
+        d_q = 1.0 + factor * math.atan(ratio)
 
     return float(d_gamma), float(d_q)
 
 
+def depth_factors_sand_batch(
+    D: np.ndarray, B: float, phi_deg: np.ndarray
+) -> tuple[float, np.ndarray]:
+    """Векторный вариант depth_factors_sand: dγ = 1 возвращается числом."""
+    D = np.asarray(D, dtype=float)
+    phi_deg = np.asarray(phi_deg, dtype=float)
+    if B <= 0:
+        return 1.0, np.ones(np.broadcast(D, phi_deg).shape)
+
+    phi_rad = np.radians(phi_deg)
+    factor = 2.0 * np.tan(phi_rad) * (1.0 - np.sin(phi_rad)) ** 2
+
+    ratio = D / B
+    d_q = np.where(ratio <= 1.0, 1.0 + factor * ratio, 1.0 + factor * np.arctan(ratio))
+    return 1.0, np.where(phi_deg > 0, d_q, 1.0)
+
+
 # --- Коэффициент сдвига при протыкании Ks (C.2.19) ---
 
 
+@lru_cache(maxsize=512)
 def punch_through_coefficient_Ks(
     cu: float, gamma_prime: float, B: float, phi_deg: float
 ) -> float:
@@ -216,7 +287,7 @@ def punch_through_coefficient_Ks(
     if B <= 0 or gamma_prime <= 0 or phi_deg <= 0:
         return 0.0
 
-    tan_phi = np.tan(np.radians(phi_deg))
+    tan_phi = math.tan(math.radians(phi_deg))
     if tan_phi <= 0:
         return 0.0
 
@@ -1,16 +1,27 @@
 """Аннотации: слои, критические глубины, маркеры равновесия."""
 
+import numpy as np
 import plotly.graph_objects as go
 
+from core.helpers import results_to_arrays
 from core.models import PointResult, SoilLayer
 from .styles import FONT_FAMILY, FONT_SIZE
 
 
+# Оси (xref, yref) левого и правого графиков: по x — вся ширина области
+_LAYER_AXES = (("x domain", "y"), ("x2 domain", "y2"))
+
+
 def add_layers(plotter, layers: list[SoilLayer]):
     """Отрисовка границ слоёв с подписями."""
     z_top = 0.0
     layer_idx = 0
+    shapes = []
+    annotations = []
+    y_limit = plotter.max_depth * 1.05
 
+    # Фигуры и подписи собираются в списки и добавляются одним update_layout:
+    # add_hrect/add_hline/add_annotation перестраивают layout на каждом вызове
     for layer in layers:
         z_bottom = z_top + layer.thickness
         z_mid = z_top + layer.thickness / 2
@@ -20,38 +31,38 @@ def add_layers(plotter, layers: list[SoilLayer]):
 
         # Лёгкая заливка слоёв для лучшей читаемости разреза
         fill_color = plotter.colors["layer_fill_a"] if layer_idx % 2 == 0 else plotter.colors["layer_fill_b"]
-        for col in [1, 2]:
-            plotter.fig.add_hrect(
-                y0=z_top,
-                y1=min(z_bottom, plotter.max_depth * 1.05),
-                fillcolor=fill_color,
-                opacity=1.0,
-                line_width=0,
-                layer="below",
-                row=1,
-                col=col,
-            )
-
-        if z_bottom <= plotter.max_depth * 1.05:
-            for col in [1, 2]:
-                plotter.fig.add_hline(
-                    y=z_bottom, line_width=1, line_dash="solid",
-                    line_color=plotter.colors["layer_line"], opacity=0.5, row=1, col=col,
-                )
+        for xref, yref in _LAYER_AXES:
+            shapes.append(dict(
+                type="rect", xref=xref, yref=yref, x0=0, x1=1,
+                y0=z_top, y1=min(z_bottom, y_limit),
+                fillcolor=fill_color, opacity=1.0, line=dict(width=0), layer="below",
+            ))
+
+        if z_bottom <= y_limit:
+            for xref, yref in _LAYER_AXES:
+                shapes.append(dict(
+                    type="line", xref=xref, yref=yref, x0=0, x1=1, y0=z_bottom, y1=z_bottom,
+                    line=dict(width=1, dash="solid", color=plotter.colors["layer_line"]), opacity=0.5,
+                ))
 
         if z_mid <= plotter.max_depth:
             layer_text = f"<b>{layer.name}</b><br>{z_top:.1f}–{min(z_bottom, plotter.max_depth):.1f} м"
-            plotter.fig.add_annotation(
+            annotations.append(dict(
                 x=1.01, y=z_mid, xref="paper", yref="y2",
                 text=layer_text, showarrow=False,
                 xanchor="left", yanchor="middle",
                 font=dict(size=int(FONT_SIZE * 0.8), color=plotter.colors["text"], family=FONT_FAMILY),
                 bgcolor=plotter.colors["annotation_bg"],
-            )
+            ))
 
         z_top = z_bottom
         layer_idx += 1
 
+    plotter.fig.update_layout(
+        shapes=[*plotter.fig.layout.shapes, *shapes],
+        annotations=[*plotter.fig.layout.annotations, *annotations],
+    )
+
 
 def add_critical_depth_annotations(plotter, d_op: float | None, d_pre: float | None):
     """Горизонтальные линии критических глубин."""
@@ -97,45 +108,59 @@ def add_equilibrium_markers(
 
     F_MN = F / 1000
     p = F / area
-
-    # Левый график: Nu_design vs F
-    for i in range(1, len(results)):
-        prev_nu = results[i - 1].Nu * gamma_c / gamma_n / 1000
-        curr_nu = results[i].Nu * gamma_c / gamma_n / 1000
-
-        if (prev_nu < F_MN) != (curr_nu < F_MN):
-            t = results[i]
-            entering_safe = curr_nu >= F_MN and prev_nu < F_MN
-            color = "#2ca02c" if entering_safe else "#d62728"
-            symbol = "triangle-up" if entering_safe else "triangle-down"
-
-            plotter.fig.add_trace(
-                go.Scatter(
-                    x=[curr_nu], y=[t.d], mode="markers",
-                    marker=dict(size=14, color=color, symbol=symbol, line=dict(width=2, color=plotter.colors["marker_border"])),
-                    name=f"<i>d</i>* = {t.d:.2f} м",
-                    hovertemplate=f"d* = {t.d:.2f} м<br>F = {curr_nu:.1f} МН<extra></extra>",
-                ),
-                row=1, col=1,
+    # Оба столбца — за один проход по точкам кривой
+    arr = results_to_arrays(results)
+
+    # Левый график: Nu_design vs F — точки, где кривая пересекает нагрузку.
+    # У каждой точки своя подпись в легенде, поэтому трасса на точку, но все
+    # трассы добавляются в фигуру одним вызовом.
+    nu = arr["Nu"] * gamma_c / gamma_n / 1000
+    below = nu < F_MN
+    traces = []
+    for i in (np.flatnonzero(below[1:] != below[:-1]) + 1).tolist():
+        curr_nu = nu[i].item()
+        t = results[i]
+        entering_safe = bool(curr_nu >= F_MN and below[i - 1])
+        color = "#2ca02c" if entering_safe else "#d62728"
+        symbol = "triangle-up" if entering_safe else "triangle-down"
+
+        traces.append(
+            go.Scatter(
+                x=[curr_nu], y=[t.d], mode="markers",
+                marker=dict(size=14, color=color, symbol=symbol, line=dict(width=2, color=plotter.colors["marker_border"])),
+                name=f"<i>d</i>* = {t.d:.2f} м",
+                hovertemplate=f"d* = {t.d:.2f} м<br>F = {curr_nu:.1f} МН<extra></extra>",
             )
+        )
+    if traces:
+        plotter.fig.add_traces(traces, rows=1, cols=1)
+
+    # Правый график: R vs p — все пересечения одной трассой без легенды
+    R = arr["R"]
+    below = R < p
+    crossings = (np.flatnonzero(below[1:] != below[:-1]) + 1).tolist()
+    if not crossings:
+        return
+
+    xs, ys, colors, symbols, hover = [], [], [], [], []
+    for i in crossings:
+        curr_r = R[i].item()
+        t = results[i]
+        entering_safe = bool(curr_r >= p and below[i - 1])
+        xs.append(curr_r)
+        ys.append(t.d)
+        colors.append("#2ca02c" if entering_safe else "#d62728")
+        symbols.append("triangle-up" if entering_safe else "triangle-down")
+        hover.append(f"d* = {t.d:.2f} м<br>R = {curr_r:.0f} кПа")
+
+    plotter.fig.add_trace(
+        go.Scatter(
+            x=xs, y=ys, mode="markers",
+            marker=dict(size=14, color=colors, symbol=symbols, line=dict(width=2, color=plotter.colors["marker_border"])),
+            showlegend=False,
+            hovertext=hover,
+            hovertemplate="%{hovertext}<extra></extra>",
+        ),
+        row=1, col=2,
+    )
 
-    # Правый график: R vs p
-    for i in range(1, len(results)):
-        prev_r = results[i - 1].R
-        curr_r = results[i].R
-
-        if (prev_r < p) != (curr_r < p):
-            t = results[i]
-            entering_safe = curr_r >= p and prev_r < p
-            color = "#2ca02c" if entering_safe else "#d62728"
-            symbol = "triangle-up" if entering_safe else "triangle-down"
-
-            plotter.fig.add_trace(
-                go.Scatter(
-                    x=[curr_r], y=[t.d], mode="markers",
-                    marker=dict(size=14, color=color, symbol=symbol, line=dict(width=2, color=plotter.colors["marker_border"])),
-                    showlegend=False,
-                    hovertemplate=f"d* = {t.d:.2f} м<br>R = {curr_r:.0f} кПа<extra></extra>",
-                ),
-                row=1, col=2,
-            )
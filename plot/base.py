@@ -1,34 +1,56 @@
 """Базовый класс для построения графиков."""
 
+from bisect import bisect_right
+
+import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 
 from .styles import COLORS_LIGHT, COLORS_DARK, FONT_FAMILY, FONT_SIZE, LABELS
 
 
-def _auto_dtick(max_val: float, thresholds: list[tuple[float, float]]) -> float:
-    """Автоматический выбор шага делений оси."""
-    for threshold, dtick in thresholds:
-        if max_val < threshold:
-            return dtick
-    return thresholds[-1][1]
+def _auto_dtick(max_val: float, thresholds: tuple[tuple[float, ...], tuple[float, ...]]) -> float:
+    """Автоматический выбор шага делений оси: первый порог, больший max_val."""
+    edges, dticks = thresholds
+    return dticks[min(bisect_right(edges, max_val), len(dticks) - 1)]
+
+
+def _thresholds(pairs: list[tuple[float, float]]) -> tuple[tuple[float, ...], tuple[float, ...]]:
+    """Пороги (граница, шаг) как два кортежа: границы — для бинарного поиска."""
+    edges, dticks = zip(*pairs)
+    return edges, dticks
 
 
 # Пороги для разных осей
-_DEPTH_THRESHOLDS = [(10, 0.5), (25, 1.0), (50, 2.0), (float("inf"), 5.0)]
-_FORCE_THRESHOLDS = [(20, 5), (50, 10), (100, 20), (200, 50), (500, 100), (1000, 200), (2000, 500), (float("inf"), 1000)]
-_PRESSURE_THRESHOLDS = [(100, 10), (200, 20), (400, 40), (600, 50), (1000, 100), (2000, 200), (float("inf"), 250)]
+_DEPTH_THRESHOLDS = _thresholds([(10, 0.5), (25, 1.0), (50, 2.0), (float("inf"), 5.0)])
+_FORCE_THRESHOLDS = _thresholds(
+    [(20, 5), (50, 10), (100, 20), (200, 50), (500, 100), (1000, 200), (2000, 500), (float("inf"), 1000)]
+)
+_PRESSURE_THRESHOLDS = _thresholds(
+    [(100, 10), (200, 20), (400, 40), (600, 50), (1000, 100), (2000, 200), (float("inf"), 250)]
+)
 
 
 class BasePlotter:
     """Базовый класс с настройкой layout и осей."""
 
+    # Заготовки фигур (подграфики + базовый layout) по (класс, методика, тема)
+    _skeletons: dict[tuple[type, str, str], go.Figure] = {}
+
     def __init__(self, methodology: str = "russian", theme: str = "dark"):
         self.methodology = methodology
         self.theme = theme
         self.colors = COLORS_DARK if theme == "dark" else COLORS_LIGHT
         self.labels = LABELS.get(methodology, LABELS["russian"])
-        self.fig = make_subplots(rows=1, cols=2, horizontal_spacing=0.15, shared_yaxes=True)
-        self._setup_layout()
+
+        # make_subplots и базовый layout строятся один раз, дальше фигура
+        # копируется из заготовки: копия в несколько раз дешевле построения
+        key = (type(self), methodology, theme)
+        skeleton = BasePlotter._skeletons.get(key)
+        if skeleton is None:
+            self.fig = make_subplots(rows=1, cols=2, horizontal_spacing=0.15, shared_yaxes=True)
+            self._setup_layout()
+            skeleton = BasePlotter._skeletons[key] = go.Figure(self.fig)
+        self.fig = go.Figure(skeleton)
         self.max_depth = 0.0
         self.max_nu = 0.0
         self.max_r = 0.0
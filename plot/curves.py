@@ -4,7 +4,7 @@ import numpy as np
 import plotly.graph_objects as go
 
 from core.models import PointResult
-from core.helpers import additional_stress_boussinesq
+from core.helpers import boussinesq_influence_batch, boussinesq_stress_batch, results_to_arrays
 from .styles import FONT_SIZE, LINE_WIDTH_BOLD, LINE_WIDTH_THIN
 
 
@@ -13,14 +13,15 @@ def plot_curves(plotter, results: list[PointResult], gamma_n: float = 1.0, gamma
     if not results:
         return
 
-    depths = [r.d for r in results]
-    nu_values = [r.Nu / 1000 for r in results]
-    r_values = [r.R for r in results]
-    customdata = [(r.eta1, r.eta2, r.p, r.layer_name) for r in results]
+    arr = results_to_arrays(results)
+    depths = arr["d"]
+    nu_values = arr["Nu"] / 1000
+    r_values = arr["R"]
+    customdata = np.column_stack([arr["eta1"], arr["eta2"], arr["p"], arr["layer_name"]])
 
-    plotter.max_depth = max(depths)
-    plotter.max_nu = max(nu_values)
-    plotter.max_r = max(r_values)
+    plotter.max_depth = depths.max().item()
+    plotter.max_nu = nu_values.max().item()
+    plotter.max_r = r_values.max().item()
 
     # Шаблоны hover
     def hover_tpl(label: str, fmt: str, unit: str) -> str:
@@ -33,32 +34,38 @@ def plot_curves(plotter, results: list[PointResult], gamma_n: float = 1.0, gamma
     hover_nu = hover_tpl(plotter.labels["nu_label"], ".2f", "МН")
     hover_r = hover_tpl(plotter.labels["r_label"], ".0f", "кПа")
 
-    # Кривые Nu/Vl
+    # Кривые Nu/Vl (левый график) и R (правый) добавляются одним add_traces
     if plotter.labels["show_nu_design"]:
-        nu_design = [r.Nu * gamma_c / gamma_n / 1000 for r in results]
-        plotter.fig.add_trace(go.Scatter(
-            x=nu_values, y=depths, mode="lines", name=plotter.labels["nu_label"],
-            line=dict(color=plotter.colors["Nu"], width=LINE_WIDTH_THIN, dash="dash"),
-            customdata=customdata, hovertemplate=hover_nu,
-        ), row=1, col=1)
-        plotter.fig.add_trace(go.Scatter(
-            x=nu_design, y=depths, mode="lines", name=plotter.labels["nu_design_label"],
-            line=dict(color=plotter.colors["Nu_design"], width=LINE_WIDTH_BOLD),
-            customdata=customdata, hovertemplate=hover_nu,
-        ), row=1, col=1)
+        nu_design = arr["Nu"] * gamma_c / gamma_n / 1000
+        traces = [
+            go.Scatter(
+                x=nu_values, y=depths, mode="lines", name=plotter.labels["nu_label"],
+                line=dict(color=plotter.colors["Nu"], width=LINE_WIDTH_THIN, dash="dash"),
+                customdata=customdata, hovertemplate=hover_nu,
+            ),
+            go.Scatter(
+                x=nu_design, y=depths, mode="lines", name=plotter.labels["nu_design_label"],
+                line=dict(color=plotter.colors["Nu_design"], width=LINE_WIDTH_BOLD),
+                customdata=customdata, hovertemplate=hover_nu,
+            ),
+        ]
     else:
-        plotter.fig.add_trace(go.Scatter(
-            x=nu_values, y=depths, mode="lines", name=plotter.labels["nu_label"],
-            line=dict(color=plotter.colors["Nu"], width=LINE_WIDTH_BOLD),
-            customdata=customdata, hovertemplate=hover_nu,
-        ), row=1, col=1)
+        traces = [
+            go.Scatter(
+                x=nu_values, y=depths, mode="lines", name=plotter.labels["nu_label"],
+                line=dict(color=plotter.colors["Nu"], width=LINE_WIDTH_BOLD),
+                customdata=customdata, hovertemplate=hover_nu,
+            ),
+        ]
 
     # Кривая R
-    plotter.fig.add_trace(go.Scatter(
+    traces.append(go.Scatter(
         x=r_values, y=depths, mode="lines", name=plotter.labels["r_label"],
         line=dict(color=plotter.colors["R"], width=LINE_WIDTH_BOLD),
         customdata=customdata, hovertemplate=hover_r,
-    ), row=1, col=2)
+    ))
+    cols = [1] * (len(traces) - 1) + [2]
+    plotter.fig.add_traces(traces, rows=[1] * len(traces), cols=cols)
 
     plotter._update_axes()
 
@@ -79,12 +86,14 @@ def _add_force_line(plotter, F_MN: float, color: str, name: str, y_offset: float
 
 
 def _add_pressure_line(plotter, p_surface: float, color: str, name: str, y_offset: float,
-                       b: float = None, l: float = None, depths: np.ndarray = None):
-    """Добавить линию давления на правый график (вертикальную или Буссинеска)."""
-    use_boussinesq = b is not None and l is not None and b > 0 and l > 0
-
-    if use_boussinesq and depths is not None:
-        p_values = [additional_stress_boussinesq(p_surface, b, l, d) for d in depths]
+                       depths: np.ndarray = None, influence: np.ndarray = None):
+    """Добавить линию давления на правый график (вертикальную или Буссинеска).
+
+    influence — множитель формулы 6.14 на сетке depths; если задан, строится
+    эпюра σ_zp(d), иначе вертикальная линия p.
+    """
+    if influence is not None:
+        p_values = boussinesq_stress_batch(p_surface, depths, influence)
         plotter.fig.add_trace(go.Scatter(
             x=p_values, y=depths, mode="lines", name=name,
             line=dict(color=color, width=LINE_WIDTH_THIN),
@@ -109,14 +118,18 @@ def _add_pressure_line(plotter, p_surface: float, color: str, name: str, y_offse
 def add_load_lines(plotter, F_op: float, F_pre: float | None, area: float, b: float = None, l: float = None):
     """Добавление линий нагрузок с учётом распределения давления по Буссинеску."""
     use_boussinesq = b is not None and l is not None and b > 0 and l > 0
-    depths = np.linspace(0, plotter.max_depth, 100) if use_boussinesq else None
+    depths = influence = None
+    if use_boussinesq:
+        # Множитель Буссинеска не зависит от давления — один на обе линии
+        depths = np.linspace(0, plotter.max_depth, 100)
+        influence = boussinesq_influence_batch(b, l, depths)
 
     # Эксплуатационная нагрузка
     _add_force_line(plotter, F_op / 1000, plotter.colors["F_operation"], "<i>F</i><sub>экспл</sub>", 0.95)
     _add_pressure_line(
         plotter, F_op / area, plotter.colors["p_operation"],
         "<i>σ<sub>zp</sub></i><sub>экспл</sub>" if use_boussinesq else "<i>p</i><sub>экспл</sub>",
-        0.95, b, l, depths
+        0.95, depths, influence
     )
 
     # Преднагрузка
@@ -125,5 +138,5 @@ def add_load_lines(plotter, F_op: float, F_pre: float | None, area: float, b: fl
         _add_pressure_line(
             plotter, F_pre / area, plotter.colors["p_preload"],
             "<i>σ<sub>zp</sub></i><sub>предн</sub>" if use_boussinesq else "<i>p</i><sub>предн</sub>",
-            0.90, b, l, depths
+            0.90, depths, influence
         )
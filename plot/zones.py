@@ -1,5 +1,6 @@
 """Визуализация зон punch-through."""
 
+import numpy as np
 import plotly.graph_objects as go
 
 from core.models import PointResult
@@ -15,49 +16,38 @@ def add_punch_through_zones(plotter, results: list[PointResult], F: float):
         return
 
     F_MN = F / 1000
+    Nu = np.array([r.Nu for r in results])
+    d = np.array([r.d for r in results])
+    safe = Nu >= F
 
-    # Разбиваем на сегменты
-    segments = []
-    current = {"safe": results[0].Nu >= F, "points": [results[0]]}
+    # Сегменты — участки кривой с одинаковым знаком Vl - F
+    cuts = (np.flatnonzero(safe[1:] != safe[:-1]) + 1).tolist()
 
-    for i in range(1, len(results)):
-        is_safe = results[i].Nu >= F
-        if is_safe == current["safe"]:
-            current["points"].append(results[i])
-        else:
-            segments.append(current)
-            current = {"safe": is_safe, "points": [results[i]]}
-    segments.append(current)
+    # Все многоугольники одной категории — в одной трассе: None разрывает
+    # контур, и fill="toself" заливает каждый многоугольник отдельно
+    polygons: dict[bool, tuple[list, list]] = {}
 
-    safe_added = danger_added = False
-
-    for seg in segments:
-        pts = seg["points"]
-        if len(pts) < 2:
+    for start, stop in zip([0, *cuts], [*cuts, len(results)]):
+        if stop - start < 2:
             continue
 
-        x_poly = [r.Nu / 1000 for r in pts] + [F_MN, F_MN]
-        y_poly = [r.d for r in pts] + [pts[-1].d, pts[0].d]
-
-        if seg["safe"]:
-            plotter.fig.add_trace(
-                go.Scatter(
-                    x=x_poly, y=y_poly, fill="toself",
-                    fillcolor=plotter.colors["safe_zone"], line=dict(width=0),
-                    name="Safe zone" if not safe_added else None,
-                    showlegend=not safe_added, hoverinfo="skip",
-                ),
-                row=1, col=1,
-            )
-            safe_added = True
-        else:
-            plotter.fig.add_trace(
-                go.Scatter(
-                    x=x_poly, y=y_poly, fill="toself",
-                    fillcolor=plotter.colors["danger_zone"], line=dict(width=0),
-                    name="Punch-through risk" if not danger_added else None,
-                    showlegend=not danger_added, hoverinfo="skip",
-                ),
-                row=1, col=1,
+        xs, ys = polygons.setdefault(bool(safe[start]), ([], []))
+        if xs:
+            xs.append(None)
+            ys.append(None)
+        xs.extend((Nu[start:stop] / 1000).tolist() + [F_MN, F_MN])
+        ys.extend(d[start:stop].tolist() + [d[stop - 1].item(), d[start].item()])
+
+    traces = []
+    for is_safe, (xs, ys) in polygons.items():
+        traces.append(
+            go.Scatter(
+                x=xs, y=ys, fill="toself",
+                fillcolor=plotter.colors["safe_zone" if is_safe else "danger_zone"], line=dict(width=0),
+                name="Safe zone" if is_safe else "Punch-through risk",
+                showlegend=True, hoverinfo="skip",
             )
-            danger_added = True
+        )
+
+    if traces:
+        plotter.fig.add_traces(traces, rows=1, cols=1)
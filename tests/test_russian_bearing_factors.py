@@ -0,0 +1,13 @@
+import numpy as np
+import pytest
+
+from core.russian.tables import bearing_capacity_factors, bearing_capacity_factors_batch
+
+
+def test_phi_above_45_warning_points_at_caller():
+    with pytest.warns(UserWarning, match="45°") as scalar:
+        bearing_capacity_factors(50.0)
+    with pytest.warns(UserWarning, match="45°") as batch:
+        bearing_capacity_factors_batch(np.array([30.0, 50.0]))
+    assert scalar[0].filename == __file__
+    assert batch[0].filename == __file__
@@ -0,0 +1,24 @@
+import pytest
+
+from core.models import Coefficients, Foundation, SoilLayer
+from core.russian import find_equilibrium_depth, find_equilibrium_depths
+
+
+def _inputs():
+    layers = [
+        SoilLayer(name="ИГЭ-1", thickness=3.0, gamma_prime=8.0, phi=12.0, c=10.0),
+        SoilLayer(name="ИГЭ-2", thickness=10.0, gamma_prime=10.0, phi=32.0, c=2.0),
+    ]
+    return layers, Foundation(area=154.0), Coefficients()
+
+
+@pytest.mark.parametrize("loads", [[20000.0, 40000.0], [40000.0, 20000.0], [1.0e9]])
+def test_find_equilibrium_depths_matches_single_load_search(loads):
+    layers, foundation, coef = _inputs()
+    fused = find_equilibrium_depths(layers, foundation, coef, loads, d_max=15.0)
+    for F, res in zip(loads, fused):
+        single = find_equilibrium_depth(layers, foundation, coef, F, d_max=15.0)
+        assert (res is None) == (single is None)
+        if res is not None:
+            assert res.d == pytest.approx(single.d)
+            assert res.eta1 == pytest.approx(single.eta1)
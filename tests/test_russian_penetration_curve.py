@@ -0,0 +1,61 @@
+import pytest
+
+from core.helpers import build_profile_cache, depth_grid, results_to_arrays
+from core.models import Coefficients, Foundation, SoilLayer
+from core.russian import calculate_point, penetration_curve
+
+
+def _layers():
+    return [
+        SoilLayer(name="ИГЭ-1", thickness=2.5, gamma_prime=8.0, phi=12.0, c=10.0),
+        SoilLayer(name="ИГЭ-2", thickness=4.0, gamma_prime=10.0, phi=32.0, c=2.0, phi_II=30.0),
+        SoilLayer(name="Скала", thickness=3.0, gamma_prime=12.0, phi=40.0, c=0.0, Rc=5.0),
+    ]
+
+
+@pytest.mark.parametrize("area", [50.0, 154.0])
+def test_vectorized_curve_matches_pointwise(area):
+    layers = _layers()
+    foundation = Foundation(area=area, e_x=0.5)
+    coef = Coefficients()
+    cache = build_profile_cache(layers)
+
+    curve = penetration_curve(layers, foundation, coef, 30000.0, d_max=12.0, d_step=0.1)
+    assert len(curve) == 120
+    for point in curve:
+        assert point == calculate_point(layers, foundation, coef, 30000.0, point.d, cache=cache)
+
+
+@pytest.mark.parametrize(("d_max", "d_step", "n"), [(30.0, 0.05, 600), (12.0, 0.1, 120), (20.0, 0.05, 400)])
+def test_depth_grid_keeps_node_count(d_max, d_step, n):
+    assert len(depth_grid(d_max, d_step)) == n
+
+
+def test_depth_grid_node_on_layer_boundary_stays_in_upper_layer():
+    layers = [
+        SoilLayer(name="Песок пылеватый", thickness=4.9, gamma_prime=9.4, phi=15.0, c=2.0),
+        SoilLayer(name="Песок мелкий", thickness=3.3, gamma_prime=10.2, phi=21.0, c=0.0),
+        SoilLayer(name="Скала", thickness=5.0, gamma_prime=12.0, phi=40.0, c=0.0, Rc=5.0),
+    ]
+    depths = depth_grid(12.0, 0.1)
+    assert 8.2 in depths.tolist()
+
+    curve = penetration_curve(layers, Foundation(area=154.0), Coefficients(), 60700.0, d_max=12.0, d_step=0.1)
+    point = next(p for p in curve if p.d == 8.2)
+    assert point.layer_name == "Песок мелкий"
+    assert point == calculate_point(layers, Foundation(area=154.0), Coefficients(), 60700.0, 8.2)
+
+
+@pytest.mark.parametrize(("d_max", "d_step", "last"), [(7.5, 0.04, 7.48), (10.0, 0.3, 9.9), (0.05, 0.1, None)])
+def test_depth_grid_stops_below_non_multiple_d_max(d_max, d_step, last):
+    depths = depth_grid(d_max, d_step)
+    assert depths.size == 0 if last is None else depths[-1] == pytest.approx(last)
+    assert (depths <= d_max).all()
+
+
+def test_results_to_arrays_columns_match_points():
+    curve = penetration_curve(_layers(), Foundation(area=50.0), Coefficients(), 30000.0, d_max=3.0, d_step=0.5)
+    arr = results_to_arrays(curve)
+    for field in ("d", "Nu", "R", "p", "eta1", "eta2", "layer_name"):
+        assert arr[field].tolist() == [getattr(point, field) for point in curve]
+    assert results_to_arrays([])["Nu"].shape == (0,)
@@ -1,6 +1,16 @@
-from core.helpers import additional_stress_boussinesq
+import numpy as np
+import pytest
+
+from core.helpers import additional_stress_boussinesq, additional_stress_boussinesq_batch
 from core.models import Foundation, SoilLayer
-from core.russian.settlement import settlement, vertical_stress
+from core.russian.settlement import (
+    compressible_depth,
+    settlement,
+    vertical_stress,
+    vertical_stress_batch,
+    vertical_stress_pair,
+    vertical_stress_pair_batch,
+)
 from core.russian.tables import stress_coefficient_alpha
 
 
@@ -46,3 +56,58 @@ def test_settlement_toggle_changes_result():
     assert s_alpha > 0
     assert s_bouss > 0
     assert s_alpha != s_bouss
+
+
+def test_boussinesq_batch_matches_scalar():
+    z = np.array([0.0, 0.05, 0.5, 2.0, 7.5, 30.0])
+    expected = [additional_stress_boussinesq(150.0, 8.0, 12.0, zi) for zi in z]
+    got = additional_stress_boussinesq_batch(150.0, 8.0, 12.0, z)
+    assert got == pytest.approx(expected, rel=1e-12)
+
+
+@pytest.mark.parametrize("mode", ["alpha", "boussinesq"])
+def test_vertical_stress_batch_matches_scalar(mode):
+    foundation = Foundation(area=100.0, e_x=0.5, e_y=0.0)
+    z = np.array([0.0, 0.3, 4.0, 12.0, 60.0])
+    expected = [vertical_stress(80.0, foundation, zi, stress_distribution=mode) for zi in z]
+    got = vertical_stress_batch(80.0, foundation, z, stress_distribution=mode)
+    assert got == pytest.approx(expected, rel=1e-12)
+
+
+@pytest.mark.parametrize("mode", ["alpha", "boussinesq"])
+def test_vertical_stress_pair_matches_two_scalar_calls(mode):
+    foundation = Foundation(area=100.0, e_x=0.5, e_y=0.0)
+    z = np.array([0.0, 0.3, 4.0, 12.0, 60.0])
+    expected_p = [vertical_stress(80.0, foundation, zi, stress_distribution=mode) for zi in z]
+    expected_g = [vertical_stress(35.0, foundation, zi, stress_distribution=mode) for zi in z]
+
+    pairs = [vertical_stress_pair(80.0, 35.0, foundation, zi, stress_distribution=mode) for zi in z]
+    assert [pair[0] for pair in pairs] == expected_p
+    assert [pair[1] for pair in pairs] == expected_g
+
+    got_p, got_g = vertical_stress_pair_batch(80.0, 35.0, foundation, z, stress_distribution=mode)
+    assert got_p == pytest.approx(expected_p, rel=1e-12)
+    assert got_g == pytest.approx(expected_g, rel=1e-12)
+
+
+@pytest.mark.parametrize("mode", ["alpha", "boussinesq"])
+def test_settlement_splits_segments_at_layer_boundaries(mode):
+    layers = [
+        SoilLayer(name="Верх", thickness=1.3, gamma_prime=9.0, phi=20.0, c=5.0, E=6.0),
+        SoilLayer(name="Низ", thickness=80.0, gamma_prime=10.0, phi=30.0, c=0.0, E=30.0),
+    ]
+    foundation = Foundation(area=25.0, e_x=0.0, e_y=0.0)  # b=l=5, h_max = 1.0
+    d, p, Hc = 0.5, 150.0, compressible_depth(layers, foundation, 0.5, 150.0, stress_distribution=mode)
+    sigma_zg_0 = 9.0 * d
+
+    # Отрезки: [0, 0.8] до подошвы верхнего слоя, далее по 1.0 м до Hc
+    edges = [0.0, 0.8] + [0.8 + k for k in range(1, int(Hc - 0.8) + 1)]
+    if edges[-1] < Hc:
+        edges.append(Hc)
+    expected = 0.0
+    for z_top, z_bot in zip(edges, edges[1:]):
+        sigma_zp, sigma_zg = vertical_stress_pair(p, sigma_zg_0, foundation, (z_top + z_bot) / 2, mode)
+        E = 6000.0 if z_bot <= 0.8 + 1e-9 else 30000.0
+        expected += max(0.0, sigma_zp - sigma_zg) * (z_bot - z_top) / E
+
+    assert settlement(layers, foundation, d, p, stress_distribution=mode) == pytest.approx(0.8 * expected)
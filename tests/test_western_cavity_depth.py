@@ -0,0 +1,12 @@
+import numpy as np
+import pytest
+
+from core.helpers import cavity_depth_ratio, cavity_depth_ratio_batch
+
+
+@pytest.mark.parametrize("p", [0.0, 2.0, 50.0])
+def test_cavity_depth_ratio_batch_matches_scalar(p):
+    gammas = np.array([-1.0, 0.0, 4.0, 8.0, 10.5])
+    batch = cavity_depth_ratio_batch(25.0, gammas, 10.0, p)
+    expected = [cavity_depth_ratio(25.0, float(g), 10.0, p) for g in gammas]
+    assert batch.tolist() == pytest.approx(expected, rel=1e-12)
@@ -54,6 +54,24 @@ def test_find_equilibrium_depth_none_when_never_safe(monkeypatch):
     assert res is None
 
 
+def test_precomputed_curve_is_reused(monkeypatch):
+    curve = [
+        PointResult(d=0.1 * (i + 1), Nu=1.0, R=1.0, p=1.0, eta1=eta, eta2=0.5, layer_name="x")
+        for i, eta in enumerate([0.9, 1.1, 0.9, 1.2, 0.8])
+    ]
+
+    def _no_curve(*_args, **_kwargs):
+        raise AssertionError("кривая должна браться из аргумента curve")
+
+    monkeypatch.setattr(penetration, "penetration_curve", _no_curve)
+
+    layers, foundation, coef = _dummy_inputs()
+    res = penetration.find_equilibrium_depth(layers, foundation, coef, F=1.0, curve=curve)
+    assert res is not None
+    assert res.d == pytest.approx(0.5)
+    assert penetration.has_punch_through_risk(layers, foundation, coef, F=1.0, curve=curve)
+
+
 def test_c217_c218_backflow_method_basic():
     layers = [
         SoilLayer(name="sand", thickness=10.0, gamma_prime=10.0, phi=30.0, c=0.0, drainage="drained"),
@@ -0,0 +1,25 @@
+import pydantic
+import pytest
+
+from core.models import Coefficients, Foundation, SoilLayer
+from core.western import penetration
+
+
+def _negative_vl_inputs():
+    # Глина без cu и c: Qv ≈ 0, и с обратной засыпкой Vl = Qv − Wbf + Bs < 0
+    layers = [SoilLayer(name="Глина", thickness=10.0, gamma_prime=9.0, phi=20.0, c=0.0, soil_type="clay_soft")]
+    foundation = Foundation(area=87.7, V_D=300.0)
+    coef = Coefficients(use_backfill=True)
+    return layers, foundation, coef
+
+
+def test_negative_vl_point_is_rejected():
+    layers, foundation, coef = _negative_vl_inputs()
+    with pytest.raises(pydantic.ValidationError):
+        penetration.calculate_point(layers, foundation, coef, 20000.0, 0.1)
+
+
+def test_negative_vl_curve_is_rejected():
+    layers, foundation, coef = _negative_vl_inputs()
+    with pytest.raises(pydantic.ValidationError):
+        penetration.penetration_curve(layers, foundation, coef, 20000.0, d_max=2.0, d_step=0.1)
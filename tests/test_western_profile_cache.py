@@ -1,9 +1,19 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import numpy as np
 import pytest
 
 from core.helpers import (
     average_cu_below,
+    average_gamma_above,
+    average_gamma_above_batch,
     average_sand_props_below,
     build_profile_cache,
+    get_drainage,
+    get_layer_at_depth,
+    is_dual_drainage,
     overburden_stress,
 )
 from core.models import SoilLayer
@@ -25,6 +35,16 @@ def test_overburden_stress_cache_matches_uncached(depth):
     )
 
 
+@pytest.mark.parametrize("depth", [-1.0, 0.0, 1.0, 2.0, 4.0, 7.5])
+def test_average_gamma_above_cache_matches_layer_walk(depth):
+    layers = _layers()
+    cache = build_profile_cache(layers)
+    expected = average_gamma_above(layers, depth)
+    assert average_gamma_above(layers, depth, cache=cache) == pytest.approx(expected, rel=1e-12)
+    batch = average_gamma_above_batch(layers, np.array([depth]), cache=cache)
+    assert batch[0] == pytest.approx(expected, rel=1e-12)
+
+
 @pytest.mark.parametrize("d,z", [(0.0, 1.0), (1.0, 2.0), (2.0, 2.0), (4.0, 2.0)])
 def test_average_cu_below_cache_matches_uncached(d, z):
     layers = _layers()
@@ -42,3 +62,92 @@ def test_average_sand_props_cache_matches_uncached(d, z):
     phi_cached, gamma_cached = average_sand_props_below(layers, d, z, cache=cache)
     assert phi_ref == pytest.approx(phi_cached)
     assert gamma_ref == pytest.approx(gamma_cached)
+
+
+def test_average_props_below_crosses_boundary_and_extrapolates():
+    layers = _layers()
+    cache = build_profile_cache(layers)
+    # 1 м первого слоя + 1 м второго
+    assert cache.average_gamma_below(1.0, 2.0) == pytest.approx(11.0)
+    # 1 м второго слоя + 2 м экстраполяции последним слоем
+    gamma, phi, c = cache.average_props_below(4.0, 3.0)
+    assert (gamma, phi, c) == pytest.approx((12.0, 35.0, 0.0))
+
+
+def test_average_below_is_memoized_per_cache():
+    cache = build_profile_cache(_layers())
+    first = cache.average_cu_below(1.0, 2.0)
+    assert ("cu", 1.0, 2.0) in cache._averages
+    assert cache.average_cu_below(1.0, 2.0) == first
+
+
+@pytest.mark.parametrize("depth", [-0.5, 0.0, 1.0, 2.0, 3.5, 5.0, 7.0])
+def test_layer_at_matches_linear_scan(depth):
+    layers = _layers()
+    cache = build_profile_cache(layers)
+    assert get_layer_at_depth(layers, depth, cache=cache) is get_layer_at_depth(layers, depth)
+
+
+def test_average_props_below_batch_matches_scalar():
+    layers = _layers()
+    depths = np.array([0.0, 0.5, 1.9, 2.0, 3.3, 4.9, 6.0])
+    batch = build_profile_cache(layers).average_props_below_batch(depths, 1.5)
+    scalar_cache = build_profile_cache(layers)
+    for i, d in enumerate(depths):
+        expected = scalar_cache.average_props_below(float(d), 1.5)
+        assert tuple(arr[i] for arr in batch) == pytest.approx(expected)
+
+
+def test_layer_indices_match_scalar_layer_index():
+    cache = build_profile_cache(_layers())
+    depths = np.array([-0.5, 0.0, 1.0, 2.0, 3.5, 5.0, 7.0])
+    expected = [cache._layer_index(float(d)) for d in depths]
+    assert cache._layer_indices(depths).tolist() == expected
+
+
+def test_overburden_batch_fills_scalar_memo():
+    cache = build_profile_cache(_layers())
+    depths = np.array([-1.0, 0.0, 1.5, 2.0, 6.5])
+    batch = cache.overburden_stress_batch(depths)
+    assert set(cache._overburden) == set(depths.tolist())
+    assert [cache.overburden_stress(float(d)) for d in depths] == batch.tolist()
+    assert batch.tolist() == [build_profile_cache(_layers()).overburden_stress(float(d)) for d in depths]
+
+
+def test_memos_are_bounded_across_many_depth_grids():
+    cache = build_profile_cache(_layers())
+    maxsize = cache._overburden.maxsize
+    for shift in range(5):
+        depths = np.linspace(0.0, 10.0, maxsize) + shift * 1e-3
+        cache.overburden_stress_batch(depths)
+        cache.average_below_batch("cu", depths, 2.0, 0.0)
+    assert len(cache._overburden) == maxsize
+    assert len(cache._averages) == cache._averages.maxsize
+    # Последняя сетка осталась в мемо целиком
+    assert set(cache._overburden) == set(depths.tolist())
+
+
+def test_drainage_tags_match_per_layer_classification():
+    layers = _layers() + [
+        SoilLayer(name="silt", thickness=1.0, gamma_prime=9.0, phi=25.0, c=0.0, cu=15.0, soil_type="Silt"),
+        SoilLayer(name="sand", thickness=2.0, gamma_prime=10.0, phi=33.0, c=0.0, soil_type="sand"),
+    ]
+    drainage, is_dual = build_profile_cache(layers).drainage
+    assert drainage == tuple(get_drainage(layer) for layer in layers)
+    assert is_dual == tuple(is_dual_drainage(layer) for layer in layers)
+
+
+def test_cu_or_c_falls_back_on_zero_while_cache_column_keeps_it():
+    layer = SoilLayer(name="clay", thickness=2.0, gamma_prime=8.0, phi=0.0, c=12.0, cu=0.0)
+    assert layer.cu_or_c == 12.0
+    assert layer.cu_or_c_if_unset == 0.0
+    assert build_profile_cache([layer]).cu == [0.0]
+    assert SoilLayer(name="clay", thickness=2.0, gamma_prime=8.0, phi=0.0, c=12.0).cu_or_c_if_unset == 12.0
+
+
+def test_importing_models_does_not_load_kernels():
+    code = "import sys, core.models, core.calculator; print('core.kernels' in sys.modules, 'numba' in sys.modules)"
+    out = subprocess.run(
+        [sys.executable, "-c", code], cwd=Path(__file__).resolve().parents[1], capture_output=True, text=True, check=True
+    ).stdout
+    assert out.split() == ["False", "False"]
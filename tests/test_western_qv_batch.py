@@ -0,0 +1,94 @@
+import random
+
+import numpy as np
+import pytest
+
+from core.helpers import build_profile_cache, depth_grid
+from core.models import Foundation, SoilLayer
+from core.western import bearing_capacity_Qv, bearing_capacity_Qv_batch, bearing_capacity_Vl, bearing_capacity_Vl_batch
+from core.western.tables import clay_factor_iso_table_23_1, clay_factor_iso_table_23_1_batch
+
+
+def _layers():
+    return [
+        SoilLayer(name="Глина", thickness=12.0, gamma_prime=8.0, phi=0.0, c=0.0, cu=25.0, soil_type="clay"),
+        SoilLayer(name="Алеврит", thickness=6.0, gamma_prime=9.0, phi=26.0, c=0.0, cu=40.0, soil_type="silt"),
+        SoilLayer(name="Песок", thickness=30.0, gamma_prime=10.0, phi=33.0, c=0.0, soil_type="sand"),
+    ]
+
+
+def _punch_through_layers():
+    return [
+        SoilLayer(name="Песок", thickness=4.0, gamma_prime=9.5, phi=32.0, c=0.0, soil_type="sand"),
+        SoilLayer(name="Глина мягкая", thickness=5.0, gamma_prime=7.0, phi=0.0, c=0.0, cu=20.0, soil_type="clay"),
+        SoilLayer(name="Глина", thickness=3.0, gamma_prime=8.0, phi=0.0, c=0.0, cu=15.0, soil_type="clay"),
+        SoilLayer(name="Глина тугая", thickness=20.0, gamma_prime=9.0, phi=0.0, c=0.0, cu=90.0, soil_type="clay"),
+    ]
+
+
+def _random_layers(seed):
+    rng = random.Random(seed)
+    soil_types = ["clay", "clay_soft", "sand", "sand_fine", "silt", "silty_clay"]
+    return [
+        SoilLayer(
+            name=f"ИГЭ-{i + 1}",
+            thickness=rng.uniform(0.5, 8.0),
+            gamma_prime=rng.uniform(5.0, 11.0),
+            phi=rng.choice([0.0, rng.uniform(5.0, 38.0)]),
+            c=rng.choice([0.0, rng.uniform(0.0, 20.0)]),
+            cu=rng.choice([None, rng.uniform(2.0, 80.0)]),
+            soil_type=rng.choice(soil_types),
+        )
+        for i in range(rng.randint(1, 5))
+    ]
+
+
+def test_clay_factor_table_batch_matches_scalar():
+    x = np.array([-1.0, 0.0, 0.05, 0.1, 0.3, 1.0, 1.7, 2.5, 4.0, np.inf])
+    expected = [clay_factor_iso_table_23_1(float(v)) for v in x]
+    assert clay_factor_iso_table_23_1_batch(x).tolist() == expected
+
+
+@pytest.mark.parametrize("make_layers", [_layers, _punch_through_layers])
+@pytest.mark.parametrize("use_backfill", [False, True])
+def test_qv_batch_matches_pointwise(make_layers, use_backfill):
+    layers = make_layers()
+    foundation = Foundation(area=60.0, e_x=0.0, e_y=0.0)
+    depths = depth_grid(40.0, 0.2)
+    cache = build_profile_cache(layers)
+
+    expected = [bearing_capacity_Qv(layers, foundation, float(d), use_backfill, cache=cache) for d in depths]
+    got = bearing_capacity_Qv_batch(layers, foundation, depths, use_backfill, cache=build_profile_cache(layers))
+    assert got == pytest.approx(expected, rel=1e-12)
+
+
+@pytest.mark.parametrize("use_backfill", [False, True])
+def test_vl_batch_matches_pointwise(use_backfill):
+    layers = _layers()
+    foundation = Foundation(area=60.0, e_x=0.0, e_y=0.0, D_eff=9.0, beta=120.0, V_spud=400.0)
+    depths = depth_grid(30.0, 0.5)
+    cache = build_profile_cache(layers)
+
+    expected = [
+        bearing_capacity_Vl(layers, foundation, float(d), 40000.0, use_backfill, cache=cache) for d in depths
+    ]
+    got = bearing_capacity_Vl_batch(layers, foundation, depths, 40000.0, use_backfill)
+    assert got == pytest.approx(expected, rel=1e-12)
+
+
+@pytest.mark.parametrize("seed", range(40))
+def test_qv_and_vl_batch_match_pointwise_on_random_profiles(seed):
+    layers = _random_layers(seed)
+    foundation = Foundation(area=random.Random(seed).uniform(20.0, 200.0), V_spud=300.0, V_D=150.0)
+    depths = depth_grid(25.0, 0.25)
+    use_backfill = seed % 2 == 1
+    cache = build_profile_cache(layers)
+
+    expected_qv = [bearing_capacity_Qv(layers, foundation, float(d), use_backfill, cache=cache) for d in depths]
+    expected_vl = [
+        bearing_capacity_Vl(layers, foundation, float(d), 20000.0, use_backfill, cache=cache) for d in depths
+    ]
+    assert bearing_capacity_Qv_batch(layers, foundation, depths, use_backfill) == pytest.approx(expected_qv, rel=1e-12)
+    assert bearing_capacity_Vl_batch(layers, foundation, depths, 20000.0, use_backfill) == pytest.approx(
+        expected_vl, rel=1e-12
+    )
@@ -1,6 +1,5 @@
 """Вспомогательные функции для UI."""
 
-import io
 import tomllib
 import tomli_w
 
@@ -54,7 +53,7 @@ def export_toml(state) -> str:
 
 def import_toml(content: bytes) -> dict:
     """Импортировать TOML в формат state."""
-    data = tomllib.load(io.BytesIO(content))
+    data = tomllib.loads(content.decode("utf-8"))
 
     # Обработка слоёв: добавляем отсутствующие поля как None
     optional_keys = ["E", "cu", "drainage", "phi_II", "c_II", "gamma_prime_II"]